@@ -18,7 +18,7 @@ from app.schemas.food import (
     FoodFavoriteCreate,
     FoodFavoriteResponse,
 )
-from app.services.food_service import FoodSearchService
+from app.services.food_service import FoodSearchService, invalidate_favorites
 from app.core.supabase import get_supabase_client
 import logging
 
@@ -306,6 +306,7 @@ async def add_to_favorites(
         }
 
         response = supabase.table("food_favorites").insert(favorite_data).execute()
+        invalidate_favorites(user_id)
 
         return {
             "success": True,
@@ -338,6 +339,7 @@ async def remove_from_favorites(
         supabase.table("food_favorites").delete().eq("id", favorite_id).eq(
             "user_id", user_id
         ).execute()
+        invalidate_favorites(user_id)
 
         return None
 
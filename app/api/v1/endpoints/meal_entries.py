@@ -214,25 +214,19 @@ async def create_meal_entries_batch(
     **Features:**
     - All entries get the same date, time, and meal_type
     - Each food's nutrition is calculated individually
+    - Foods are fetched and entries inserted in one request each
     - Returns array of created entries
     - Limit: 1-50 foods per batch
     """
     try:
-        results = []
-        for item in batch.entries:
-            result = await service.create_meal_entry_from_food(
-                user_id=user_id,
-                food_id=item.food_id,
-                user_food_id=item.user_food_id,
-                quantity_g=item.quantity_g,
-                meal_date=batch.meal_date,
-                meal_time=batch.meal_time,
-                meal_type=batch.meal_type,
-                logged_via=item.logged_via,
-                original_input=batch.original_input
-            )
-            results.append(result)
-        return results
+        return await service.create_meal_entries_bulk(
+            user_id=user_id,
+            items=[item.model_dump() for item in batch.entries],
+            meal_date=batch.meal_date,
+            meal_time=batch.meal_time,
+            meal_type=batch.meal_type,
+            original_input=batch.original_input
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -14,16 +14,27 @@ CRITICAL VALIDATIONS (per CLAUDE.md):
 """
 
 import asyncio
+import copy
+import hashlib
 import logging
 import json
+from dataclasses import asdict
 from typing import Dict, List, Optional, Any
 from anthropic import AsyncAnthropic
 from app.core.config import settings
 from app.core.supabase import get_supabase_client
-from app.validators.nutrition_validator import get_nutrition_validator
+from app.validators.nutrition_validator import ValidatedFood, get_nutrition_validator
 
 logger = logging.getLogger(__name__)
 
+# Hard cap on user input sent to Claude; longer descriptions are truncated
+# so outlier requests can't dominate token usage and latency
+MAX_INPUT_CHARS = 2000
+
+
+class _ExtractionAbandoned(Exception):
+    """Set on an in-flight extraction whose leading request was cancelled."""
+
 
 class ClaudeService:
     """
@@ -46,6 +57,7 @@ class ClaudeService:
         self.max_tokens = settings.CLAUDE_MAX_TOKENS or 2000
         self.temperature = settings.CLAUDE_TEMPERATURE or 0.3  # Lower for consistency
         self.supabase = get_supabase_client()
+        self._inflight: Dict[str, asyncio.Future] = {}
 
         logger.info(f"ClaudeService initialized with model: {self.model}")
 
@@ -66,15 +78,16 @@ class ClaudeService:
                 .select('prompt_instructions') \
                 .eq('code', personality_code) \
                 .eq('is_active', True) \
-                .single() \
+                .limit(1) \
+                .maybe_single() \
                 .execute()
 
-            if response.data:
-                logger.info(f"Loaded personality '{personality_code}' from database")
+            if response and response.data:
+                logger.info("Loaded personality '%s' from database", personality_code)
                 return response.data['prompt_instructions']
 
         except Exception as e:
-            logger.warning(f"Failed to load personality '{personality_code}' from DB: {e}")
+            logger.warning("Failed to load personality '%s' from DB: %s", personality_code, e)
 
         # Fallback to friendly
         try:
@@ -82,15 +95,16 @@ class ClaudeService:
                 .select('prompt_instructions') \
                 .eq('code', 'friendly') \
                 .eq('is_active', True) \
-                .single() \
+                .limit(1) \
+                .maybe_single() \
                 .execute()
 
-            if response.data:
+            if response and response.data:
                 logger.info("Using fallback personality 'friendly'")
                 return response.data['prompt_instructions']
 
         except Exception as e:
-            logger.error(f"Failed to load fallback personality: {e}")
+            logger.error("Failed to load fallback personality: %s", e)
 
         # Final hardcoded fallback
         return "You are a warm, supportive nutrition coach. Be encouraging and understanding."
@@ -125,13 +139,64 @@ class ClaudeService:
         if not text or not text.strip():
             raise ValueError("Food description text cannot be empty")
 
+        if len(text) > MAX_INPUT_CHARS:
+            logger.warning("Truncated oversized input: %d chars", len(text))
+            text = text[:MAX_INPUT_CHARS]
+
+        # Coalesce identical in-flight extractions (single-flight): concurrent
+        # callers with the same input await the first caller's result. If
+        # that caller is cancelled, a waiter runs the extraction itself.
+        key = self._extraction_key(text, personality)
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            logger.info("Awaiting in-flight extraction for identical input")
+            try:
+                result = await asyncio.shield(inflight)
+            except _ExtractionAbandoned:
+                continue
+            # Each caller gets its own copy of the shared result
+            return copy.deepcopy(result)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._extract_food(text, personality, max_retries)
+        except asyncio.CancelledError:
+            # Waiters weren't cancelled; make them retry instead
+            future.set_exception(_ExtractionAbandoned())
+            future.exception()  # Mark retrieved in case nobody is waiting
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; waiters (if any) still receive it
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    @staticmethod
+    def _extraction_key(text: str, personality: str) -> str:
+        """Build the single-flight key for an extraction request."""
+        return hashlib.sha256(f"{personality}:{text.strip()}".encode("utf-8")).hexdigest()
+
+    async def _extract_food(
+        self,
+        text: str,
+        personality: str,
+        max_retries: int
+    ) -> Dict[str, Any]:
+        """Run the prompt build + Claude call with retries for one extraction."""
         # Build optimized prompt for food extraction with personality
         prompt = await self._build_food_extraction_prompt(text, personality)
 
         # Call Claude with retry logic
         for attempt in range(max_retries):
             try:
-                logger.info(f"Calling Claude API (attempt {attempt + 1}/{max_retries})")
+                logger.info("Calling Claude API (attempt %d/%d)", attempt + 1, max_retries)
 
                 response = await self.client.messages.create(
                     model=self.model,
@@ -148,7 +213,7 @@ class ClaudeService:
                     raise ValueError("Empty response from Claude")
 
                 raw_text = response.content[0].text
-                logger.debug(f"Claude raw response: {raw_text}")
+                logger.debug("Claude raw response: %s", raw_text)
 
                 # Parse JSON response
                 parsed_data = self._parse_claude_response(raw_text)
@@ -156,14 +221,14 @@ class ClaudeService:
                 # CRITICAL: Validate nutrition data with enhanced validator (US-036)
                 validated_data = self._validate_nutrition_data_v2(parsed_data)
 
-                logger.info(f"Successfully extracted {len(validated_data['foods'])} food items")
+                logger.info("Successfully extracted %d food items", len(validated_data['foods']))
                 return validated_data
 
             except TimeoutError:
-                logger.error(f"Claude API timeout on attempt {attempt + 1}")
+                logger.error("Claude API timeout on attempt %d", attempt + 1)
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    logger.info(f"Retrying in {wait_time} seconds...")
+                    logger.info("Retrying in %d seconds...", wait_time)
                     await asyncio.sleep(wait_time)
                 else:
                     return {
@@ -174,7 +239,7 @@ class ClaudeService:
                     }
 
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse Claude response as JSON: {e}")
+                logger.error("Failed to parse Claude response as JSON: %s", e)
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2 ** attempt)
                 else:
@@ -186,7 +251,7 @@ class ClaudeService:
                     }
 
             except Exception as e:
-                logger.error(f"Unexpected error calling Claude: {e}")
+                logger.error("Unexpected error calling Claude: %s", e)
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2 ** attempt)
                 else:
@@ -332,7 +397,7 @@ Now extract from: "{text}"
         if "foods" not in data or not isinstance(data["foods"], list):
             raise ValueError("Invalid data structure: 'foods' array required")
 
-        validated_foods = []
+        validated_foods: List[ValidatedFood] = []
         total_calories = 0
         total_protein = 0
         total_carbs = 0
@@ -341,7 +406,7 @@ Now extract from: "{text}"
         for food in data["foods"]:
             # Ensure all required fields exist
             if not all(k in food for k in ["name", "quantity", "calories", "protein_g", "carbs_g", "fat_g"]):
-                logger.warning(f"Skipping incomplete food item: {food.get('name', 'unknown')}")
+                logger.warning("Skipping incomplete food item: %s", food.get('name', 'unknown'))
                 continue
 
             # CRITICAL: Clamp all nutrition values to >= 0
@@ -353,7 +418,7 @@ Now extract from: "{text}"
 
             # Skip if quantity is 0
             if quantity == 0:
-                logger.warning(f"Skipping food with 0 quantity: {food['name']}")
+                logger.warning("Skipping food with 0 quantity: %s", food['name'])
                 continue
 
             # Validate calorie calculation (±5% tolerance)
@@ -362,21 +427,21 @@ Now extract from: "{text}"
 
             if abs(calories - calculated_calories) > tolerance:
                 logger.warning(
-                    f"Calorie mismatch for {food['name']}: "
-                    f"stated={calories}, calculated={calculated_calories}. "
-                    f"Using calculated value."
+                    "Calorie mismatch for %s: stated=%s, calculated=%s. "
+                    "Using calculated value.",
+                    food['name'], calories, calculated_calories
                 )
                 calories = round(calculated_calories, 2)
 
-            validated_food = {
-                "name": str(food["name"]).strip(),
-                "quantity": round(quantity, 2),
-                "unit": str(food.get("unit", "g")),
-                "calories": round(calories, 2),
-                "protein_g": round(protein_g, 2),
-                "carbs_g": round(carbs_g, 2),
-                "fat_g": round(fat_g, 2)
-            }
+            validated_food = ValidatedFood(
+                name=str(food["name"]).strip(),
+                quantity=round(quantity, 2),
+                unit=str(food.get("unit", "g")),
+                calories=round(calories, 2),
+                protein_g=round(protein_g, 2),
+                carbs_g=round(carbs_g, 2),
+                fat_g=round(fat_g, 2)
+            )
 
             validated_foods.append(validated_food)
 
@@ -387,7 +452,8 @@ Now extract from: "{text}"
             total_fat += fat_g
 
         return {
-            "foods": validated_foods,
+            # Serialize to plain dicts only at the API boundary
+            "foods": [asdict(f) for f in validated_foods],
             "total_calories": round(total_calories, 2),
             "total_macros": {
                 "protein": round(total_protein, 2),
@@ -425,22 +491,22 @@ Now extract from: "{text}"
             # Log validation issues
             if result.warnings:
                 for warning in result.warnings:
-                    logger.warning(f"Nutrition validation warning: {warning}")
+                    logger.warning("Nutrition validation warning: %s", warning)
 
             if not result.is_valid:
                 error_msg = "; ".join(result.errors)
-                logger.error(f"Nutrition validation failed: {error_msg}")
+                logger.error("Nutrition validation failed: %s", error_msg)
                 raise ValueError(f"Invalid nutrition data: {error_msg}")
 
             # Log validation summary
             summary = validator.get_validation_summary()
             if summary["warning_count"] > 0:
-                logger.info(f"Validation completed with {summary['warning_count']} warnings")
+                logger.info("Validation completed with %d warnings", summary['warning_count'])
 
             return result.corrected_data
 
         except Exception as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             # Fallback to old validation method if new validator fails
             logger.warning("Falling back to legacy validation method")
             return self._validate_nutrition_data(data)
@@ -10,11 +10,15 @@ This service provides:
 - Multi-day comparisons
 """
 
-from datetime import date, datetime, timedelta, time as time_type
+import asyncio
+import time
+from collections import defaultdict
+from datetime import date, datetime, time as time_type
 from decimal import Decimal
-from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
+from math import sqrt
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from uuid import UUID
-import statistics
 
 from supabase import Client
 
@@ -39,6 +43,9 @@ from app.schemas.daily_summary import (
 # Status thresholds
 STATUS_UNDER_THRESHOLD = 0.80  # Below 80% is "under"
 STATUS_OVER_THRESHOLD = 1.15   # Above 115% is "over"
+_STATUS_UNDER_PERCENT = STATUS_UNDER_THRESHOLD * 100
+_STATUS_OVER_PERCENT = STATUS_OVER_THRESHOLD * 100
+_STATUSES = ("under", "on_track", "over")
 
 # Projection confidence factors
 HIGH_CONFIDENCE_THRESHOLD = 0.85
@@ -50,6 +57,122 @@ TREND_THRESHOLD = 0.05  # 5% change to be considered increasing/decreasing
 # Eating window
 INTERMITTENT_FASTING_HOURS = 16.0
 
+# Meal types as bit flags, in display order (logged state fits in 4 bits)
+_MEAL_TYPE_BITS = {"breakfast": 1, "lunch": 2, "dinner": 4, "snack": 8}
+_ALL_MEAL_TYPES_MASK = 0b1111
+
+# meal_entries columns read by the summaries (avoid select("*") payloads)
+_RANGE_ENTRY_COLUMNS = "date, calories, protein_g, carbs_g, fat_g"
+
+# User goals cache (process-local, per user_id)
+GOALS_CACHE_TTL_SECONDS = 60
+GOALS_CACHE_MAX_SIZE = 10_000
+
+_goals_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+# Daily summary cache (process-local, per user_id and date). Invalidation
+# only reaches this process, so the TTL bounds staleness across workers.
+# Summaries with an end-of-day projection depend on the clock and are
+# never cached. Summaries embed goal progress and no write path in this
+# backend invalidates goals, so they can't outlive the goals TTL.
+SUMMARY_CACHE_TTL_SECONDS = GOALS_CACHE_TTL_SECONDS
+SUMMARY_CACHE_MAX_SIZE = 10_000
+
+_summary_cache: Dict[Tuple[str, date], Tuple[float, DailySummaryResponse]] = {}
+
+
+def invalidate_goals(user_id: UUID) -> None:
+    """
+    Drop cached nutrition goals for a user (call after profile updates).
+
+    Profiles are not written through this backend yet, so nothing calls
+    this today; the summary TTL is capped at GOALS_CACHE_TTL_SECONDS instead.
+    """
+    _goals_cache.pop(str(user_id), None)
+    # Cached summaries embed goal progress
+    invalidate_daily_summary(user_id)
+
+
+def invalidate_daily_summary(user_id: UUID, target_date: Optional[date] = None) -> None:
+    """
+    Drop cached daily summaries for a user (call after meal entry writes).
+
+    Only target_date is dropped when given, otherwise every cached date.
+    """
+    user_key = str(user_id)
+    stale = [
+        key for key in _summary_cache
+        if key[0] == user_key and (target_date is None or key[1] == target_date)
+    ]
+    for key in stale:
+        del _summary_cache[key]
+
+
+def _progress_status(percent: float) -> str:
+    """Classify goal progress as under / on_track / over via a table lookup."""
+    return _STATUSES[(percent >= _STATUS_UNDER_PERCENT) + (percent > _STATUS_OVER_PERCENT)]
+
+
+def _grams_to_decimal(value: float) -> Decimal:
+    """
+    Convert a float gram total to the 1-decimal Decimal the schemas expect.
+
+    Entries store grams with 2 decimals, so formatting to 2 places first
+    recovers the exact sum before rounding.
+    """
+    return round(Decimal(f"{value:.2f}"), 1)
+
+
+def _parse_hms(value: str) -> time_type:
+    """Parse an "HH:MM:SS" time string by slicing instead of strptime."""
+    return time_type(int(value[0:2]), int(value[3:5]), int(value[6:8]))
+
+
+def _macro_percents(
+    calories: int,
+    protein: float,
+    carbs: float,
+    fat: float
+) -> Tuple[float, float, float]:
+    """Share of calories from protein, carbs and fat (percent, 1 decimal)."""
+    if calories <= 0:
+        return 0.0, 0.0, 0.0
+    return (
+        round((protein * 4 / calories) * 100, 1),
+        round((carbs * 4 / calories) * 100, 1),
+        round((fat * 9 / calories) * 100, 1)
+    )
+
+
+def _consistency_score(variance: float) -> float:
+    """
+    Consistency score (0-1) from the coefficient of variation.
+
+    0% variance is perfect consistency (1.0), 20% is moderate (0.5) and
+    40%+ is low (0.0), linearly interpolated in between.
+    """
+    if variance <= 0:
+        return 1.0
+    if variance >= 40:
+        return 0.0
+    return 1.0 - (variance / 40)
+
+
+@lru_cache(maxsize=1024)
+def _should_project_cached(target_date: date, today: date, hour: int) -> bool:
+    """
+    Decide whether an end-of-day projection applies.
+
+    The answer depends only on the day and the current hour, so the key
+    needs no finer time bucket to stay correct.
+    """
+    if target_date != today:
+        return False  # Past days don't need projection, future days can't have one
+
+    # Before 11 PM (reasonable cutoff); later the day is essentially done
+    return hour < 23
+
 
 class DailySummaryService:
     """Service for daily nutrition summary calculations."""
@@ -72,6 +195,11 @@ class DailySummaryService:
         """
         Get complete daily nutrition summary with all metrics.
 
+        Summaries without a projection are cached per process and dropped on
+        meal entry writes. In multi-worker deployments other workers keep
+        serving their cached copy until SUMMARY_CACHE_TTL_SECONDS expires.
+        Callers get their own copy and may modify it.
+
         Args:
             user_id: User ID
             target_date: Date to get summary for
@@ -80,17 +208,27 @@ class DailySummaryService:
         Returns:
             Complete daily summary with totals, breakdowns, and progress
         """
-        # Get all meal entries for the day
-        entries = await self._get_meal_entries_for_date(user_id, target_date)
-
-        # Calculate daily totals
-        totals = self._calculate_daily_totals(target_date, entries)
+        # Summaries without a projection only change on meal/goal writes
+        wants_projection = include_projection and self._should_project(target_date)
+        cache_key = (str(user_id), target_date)
+        if not wants_projection:
+            cached = _summary_cache.get(cache_key)
+            if cached is not None:
+                expires_at, summary = cached
+                if expires_at > time.monotonic():
+                    return summary.model_copy(deep=True)
+                del _summary_cache[cache_key]
+
+        # Get nutrition totals and meal time bounds per meal type (aggregated
+        # in the database) and the user's goals concurrently
+        meal_type_totals, user_goals = await asyncio.gather(
+            self._get_meal_type_totals_for_date(user_id, target_date),
+            self._get_user_goals(user_id)
+        )
 
-        # Calculate breakdown by meal type
-        by_meal_type = self._calculate_meal_type_breakdown(entries, totals.total_calories)
+        # Calculate daily totals and breakdown by meal type
+        totals, by_meal_type = self._calculate_totals_and_breakdown(target_date, meal_type_totals)
 
-        # Get user goals
-        user_goals = await self._get_user_goals(user_id)
         has_goals = user_goals is not None
 
         # Calculate progress metrics if goals exist
@@ -123,20 +261,22 @@ class DailySummaryService:
             )
 
         # Calculate eating window
-        eating_window = self._calculate_eating_window(entries)
+        eating_window = self._calculate_eating_window_from_bounds(
+            min((row["first_meal"] for row in meal_type_totals), default=None),
+            max((row["last_meal"] for row in meal_type_totals), default=None)
+        )
 
         # Calculate projection if requested and not end of day
         projection = None
-        if include_projection and self._should_project(target_date):
-            projection = await self._calculate_projection(
-                user_id,
+        if wants_projection:
+            projection = self._calculate_projection(
                 target_date,
                 totals.total_calories,
                 user_goals["daily_calories"] if has_goals else 2000,
                 by_meal_type
             )
 
-        return DailySummaryResponse(
+        summary = DailySummaryResponse(
             date=target_date,
             totals=totals,
             by_meal_type=by_meal_type,
@@ -150,6 +290,17 @@ class DailySummaryService:
             has_goals=has_goals
         )
 
+        if not wants_projection:
+            if len(_summary_cache) >= SUMMARY_CACHE_MAX_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _summary_cache[next(iter(_summary_cache))]
+            _summary_cache[cache_key] = (
+                time.monotonic() + SUMMARY_CACHE_TTL_SECONDS,
+                summary.model_copy(deep=True)
+            )
+
+        return summary
+
     async def get_weekly_trends(
         self,
         user_id: UUID,
@@ -167,52 +318,61 @@ class DailySummaryService:
         Returns:
             Weekly trends with averages and daily data
         """
-        # Get data for each day in range
-        daily_data: List[DailyData] = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            entries = await self._get_meal_entries_for_date(user_id, current_date)
-
-            if entries:  # Only include days with data
-                totals = self._calculate_daily_totals(current_date, entries)
-                daily_data.append(DailyData(
-                    date=current_date,
-                    calories=totals.total_calories,
-                    protein=totals.total_protein,
-                    carbs=totals.total_carbs,
-                    fat=totals.total_fat,
-                    meal_count=totals.meal_count
-                ))
-
-            current_date += timedelta(days=1)
-
-        # Calculate averages
-        if daily_data:
-            avg_calories = sum(d.calories for d in daily_data) / len(daily_data)
-            avg_protein = sum(d.protein for d in daily_data) / len(daily_data)
-            avg_carbs = sum(d.carbs for d in daily_data) / len(daily_data)
-            avg_fat = sum(d.fat for d in daily_data) / len(daily_data)
-            avg_meals = sum(d.meal_count for d in daily_data) / len(daily_data)
+        # Fetch the whole range in one query and bucket entries by day
+        entries = await self._get_meal_entries_in_range(user_id, start_date, end_date)
+        entries_by_date = self._group_entries_by_date(entries)
+
+        # Collect per-day values as parallel columns; only days with data
+        # are included, in date order
+        days: List[date] = []
+        calories: List[int] = []
+        protein: List[Decimal] = []
+        carbs: List[Decimal] = []
+        fat: List[Decimal] = []
+        meal_counts: List[int] = []
+        for current_date in sorted(entries_by_date):
+            totals = self._calculate_daily_totals(current_date, entries_by_date[current_date])
+            days.append(current_date)
+            calories.append(totals.total_calories)
+            protein.append(totals.total_protein)
+            carbs.append(totals.total_carbs)
+            fat.append(totals.total_fat)
+            meal_counts.append(totals.meal_count)
+
+        # Calculate averages as column reductions. Macros are averaged as
+        # Decimals so ties such as 105.35 round as before; float sums drift
+        num_days = len(days)
+        if num_days:
+            avg_calories = sum(calories) / num_days
+            avg_protein = float(sum(protein) / num_days)
+            avg_carbs = float(sum(carbs) / num_days)
+            avg_fat = float(sum(fat) / num_days)
+            avg_meals = sum(meal_counts) / num_days
         else:
-            avg_calories = avg_protein = avg_carbs = avg_fat = avg_meals = 0
+            avg_calories = avg_protein = avg_carbs = avg_fat = avg_meals = 0.0
 
         averages = WeeklyAverages(
             calories=round(avg_calories, 1),
-            protein=round(float(avg_protein), 1),
-            carbs=round(float(avg_carbs), 1),
-            fat=round(float(avg_fat), 1),
+            protein=round(avg_protein, 1),
+            carbs=round(avg_carbs, 1),
+            fat=round(avg_fat, 1),
             meal_count=round(avg_meals, 1)
         )
 
         # Analyze trend
-        trend = self._analyze_trend(daily_data)
-        variance = self._calculate_variance(daily_data)
-        consistency = self._calculate_consistency_score(variance)
+        trend = self._analyze_trend(calories)
+        variance = self._calculate_variance(calories)
+        consistency = _consistency_score(variance)
+
+        # Build schema objects only at the response boundary
+        daily_data = [
+            DailyData(date=d, calories=c, protein=p, carbs=cb, fat=f, meal_count=m)
+            for d, c, p, cb, f, m in zip(days, calories, protein, carbs, fat, meal_counts)
+        ]
 
         return WeeklyTrends(
             date_range=[start_date, end_date],
-            days_with_data=len(daily_data),
+            days_with_data=num_days,
             daily_averages=averages,
             daily_data=daily_data,
             trend=trend,
@@ -237,9 +397,12 @@ class DailySummaryService:
         """
         comparison_days: List[ComparisonDay] = []
 
+        # Fetch all requested days in one query
+        entries = await self._get_meal_entries_for_dates(user_id, dates)
+        entries_by_date = self._group_entries_by_date(entries)
+
         for target_date in dates:
-            entries = await self._get_meal_entries_for_date(user_id, target_date)
-            totals = self._calculate_daily_totals(target_date, entries)
+            totals = self._calculate_daily_totals(target_date, entries_by_date.get(target_date, []))
 
             comparison_days.append(ComparisonDay(
                 date=target_date,
@@ -276,31 +439,95 @@ class DailySummaryService:
 
     # ==================== Private Helper Methods ====================
 
-    async def _get_meal_entries_for_date(
+    async def _get_meal_type_totals_for_date(
         self,
         user_id: UUID,
         target_date: date
     ) -> List[Dict[str, Any]]:
-        """Get all meal entries for a specific date."""
-        response = self.supabase.table("meal_entries") \
-            .select("*") \
+        """Get nutrition totals per meal type for a date from the daily_meal_totals view."""
+        query = self.supabase.table("daily_meal_totals") \
+            .select("meal_type, calories, protein_g, carbs_g, fat_g, meal_count, first_meal, last_meal") \
+            .eq("user_id", str(user_id)) \
+            .eq("date", str(target_date))
+        response = await asyncio.to_thread(query.execute)
+
+        return response.data if response.data else []
+
+    async def _get_meal_entries_in_range(
+        self,
+        user_id: UUID,
+        start_date: date,
+        end_date: date
+    ) -> List[Dict[str, Any]]:
+        """Get all meal entries between two dates (inclusive) in a single query."""
+        query = self.supabase.table("meal_entries") \
+            .select(_RANGE_ENTRY_COLUMNS) \
+            .eq("user_id", str(user_id)) \
+            .gte("date", str(start_date)) \
+            .lte("date", str(end_date)) \
+            .order("date", desc=False) \
+            .order("time", desc=False)
+        response = await asyncio.to_thread(query.execute)
+
+        return response.data if response.data else []
+
+    async def _get_meal_entries_for_dates(
+        self,
+        user_id: UUID,
+        dates: Sequence[date]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all meal entries on an explicit set of dates in a single query.
+
+        Meant for sparse, non-contiguous dates; for a contiguous range use
+        _get_meal_entries_in_range, which can scan the index by range.
+        """
+        if not dates:
+            return []
+
+        query = self.supabase.table("meal_entries") \
+            .select(_RANGE_ENTRY_COLUMNS) \
             .eq("user_id", str(user_id)) \
-            .eq("date", str(target_date)) \
-            .order("time", desc=False) \
-            .execute()
+            .in_("date", [str(d) for d in dates]) \
+            .order("date", desc=False) \
+            .order("time", desc=False)
+        response = await asyncio.to_thread(query.execute)
 
         return response.data if response.data else []
 
+    @staticmethod
+    def _group_entries_by_date(
+        entries: List[Dict[str, Any]]
+    ) -> Dict[date, List[Dict[str, Any]]]:
+        """Bucket meal entries by their date, preserving query order."""
+        grouped: Dict[date, List[Dict[str, Any]]] = defaultdict(list)
+        for entry in entries:
+            grouped[date.fromisoformat(entry["date"])].append(entry)
+        return grouped
+
     async def _get_user_goals(self, user_id: UUID) -> Optional[Dict[str, Any]]:
-        """Get user nutrition goals from profiles."""
+        """Get user nutrition goals from profiles (cached for GOALS_CACHE_TTL_SECONDS)."""
+        key = str(user_id)
+        cached = _goals_cache.get(key)
+        if cached is not None:
+            expires_at, goals = cached
+            if expires_at > time.monotonic():
+                return goals
+            del _goals_cache[key]
+
         try:
-            response = self.supabase.table("profiles") \
+            query = self.supabase.table("profiles") \
                 .select("daily_calories, protein_g, carbs_g, fat_g") \
-                .eq("user_id", str(user_id)) \
-                .execute()
+                .eq("user_id", str(user_id))
+            response = await asyncio.to_thread(query.execute)
 
             if response.data and len(response.data) > 0:
-                return response.data[0]
+                goals = response.data[0]
+                if len(_goals_cache) >= GOALS_CACHE_MAX_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del _goals_cache[next(iter(_goals_cache))]
+                _goals_cache[key] = (time.monotonic() + GOALS_CACHE_TTL_SECONDS, goals)
+                return goals
         except Exception:
             # Goals not set yet, return None
             pass
@@ -312,7 +539,101 @@ class DailySummaryService:
         entries: List[Dict[str, Any]]
     ) -> DailyTotals:
         """Calculate total nutrition for the day."""
-        if not entries:
+        total_calories = 0
+        total_protein = total_carbs = total_fat = 0.0
+        for e in entries:
+            total_calories += e["calories"]
+            total_protein += float(e["protein_g"])
+            total_carbs += float(e["carbs_g"])
+            total_fat += float(e["fat_g"])
+
+        return self._build_daily_totals(
+            target_date,
+            total_calories,
+            total_protein,
+            total_carbs,
+            total_fat,
+            len(entries)
+        )
+
+    def _calculate_totals_and_breakdown(
+        self,
+        target_date: date,
+        entries: List[Dict[str, Any]]
+    ) -> Tuple[DailyTotals, List[MealTypeBreakdown]]:
+        """
+        Calculate daily totals and the per-meal-type breakdown in one pass.
+
+        Accepts raw meal entries or daily_meal_totals rows; rows carrying a
+        meal_count count as that many meals.
+        """
+        # meal_type -> [calories, protein, carbs, fat, meal_count]
+        buckets: Dict[str, List[Any]] = defaultdict(lambda: [0, 0.0, 0.0, 0.0, 0])
+        total_calories = 0
+        total_protein = total_carbs = total_fat = 0.0
+        meal_count = 0
+
+        for e in entries:
+            calories = e["calories"]
+            protein = float(e["protein_g"])
+            carbs = float(e["carbs_g"])
+            fat = float(e["fat_g"])
+            count = e.get("meal_count", 1)
+
+            bucket = buckets[e["meal_type"]]
+            bucket[0] += calories
+            bucket[1] += protein
+            bucket[2] += carbs
+            bucket[3] += fat
+            bucket[4] += count
+
+            total_calories += calories
+            total_protein += protein
+            total_carbs += carbs
+            total_fat += fat
+            meal_count += count
+
+        totals = self._build_daily_totals(
+            target_date,
+            total_calories,
+            total_protein,
+            total_carbs,
+            total_fat,
+            meal_count
+        )
+
+        breakdowns: List[MealTypeBreakdown] = []
+        for meal_type, (calories, protein, carbs, fat, count) in buckets.items():
+            percent = (calories / total_calories * 100) if total_calories > 0 else 0.0
+
+            breakdowns.append(MealTypeBreakdown(
+                meal_type=meal_type,
+                calories=calories,
+                protein_g=_grams_to_decimal(protein),
+                carbs_g=_grams_to_decimal(carbs),
+                fat_g=_grams_to_decimal(fat),
+                percent_of_daily=round(percent, 1),
+                meal_count=count
+            ))
+
+        # Sort by standard meal order
+        meal_order = {"breakfast": 0, "lunch": 1, "dinner": 2, "snack": 3}
+        breakdowns.sort(key=lambda x: meal_order.get(x.meal_type, 99))
+
+        return totals, breakdowns
+
+    def _build_daily_totals(
+        self,
+        target_date: date,
+        total_calories: int,
+        total_protein: float,
+        total_carbs: float,
+        total_fat: float,
+        meal_count: int
+    ) -> DailyTotals:
+        """Build DailyTotals (with macro percentages) from summed values."""
+        if not meal_count:
+            # Empty days report unscaled zeros ("0", not "0.0")
             return DailyTotals(
                 date=target_date,
                 total_calories=0,
@@ -325,71 +646,22 @@ class DailySummaryService:
                 meal_count=0
             )
 
-        total_calories = sum(e["calories"] for e in entries)
-        total_protein = sum(Decimal(str(e["protein_g"])) for e in entries)
-        total_carbs = sum(Decimal(str(e["carbs_g"])) for e in entries)
-        total_fat = sum(Decimal(str(e["fat_g"])) for e in entries)
-
-        # Calculate macro percentages
-        if total_calories > 0:
-            protein_percent = (float(total_protein) * 4 / total_calories) * 100
-            carbs_percent = (float(total_carbs) * 4 / total_calories) * 100
-            fat_percent = (float(total_fat) * 9 / total_calories) * 100
-        else:
-            protein_percent = carbs_percent = fat_percent = 0.0
+        protein_percent, carbs_percent, fat_percent = _macro_percents(
+            total_calories, total_protein, total_carbs, total_fat
+        )
 
         return DailyTotals(
             date=target_date,
             total_calories=total_calories,
-            total_protein=round(total_protein, 1),
-            total_carbs=round(total_carbs, 1),
-            total_fat=round(total_fat, 1),
-            protein_percent=round(protein_percent, 1),
-            carbs_percent=round(carbs_percent, 1),
-            fat_percent=round(fat_percent, 1),
-            meal_count=len(entries)
+            total_protein=_grams_to_decimal(total_protein),
+            total_carbs=_grams_to_decimal(total_carbs),
+            total_fat=_grams_to_decimal(total_fat),
+            protein_percent=protein_percent,
+            carbs_percent=carbs_percent,
+            fat_percent=fat_percent,
+            meal_count=meal_count
         )
 
-    def _calculate_meal_type_breakdown(
-        self,
-        entries: List[Dict[str, Any]],
-        total_calories: int
-    ) -> List[MealTypeBreakdown]:
-        """Calculate nutrition breakdown by meal type."""
-        # Group by meal type
-        by_type: Dict[str, List[Dict[str, Any]]] = {}
-        for entry in entries:
-            meal_type = entry["meal_type"]
-            if meal_type not in by_type:
-                by_type[meal_type] = []
-            by_type[meal_type].append(entry)
-
-        # Calculate totals for each type
-        breakdowns: List[MealTypeBreakdown] = []
-        for meal_type, type_entries in by_type.items():
-            type_calories = sum(e["calories"] for e in type_entries)
-            type_protein = sum(Decimal(str(e["protein_g"])) for e in type_entries)
-            type_carbs = sum(Decimal(str(e["carbs_g"])) for e in type_entries)
-            type_fat = sum(Decimal(str(e["fat_g"])) for e in type_entries)
-
-            percent = (type_calories / total_calories * 100) if total_calories > 0 else 0.0
-
-            breakdowns.append(MealTypeBreakdown(
-                meal_type=meal_type,
-                calories=type_calories,
-                protein_g=round(type_protein, 1),
-                carbs_g=round(type_carbs, 1),
-                fat_g=round(type_fat, 1),
-                percent_of_daily=round(percent, 1),
-                meal_count=len(type_entries)
-            ))
-
-        # Sort by standard meal order
-        meal_order = {"breakfast": 0, "lunch": 1, "dinner": 2, "snack": 3}
-        breakdowns.sort(key=lambda x: meal_order.get(x.meal_type, 99))
-
-        return breakdowns
-
     def _calculate_calorie_progress(
         self,
         consumed: int,
@@ -399,13 +671,7 @@ class DailySummaryService:
         remaining = goal - consumed
         percent = (consumed / goal * 100) if goal > 0 else 0
 
-        # Determine status
-        if percent < STATUS_UNDER_THRESHOLD * 100:
-            status = "under"
-        elif percent > STATUS_OVER_THRESHOLD * 100:
-            status = "over"
-        else:
-            status = "on_track"
+        status = _progress_status(percent)
 
         return CalorieProgress(
             consumed=consumed,
@@ -424,13 +690,7 @@ class DailySummaryService:
         remaining = goal - consumed
         percent = (float(consumed) / float(goal) * 100) if goal > 0 else 0
 
-        # Determine status
-        if percent < STATUS_UNDER_THRESHOLD * 100:
-            status = "under"
-        elif percent > STATUS_OVER_THRESHOLD * 100:
-            status = "over"
-        else:
-            status = "on_track"
+        status = _progress_status(percent)
 
         return MacroProgress(
             consumed=round(consumed, 1),
@@ -462,12 +722,18 @@ class DailySummaryService:
             weekly_weight_change=round(weekly_weight_change, 2)
         )
 
-    def _calculate_eating_window(
+    def _calculate_eating_window_from_bounds(
         self,
-        entries: List[Dict[str, Any]]
+        first_meal: Optional[Any],
+        last_meal: Optional[Any]
     ) -> Optional[EatingWindow]:
-        """Calculate eating window for intermittent fasting tracking."""
-        if not entries:
+        """
+        Calculate eating window for intermittent fasting tracking.
+
+        Takes the first and last meal time of the day (time objects or
+        "HH:MM:SS" strings); None means nothing was logged.
+        """
+        if first_meal is None or last_meal is None:
             return EatingWindow(
                 first_meal_time=None,
                 last_meal_time=None,
@@ -476,18 +742,10 @@ class DailySummaryService:
                 is_intermittent_fasting=False
             )
 
-        # Parse times
-        times = []
-        for entry in entries:
-            time_str = entry["time"]
-            if isinstance(time_str, str):
-                time_obj = datetime.strptime(time_str, "%H:%M:%S").time()
-            else:
-                time_obj = time_str
-            times.append(time_obj)
-
-        first_meal = min(times)
-        last_meal = max(times)
+        if isinstance(first_meal, str):
+            first_meal = _parse_hms(first_meal)
+        if isinstance(last_meal, str):
+            last_meal = _parse_hms(last_meal)
 
         # Calculate eating window in hours
         first_minutes = first_meal.hour * 60 + first_meal.minute
@@ -508,34 +766,32 @@ class DailySummaryService:
 
     def _should_project(self, target_date: date) -> bool:
         """Determine if we should project end-of-day totals."""
-        today = date.today()
-        if target_date < today:
-            return False  # Past days don't need projection
-        if target_date > today:
-            return False  # Future days can't be projected
-
-        # Check if it's before 11 PM (reasonable cutoff)
         now = datetime.now()
-        if now.hour >= 23:
-            return False  # Too late, day is essentially done
+        return _should_project_cached(target_date, now.date(), now.hour)
 
-        return True
-
-    async def _calculate_projection(
+    def _calculate_projection(
         self,
-        user_id: UUID,
         target_date: date,
         current_calories: int,
         goal_calories: int,
         by_meal_type: List[MealTypeBreakdown]
     ) -> EndOfDayProjection:
-        """Calculate end-of-day projection based on current progress."""
+        """
+        Calculate end-of-day projection based on current progress.
+
+        Pure computation over the already-fetched totals; no database access.
+        """
         current_time = datetime.now().time()
 
         # Determine which meals are already logged
-        logged_types = set(b.meal_type for b in by_meal_type)
-        all_types = {"breakfast", "lunch", "dinner", "snack"}
-        meals_remaining = list(all_types - logged_types)
+        logged = 0
+        for breakdown in by_meal_type:
+            logged |= _MEAL_TYPE_BITS.get(breakdown.meal_type, 0)
+        remaining_mask = _ALL_MEAL_TYPES_MASK & ~logged
+        meals_remaining = [
+            meal_type for meal_type, bit in _MEAL_TYPE_BITS.items()
+            if remaining_mask & bit
+        ]
 
         # Simple projection: assume remaining meals proportional to goal
         remaining_budget = goal_calories - current_calories
@@ -552,7 +808,7 @@ class DailySummaryService:
             confidence = 0.6
 
         # Adjust confidence based on meals logged
-        if len(logged_types) >= 3:
+        if logged.bit_count() >= 3:
             confidence += 0.1
 
         confidence = min(confidence, 1.0)
@@ -588,15 +844,18 @@ class DailySummaryService:
             suggested_calories=suggested
         )
 
-    def _analyze_trend(self, daily_data: List[DailyData]) -> str:
-        """Analyze if calories are increasing, decreasing, or stable."""
-        if len(daily_data) < 2:
+    def _analyze_trend(self, calories: List[int]) -> str:
+        """Analyze if daily calories are increasing, decreasing, or stable."""
+        n = len(calories)
+        if n < 2:
             return "stable"
 
         # Calculate trend using first half vs second half averages
-        mid_point = len(daily_data) // 2
-        first_half_avg = sum(d.calories for d in daily_data[:mid_point]) / mid_point
-        second_half_avg = sum(d.calories for d in daily_data[mid_point:]) / (len(daily_data) - mid_point)
+        mid_point = n // 2
+        first_half_sum = sum(calories[:mid_point])
+        second_half_sum = sum(calories) - first_half_sum
+        first_half_avg = first_half_sum / mid_point
+        second_half_avg = second_half_sum / (n - mid_point)
 
         change_percent = (second_half_avg - first_half_avg) / first_half_avg if first_half_avg > 0 else 0
 
@@ -607,36 +866,26 @@ class DailySummaryService:
         else:
             return "stable"
 
-    def _calculate_variance(self, daily_data: List[DailyData]) -> float:
-        """Calculate variance in calories (coefficient of variation)."""
-        if len(daily_data) < 2:
+    def _calculate_variance(self, calories: List[int]) -> float:
+        """Calculate variance in daily calories (coefficient of variation)."""
+        if len(calories) < 2:
             return 0.0
 
-        calories = [d.calories for d in daily_data]
-        mean = statistics.mean(calories)
-        stdev = statistics.stdev(calories)
+        # Welford's single-pass mean and sum of squared deviations
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        for value in calories:
+            n += 1
+            delta = value - mean
+            mean += delta / n
+            m2 += delta * (value - mean)
+        stdev = sqrt(m2 / (n - 1))
 
         # Coefficient of variation (CV) = (stdev / mean) * 100
         cv = (stdev / mean * 100) if mean > 0 else 0
         return cv
 
-    def _calculate_consistency_score(self, variance: float) -> float:
-        """
-        Calculate consistency score (0-1) based on variance.
-        Lower variance = higher consistency.
-        """
-        # Variance of 0% = perfect consistency (1.0)
-        # Variance of 20% = moderate consistency (0.5)
-        # Variance of 40%+ = low consistency (0.0)
-
-        if variance <= 0:
-            return 1.0
-        elif variance >= 40:
-            return 0.0
-        else:
-            # Linear interpolation
-            return 1.0 - (variance / 40)
-
     def _generate_comparison_analysis(
         self,
         days: List[ComparisonDay],
@@ -5,7 +5,13 @@ Implements food search across system foods, user foods, and favorites
 with relevance scoring and filtering.
 """
 
+from dataclasses import asdict, dataclass, field
+from operator import attrgetter
 from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import heapq
+import time
+from supabase import Client
 from app.core.supabase import get_supabase_client
 from app.schemas.food import (
     FoodSearchFilters,
@@ -15,12 +21,107 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# PostgREST error code for an unknown RPC (migration 008 not applied)
+_RPC_NOT_FOUND_CODE = "PGRST202"
+
+# Base relevance scores for the in-Python search (search_foods_ranked reads
+# the per-row relevance_base column added in migration 011)
+USER_FOOD_BASE_SCORE = 0.8  # User foods get high base score
+SYSTEM_FOOD_BASE_SCORE = 0.6  # System foods get medium base score
+
+# Columns read by the formatters (avoid select("*") payloads)
+_USER_FOOD_SEARCH_COLUMNS = (
+    "id, name, category, calories, protein_g, carbs_g, fat_g, "
+    "serving_size_g, serving_size_description"
+)
+_SYSTEM_FOOD_SEARCH_COLUMNS = _USER_FOOD_SEARCH_COLUMNS + ", name_en, food_brands(name)"
+_USER_FOOD_DETAIL_COLUMNS = _USER_FOOD_SEARCH_COLUMNS + ", fiber_g, sugar_g, sodium_mg"
+_SYSTEM_FOOD_DETAIL_COLUMNS = _SYSTEM_FOOD_SEARCH_COLUMNS + ", fiber_g, sugar_g, sodium_mg"
+
+# Whether the search_foods_ranked RPC can be used (flipped off once if missing)
+_ranked_search_available = True
+
+# Process-local TTL caches
+FAVORITES_CACHE_TTL_SECONDS = 30  # Per user_id
+SYSTEM_FOOD_CACHE_TTL_SECONDS = 3600  # Per food_id, verified system foods only
+FOOD_CACHE_MAX_SIZE = 10_000
+
+_favorites_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_system_food_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _cache_get(cache: Dict[str, Tuple[float, Any]], key: str) -> Optional[Any]:
+    """Return a cached value if present and not expired."""
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    expires_at, value = cached
+    if expires_at > time.monotonic():
+        return value
+    del cache[key]
+    return None
+
+
+def _cache_put(
+    cache: Dict[str, Tuple[float, Any]], key: str, value: Any, ttl_seconds: float
+) -> None:
+    """Store a value with a TTL, evicting the oldest entry when full."""
+    if key not in cache and len(cache) >= FOOD_CACHE_MAX_SIZE:
+        # Dicts keep insertion order, so the first key is the oldest
+        del cache[next(iter(cache))]
+    cache[key] = (time.monotonic() + ttl_seconds, value)
+
+
+@dataclass(slots=True)
+class FoodRow:
+    """A food search result while it is scored, deduplicated and ranked."""
+
+    id: str
+    source: str  # "user" or "system"
+    name: str
+    name_en: Optional[str]
+    category: str
+    brand_name: Optional[str]
+    calories: float
+    protein_g: float
+    carbs_g: float
+    fat_g: float
+    serving_size_g: float
+    serving_size_description: Optional[str]
+    relevance_score: float
+    is_favorite: bool = False
+    use_count: Optional[int] = None
+    # Lowercased once here, read by scoring and dedupe; not part of responses
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name_lower = self.name.lower()
+
+    def to_response(self) -> Dict[str, Any]:
+        """Serialize for the API (FoodSearchResultItem fields)."""
+        data = asdict(self)
+        del data["name_lower"]
+        return data
+
+
+_by_relevance = attrgetter("relevance_score")
+
+
+def _num(value: Any) -> float:
+    """Coerce a numeric column to float, skipping the call when it already is one."""
+    return value if type(value) is float else float(value)
+
+
+def invalidate_favorites(user_id: str) -> None:
+    """Drop cached favorites for a user (call after favorites change)."""
+    _favorites_cache.pop(str(user_id), None)
+
 
 class FoodSearchService:
     """Service for searching and managing foods."""
 
-    def __init__(self):
-        self.supabase = get_supabase_client()
+    def __init__(self, supabase_client: Optional[Client] = None):
+        self.supabase = supabase_client or get_supabase_client()
 
     async def search_foods(
         self,
@@ -58,7 +159,14 @@ class FoodSearchService:
             # Build filter conditions
             filter_conditions = self._build_filter_conditions(filters)
 
-            # Search strategy:
+            # Preferred path: rank, dedupe and paginate in Postgres
+            ranked = await self._search_foods_ranked(
+                user_id, query, offset, page_size, filters, filter_conditions
+            )
+            if ranked is not None:
+                return ranked
+
+            # Fallback search strategy (databases without search_foods_ranked):
             # 1. Get user's custom foods with search
             # 2. Get system foods with search
             # 3. Get user's favorites
@@ -67,43 +175,29 @@ class FoodSearchService:
             # 6. Calculate relevance scores
             # 7. Sort by score + paginate
 
-            results = []
-
-            # Step 1: Search user's custom foods
+            # Steps 1-3: user foods, system foods (unless only_user_foods) and
+            # favorites are independent queries, so run them concurrently
+            searches = [self._search_user_foods(user_id, query, filter_conditions)]
             if not filters or not filters.only_user_foods:
-                user_foods = await self._search_user_foods(
-                    user_id, query, filter_conditions
-                )
-                results.extend(user_foods)
+                searches.append(self._search_system_foods(query, filter_conditions))
 
-            # Step 2: Search system foods (only if not user_foods_only)
-            if not filters or not filters.only_user_foods:
-                system_foods = await self._search_system_foods(
-                    query, filter_conditions
-                )
-                results.extend(system_foods)
-
-            # Step 3: Get user's favorites and mark them
-            favorites = await self._get_user_favorites(user_id)
-            favorite_ids = {fav["food_id"] or fav["user_food_id"] for fav in favorites}
-            favorite_use_counts = {
-                fav["food_id"]
-                or fav["user_food_id"]: fav["use_count"]
+            favorites, *found = await asyncio.gather(
+                self._get_user_favorites(user_id), *searches
+            )
+            results = [food for foods in found for food in foods]
+
+            # Mark favorites and add use_count (food id -> use_count)
+            fav_map = {
+                fav["food_id"] or fav["user_food_id"]: fav["use_count"]
                 for fav in favorites
             }
 
-            # Mark favorites and add use_count
             for result in results:
-                if result["id"] in favorite_ids:
-                    result["is_favorite"] = True
-                    result["use_count"] = favorite_use_counts[result["id"]]
+                if result.id in fav_map:
+                    result.is_favorite = True
+                    result.use_count = fav_map[result.id]
                     # Boost relevance for favorites
-                    result["relevance_score"] = min(
-                        1.0, result.get("relevance_score", 0.5) + 0.3
-                    )
-                else:
-                    result["is_favorite"] = False
-                    result["use_count"] = None
+                    result.relevance_score = min(1.0, result.relevance_score + 0.3)
 
             # Step 4: Calculate relevance scores
             results = self._calculate_relevance(results, query)
@@ -111,14 +205,16 @@ class FoodSearchService:
             # Step 5: Remove duplicates (prefer user foods over system)
             results = self._remove_duplicates(results)
 
-            # Step 6: Sort by relevance score (highest first)
-            results.sort(key=lambda x: x["relevance_score"], reverse=True)
-
             # Get total count before pagination
             total_count = len(results)
 
-            # Step 7: Apply pagination
-            paginated_results = results[offset : offset + page_size]
+            # Steps 6-7: Rank by relevance score (highest first) and paginate.
+            # Only the rows up to the end of the requested page are ordered;
+            # nlargest matches a stable descending sort followed by a slice.
+            top_results = heapq.nlargest(offset + page_size, results, key=_by_relevance)
+
+            # Serialize only the returned page
+            paginated_results = [result.to_response() for result in top_results[offset:]]
 
             return paginated_results, total_count
 
@@ -126,15 +222,96 @@ class FoodSearchService:
             logger.error(f"Food search error: {str(e)}")
             raise
 
+    async def _search_foods_ranked(
+        self,
+        user_id: str,
+        query: str,
+        offset: int,
+        page_size: int,
+        filters: Optional[FoodSearchFilters],
+        filter_conditions: Dict[str, Any],
+    ) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        """
+        Search via the search_foods_ranked RPC (one round-trip, one page).
+
+        Returns None when the RPC can't be used so the caller falls back to
+        the in-Python search.
+        """
+        global _ranked_search_available
+        if not _ranked_search_available:
+            return None
+
+        rpc_filters = dict(filter_conditions)
+        if filters and filters.only_user_foods:
+            rpc_filters["only_user_foods"] = True
+
+        params = {
+            "p_user_id": user_id,
+            "p_query": query,
+            "p_offset": offset,
+            "p_limit": page_size,
+            "p_filters": rpc_filters,
+        }
+
+        try:
+            rpc_query = self.supabase.rpc("search_foods_ranked", params)
+            response = await asyncio.to_thread(rpc_query.execute)
+            rows = response.data or []
+
+            if rows:
+                # Every row carries the pre-pagination total
+                total_count = rows[0]["total_count"]
+            elif offset > 0:
+                # Past the last page: fetch a single row just for the total
+                count_query = self.supabase.rpc(
+                    "search_foods_ranked", {**params, "p_offset": 0, "p_limit": 1}
+                )
+                count_rows = (await asyncio.to_thread(count_query.execute)).data
+                total_count = count_rows[0]["total_count"] if count_rows else 0
+            else:
+                total_count = 0
+        except Exception as e:
+            if _RPC_NOT_FOUND_CODE in str(e):
+                _ranked_search_available = False
+                logger.warning(
+                    "search_foods_ranked RPC not found, using in-Python search"
+                )
+            else:
+                logger.error("Ranked food search error: %s", e)
+            return None
+
+        results = [
+            FoodRow(
+                id=food["id"],
+                source=food["source"],
+                name=food["name"],
+                name_en=food.get("name_en"),
+                category=food["category"],
+                brand_name=food.get("brand_name"),
+                calories=_num(food["calories"]),
+                protein_g=_num(food["protein_g"]),
+                carbs_g=_num(food["carbs_g"]),
+                fat_g=_num(food["fat_g"]),
+                serving_size_g=_num(food["serving_size_g"]),
+                serving_size_description=food.get("serving_size_description"),
+                relevance_score=_num(food["relevance_score"]),
+                is_favorite=food["is_favorite"],
+                use_count=food.get("use_count"),
+            ).to_response()
+            for food in rows
+        ]
+
+        return results, total_count
+
     async def _search_user_foods(
         self, user_id: str, query: str, filter_conditions: Dict
-    ) -> List[Dict[str, Any]]:
+    ) -> List[FoodRow]:
         """Search user's custom foods."""
         try:
             # Build query
             query_builder = (
                 self.supabase.table("user_foods")
-                .select("*")
+                .select(_USER_FOOD_SEARCH_COLUMNS)
                 .eq("user_id", user_id)
                 .ilike("name", f"%{query}%")  # Case-insensitive LIKE
             )
@@ -142,30 +319,28 @@ class FoodSearchService:
             # Apply filters
             query_builder = self._apply_filters(query_builder, filter_conditions)
 
-            # Execute query
-            response = query_builder.execute()
+            # Execute query (sync client, off the event loop)
+            response = await asyncio.to_thread(query_builder.execute)
 
             # Format results
             results = []
             for food in response.data:
                 results.append(
-                    {
-                        "id": food["id"],
-                        "source": "user",
-                        "name": food["name"],
-                        "name_en": None,
-                        "category": food["category"],
-                        "brand_name": None,  # TODO: Join brands
-                        "calories": float(food["calories"]),
-                        "protein_g": float(food["protein_g"]),
-                        "carbs_g": float(food["carbs_g"]),
-                        "fat_g": float(food["fat_g"]),
-                        "serving_size_g": float(food["serving_size_g"]),
-                        "serving_size_description": food.get(
-                            "serving_size_description"
-                        ),
-                        "relevance_score": 0.8,  # User foods get high base score
-                    }
+                    FoodRow(
+                        id=food["id"],
+                        source="user",
+                        name=food["name"],
+                        name_en=None,
+                        category=food["category"],
+                        brand_name=None,  # TODO: Join brands
+                        calories=_num(food["calories"]),
+                        protein_g=_num(food["protein_g"]),
+                        carbs_g=_num(food["carbs_g"]),
+                        fat_g=_num(food["fat_g"]),
+                        serving_size_g=_num(food["serving_size_g"]),
+                        serving_size_description=food.get("serving_size_description"),
+                        relevance_score=USER_FOOD_BASE_SCORE,
+                    )
                 )
 
             return results
@@ -176,13 +351,13 @@ class FoodSearchService:
 
     async def _search_system_foods(
         self, query: str, filter_conditions: Dict
-    ) -> List[Dict[str, Any]]:
+    ) -> List[FoodRow]:
         """Search system foods database."""
         try:
             # Build query
             query_builder = (
                 self.supabase.table("foods")
-                .select("*, food_brands(name)")
+                .select(_SYSTEM_FOOD_SEARCH_COLUMNS)
                 .eq("verified", True)  # Only verified foods
                 .or_(f"name.ilike.%{query}%,name_en.ilike.%{query}%")
             )
@@ -190,8 +365,8 @@ class FoodSearchService:
             # Apply filters
             query_builder = self._apply_filters(query_builder, filter_conditions)
 
-            # Execute query
-            response = query_builder.execute()
+            # Execute query (sync client, off the event loop)
+            response = await asyncio.to_thread(query_builder.execute)
 
             # Format results
             results = []
@@ -201,23 +376,21 @@ class FoodSearchService:
                     brand_name = food["food_brands"].get("name")
 
                 results.append(
-                    {
-                        "id": food["id"],
-                        "source": "system",
-                        "name": food["name"],
-                        "name_en": food.get("name_en"),
-                        "category": food["category"],
-                        "brand_name": brand_name,
-                        "calories": float(food["calories"]),
-                        "protein_g": float(food["protein_g"]),
-                        "carbs_g": float(food["carbs_g"]),
-                        "fat_g": float(food["fat_g"]),
-                        "serving_size_g": float(food["serving_size_g"]),
-                        "serving_size_description": food.get(
-                            "serving_size_description"
-                        ),
-                        "relevance_score": 0.6,  # System foods get medium base score
-                    }
+                    FoodRow(
+                        id=food["id"],
+                        source="system",
+                        name=food["name"],
+                        name_en=food.get("name_en"),
+                        category=food["category"],
+                        brand_name=brand_name,
+                        calories=_num(food["calories"]),
+                        protein_g=_num(food["protein_g"]),
+                        carbs_g=_num(food["carbs_g"]),
+                        fat_g=_num(food["fat_g"]),
+                        serving_size_g=_num(food["serving_size_g"]),
+                        serving_size_description=food.get("serving_size_description"),
+                        relevance_score=SYSTEM_FOOD_BASE_SCORE,
+                    )
                 )
 
             return results
@@ -227,16 +400,24 @@ class FoodSearchService:
             return []
 
     async def _get_user_favorites(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get user's favorite foods."""
+        """Get user's favorite foods (cached for FAVORITES_CACHE_TTL_SECONDS)."""
+        cached = _cache_get(_favorites_cache, user_id)
+        if cached is not None:
+            return cached
+
         try:
-            response = (
+            query_builder = (
                 self.supabase.table("food_favorites")
                 .select("food_id, user_food_id, use_count")
                 .eq("user_id", user_id)
-                .execute()
             )
+            response = await asyncio.to_thread(query_builder.execute)
 
-            return response.data
+            favorites = response.data or []
+            _cache_put(
+                _favorites_cache, user_id, favorites, FAVORITES_CACHE_TTL_SECONDS
+            )
+            return favorites
 
         except Exception as e:
             logger.error(f"Favorites fetch error: {str(e)}")
@@ -310,125 +491,226 @@ class FoodSearchService:
         return query_builder
 
     def _calculate_relevance(
-        self, results: List[Dict[str, Any]], query: str
-    ) -> List[Dict[str, Any]]:
+        self, results: List[FoodRow], query: str
+    ) -> List[FoodRow]:
         """Calculate relevance scores based on query match."""
+        # Browse calls (empty query): every name starts with "", so each
+        # result gets the starts-with bonus (exact match only for an empty
+        # name), as in search_foods_ranked, without any string scanning
+        if not query:
+            for result in results:
+                bonus = 0.3 if result.name_lower else 0.4
+                result.relevance_score = min(1.0, result.relevance_score + bonus)
+            return results
+
         query_lower = query.lower()
+        query_len = len(query_lower)
 
         for result in results:
-            name_lower = result["name"].lower()
-            base_score = result.get("relevance_score", 0.5)
-
-            # Exact match
-            if name_lower == query_lower:
-                result["relevance_score"] = min(1.0, base_score + 0.4)
-
-            # Starts with query
-            elif name_lower.startswith(query_lower):
-                result["relevance_score"] = min(1.0, base_score + 0.3)
-
-            # Contains query
-            elif query_lower in name_lower:
-                result["relevance_score"] = min(1.0, base_score + 0.2)
+            name_lower = result.name_lower
+
+            # A single substring scan classifies the match: position 0 is an
+            # exact or starts-with match, anything later is a contains match.
+            # (A word-prefix match always implies contains, so it needs no
+            # separate check.)
+            position = name_lower.find(query_lower)
+            if position < 0:
+                continue
+
+            if position == 0:
+                bonus = 0.4 if len(name_lower) == query_len else 0.3
+            else:
+                bonus = 0.2
 
-            # Partial word match
-            elif any(word.startswith(query_lower) for word in name_lower.split()):
-                result["relevance_score"] = min(1.0, base_score + 0.1)
+            result.relevance_score = min(1.0, result.relevance_score + bonus)
 
         return results
 
-    def _remove_duplicates(
-        self, results: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+    def _remove_duplicates(self, results: List[FoodRow]) -> List[FoodRow]:
         """Remove duplicate foods, preferring user foods over system foods."""
-        seen = {}
+        # Lowercase name -> index of the kept result in unique_results
+        seen: Dict[str, int] = {}
         unique_results = []
 
         for result in results:
-            # Use lowercase name as key
-            key = result["name"].lower()
+            key = result.name_lower
+            index = seen.get(key)
 
-            if key not in seen:
-                seen[key] = result
+            if index is None:
+                seen[key] = len(unique_results)
                 unique_results.append(result)
-            else:
-                # If current is user food and existing is system, replace
-                existing = seen[key]
-                if result["source"] == "user" and existing["source"] == "system":
-                    unique_results.remove(existing)
-                    seen[key] = result
-                    unique_results.append(result)
+            elif result.source == "user" and unique_results[index].source == "system":
+                # Replace the system food in place (no list scan)
+                unique_results[index] = result
 
         return unique_results
 
+    @staticmethod
+    def _format_system_food_details(food: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a foods row (with food_brands join) for detail responses."""
+        return {
+            "id": food["id"],
+            "source": "system",
+            "name": food["name"],
+            "name_en": food.get("name_en"),
+            "category": food["category"],
+            "brand_name": (food.get("food_brands") or {}).get("name"),
+            "calories": _num(food["calories"]),
+            "protein_g": _num(food["protein_g"]),
+            "carbs_g": _num(food["carbs_g"]),
+            "fat_g": _num(food["fat_g"]),
+            "fiber_g": _num(food.get("fiber_g", 0)),
+            "sugar_g": _num(food.get("sugar_g", 0)),
+            "sodium_mg": _num(food.get("sodium_mg", 0)),
+            "serving_size_g": _num(food["serving_size_g"]),
+            "serving_size_description": food.get("serving_size_description"),
+        }
+
+    @staticmethod
+    def _format_user_food_details(food: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a user_foods row for detail responses."""
+        return {
+            "id": food["id"],
+            "source": "user",
+            "name": food["name"],
+            "category": food["category"],
+            "calories": _num(food["calories"]),
+            "protein_g": _num(food["protein_g"]),
+            "carbs_g": _num(food["carbs_g"]),
+            "fat_g": _num(food["fat_g"]),
+            "fiber_g": _num(food.get("fiber_g", 0)),
+            "sugar_g": _num(food.get("sugar_g", 0)),
+            "sodium_mg": _num(food.get("sodium_mg", 0)),
+            "serving_size_g": _num(food["serving_size_g"]),
+            "serving_size_description": food.get("serving_size_description"),
+        }
+
     async def get_food_by_id(
         self, food_id: str, user_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Get food by ID (system or user food)."""
+        # Verified system foods are shared and rarely change
+        cached = _cache_get(_system_food_cache, food_id)
+        if cached is not None:
+            return dict(cached)
+
         try:
             # Try system foods first
             response = (
                 self.supabase.table("foods")
-                .select("*, food_brands(name)")
+                .select(_SYSTEM_FOOD_DETAIL_COLUMNS)
                 .eq("id", food_id)
                 .eq("verified", True)
                 .maybe_single()
                 .execute()
             )
 
-            if response.data:
-                food = response.data
-                return {
-                    "id": food["id"],
-                    "source": "system",
-                    "name": food["name"],
-                    "name_en": food.get("name_en"),
-                    "category": food["category"],
-                    "brand_name": food.get("food_brands", {}).get("name"),
-                    "calories": float(food["calories"]),
-                    "protein_g": float(food["protein_g"]),
-                    "carbs_g": float(food["carbs_g"]),
-                    "fat_g": float(food["fat_g"]),
-                    "fiber_g": float(food.get("fiber_g", 0)),
-                    "sugar_g": float(food.get("sugar_g", 0)),
-                    "sodium_mg": float(food.get("sodium_mg", 0)),
-                    "serving_size_g": float(food["serving_size_g"]),
-                    "serving_size_description": food.get("serving_size_description"),
-                }
+            if response and response.data:
+                result = self._format_system_food_details(response.data)
+                _cache_put(
+                    _system_food_cache,
+                    food_id,
+                    result,
+                    SYSTEM_FOOD_CACHE_TTL_SECONDS,
+                )
+                return dict(result)
 
             # Try user foods if not found in system
             if user_id:
                 response = (
                     self.supabase.table("user_foods")
-                    .select("*")
+                    .select(_USER_FOOD_DETAIL_COLUMNS)
                     .eq("id", food_id)
                     .eq("user_id", user_id)
                     .maybe_single()
                     .execute()
                 )
 
-                if response.data:
-                    food = response.data
-                    return {
-                        "id": food["id"],
-                        "source": "user",
-                        "name": food["name"],
-                        "category": food["category"],
-                        "calories": float(food["calories"]),
-                        "protein_g": float(food["protein_g"]),
-                        "carbs_g": float(food["carbs_g"]),
-                        "fat_g": float(food["fat_g"]),
-                        "fiber_g": float(food.get("fiber_g", 0)),
-                        "sugar_g": float(food.get("sugar_g", 0)),
-                        "sodium_mg": float(food.get("sodium_mg", 0)),
-                        "serving_size_g": float(food["serving_size_g"]),
-                        "serving_size_description": food.get(
-                            "serving_size_description"
-                        ),
-                    }
+                if response and response.data:
+                    return self._format_user_food_details(response.data)
 
             return None
 
         except Exception as e:
             logger.error(f"Get food by ID error: {str(e)}")
             return None
+
+    async def get_foods_by_ids(self, food_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many verified system foods by ID in at most one query.
+
+        Batch counterpart of get_food_by_id for building meals; cached foods
+        are served without a query. Ids that aren't found are omitted.
+
+        Returns:
+            Map of food id -> formatted food
+        """
+        foods: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for food_id in dict.fromkeys(food_ids):
+            cached = _cache_get(_system_food_cache, food_id)
+            if cached is not None:
+                foods[food_id] = dict(cached)
+            else:
+                missing.append(food_id)
+
+        if not missing:
+            return foods
+
+        try:
+            query = (
+                self.supabase.table("foods")
+                .select(_SYSTEM_FOOD_DETAIL_COLUMNS)
+                .in_("id", missing)
+                .eq("verified", True)
+            )
+            response = await asyncio.to_thread(query.execute)
+
+            for food in response.data or []:
+                result = self._format_system_food_details(food)
+                _cache_put(
+                    _system_food_cache,
+                    result["id"],
+                    result,
+                    SYSTEM_FOOD_CACHE_TTL_SECONDS,
+                )
+                foods[result["id"]] = dict(result)
+
+            return foods
+
+        except Exception as e:
+            logger.error("Get foods by IDs error: %s", e)
+            raise
+
+    async def get_user_foods_by_ids(
+        self, user_food_ids: List[str], user_id: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many of a user's custom foods by ID in at most one query.
+
+        Ids that aren't found (or belong to another user) are omitted.
+
+        Returns:
+            Map of user food id -> formatted food
+        """
+        user_food_ids = list(dict.fromkeys(user_food_ids))
+        if not user_food_ids:
+            return {}
+
+        try:
+            query = (
+                self.supabase.table("user_foods")
+                .select(_USER_FOOD_DETAIL_COLUMNS)
+                .in_("id", user_food_ids)
+                .eq("user_id", user_id)
+            )
+            response = await asyncio.to_thread(query.execute)
+
+            return {
+                food["id"]: self._format_user_food_details(food)
+                for food in response.data or []
+            }
+
+        except Exception as e:
+            logger.error("Get user foods by IDs error: %s", e)
+            raise
@@ -5,8 +5,8 @@ Handles all nutrition calculations, unit conversions, aggregations,
 and goal comparisons.
 """
 
+import re
 from typing import List, Dict, Any, Optional, Tuple
-from decimal import Decimal
 from datetime import date, timedelta
 import logging
 
@@ -29,12 +29,42 @@ MAX_DAILY_CALORIES = 10000  # Maximum realistic daily calories
 MIN_MACRO_PERCENTAGE = 0  # Minimum percentage for a macro
 MAX_MACRO_PERCENTAGE = 100  # Maximum percentage for a macro
 
+# Nutrition fields aggregated per meal (column order for columnar helpers)
+NUTRITION_FIELDS = (
+    "calories",
+    "protein_g",
+    "carbs_g",
+    "fat_g",
+    "fiber_g",
+    "sugar_g",
+    "sodium_mg",
+)
+
 
 # =====================================================
 # CORE CALCULATION FUNCTIONS
 # =====================================================
 
 
+def _macro_calories(
+    protein_g: float, carbs_g: float, fat_g: float
+) -> Tuple[float, float, float]:
+    """Calories contributed by protein, carbs and fat (validated, unrounded)."""
+    # Callers may pass Decimals from Pydantic models; do the math in float
+    protein_g = float(protein_g)
+    carbs_g = float(carbs_g)
+    fat_g = float(fat_g)
+
+    if protein_g < 0 or carbs_g < 0 or fat_g < 0:
+        raise ValueError("Macro values cannot be negative")
+
+    return (
+        protein_g * PROTEIN_CAL_PER_G,
+        carbs_g * CARBS_CAL_PER_G,
+        fat_g * FAT_CAL_PER_G,
+    )
+
+
 def calculate_calories_from_macros(
     protein_g: float, carbs_g: float, fat_g: float
 ) -> float:
@@ -51,14 +81,11 @@ def calculate_calories_from_macros(
     Returns:
         Total calories (rounded to 2 decimals)
     """
-    if protein_g < 0 or carbs_g < 0 or fat_g < 0:
-        raise ValueError("Macro values cannot be negative")
-
-    calories = (protein_g * PROTEIN_CAL_PER_G) + (carbs_g * CARBS_CAL_PER_G) + (
-        fat_g * FAT_CAL_PER_G
+    protein_calories, carbs_calories, fat_calories = _macro_calories(
+        protein_g, carbs_g, fat_g
     )
 
-    return round(calories, 2)
+    return round(protein_calories + carbs_calories + fat_calories, 2)
 
 
 def validate_calorie_calculation(
@@ -81,7 +108,7 @@ def validate_calorie_calculation(
     if calculated_calories == 0:
         return (True, 0.0, "No macros provided")
 
-    discrepancy = abs(provided_calories - calculated_calories)
+    discrepancy = abs(float(provided_calories) - calculated_calories)
     discrepancy_percent = (discrepancy / calculated_calories) * 100
 
     is_valid = discrepancy_percent <= CALORIE_TOLERANCE_PERCENT
@@ -112,15 +139,15 @@ def calculate_macro_percentages(
     Returns:
         Dictionary with percentages: {protein_pct, carbs_pct, fat_pct}
     """
-    total_calories = calculate_calories_from_macros(protein_g, carbs_g, fat_g)
+    # Per-macro calories are computed once and reused for the total
+    protein_calories, carbs_calories, fat_calories = _macro_calories(
+        protein_g, carbs_g, fat_g
+    )
+    total_calories = round(protein_calories + carbs_calories + fat_calories, 2)
 
     if total_calories == 0:
         return {"protein_pct": 0.0, "carbs_pct": 0.0, "fat_pct": 0.0}
 
-    protein_calories = protein_g * PROTEIN_CAL_PER_G
-    carbs_calories = carbs_g * CARBS_CAL_PER_G
-    fat_calories = fat_g * FAT_CAL_PER_G
-
     return {
         "protein_pct": round((protein_calories / total_calories) * 100, 1),
         "carbs_pct": round((carbs_calories / total_calories) * 100, 1),
@@ -133,10 +160,48 @@ def calculate_macro_percentages(
 # =====================================================
 
 
+# Fixed-weight unit aliases -> grams per unit
+_UNIT_TO_GRAMS: Dict[str, float] = {
+    # Weight units
+    "g": 1,
+    "grams": 1,
+    "gramos": 1,
+    "gr": 1,
+    "kg": 1000,
+    "kilograms": 1000,
+    "kilogramos": 1000,
+    "oz": 28.35,
+    "ounces": 28.35,
+    "onzas": 28.35,
+    "lb": 453.592,
+    "lbs": 453.592,
+    "pounds": 453.592,
+    "libras": 453.592,
+    # Spoon measurements
+    "tbsp": 15,
+    "tablespoon": 15,
+    "cucharada": 15,
+    "cucharadas": 15,
+    "tsp": 5,
+    "teaspoon": 5,
+    "cucharadita": 5,
+    "cucharaditas": 5,
+}
+
+# Unit aliases measured in servings of the food (serving_size_g each)
+_SERVING_UNITS = frozenset({
+    "cup", "taza", "cups", "tazas",
+    "piece", "pieza", "pieces", "piezas", "unidad", "unidades",
+    "serving", "porción", "porciones", "servings",
+})
+
+
 def convert_to_grams(quantity: float, unit: str, serving_size_g: float = 100) -> float:
     """
     Convert various units to grams.
 
+    Units may also be free text; the first known unit in it is used.
+
     Supported units:
     - g, grams, gramos
     - kg, kilograms, kilogramos
@@ -158,34 +223,65 @@ def convert_to_grams(quantity: float, unit: str, serving_size_g: float = 100) ->
     """
     unit_lower = unit.lower().strip()
 
-    # Weight units
-    if unit_lower in ["g", "grams", "gramos", "gr"]:
-        return quantity
-    elif unit_lower in ["kg", "kilograms", "kilogramos"]:
-        return quantity * 1000
-    elif unit_lower in ["oz", "ounces", "onzas"]:
-        return quantity * 28.35
-    elif unit_lower in ["lb", "lbs", "pounds", "libras"]:
-        return quantity * 453.592
+    multiplier = _UNIT_TO_GRAMS.get(unit_lower)
+    if multiplier is not None:
+        return quantity * multiplier
 
     # Volume/serving units (use serving_size_g)
-    elif unit_lower in ["cup", "taza", "cups", "tazas"]:
-        return quantity * serving_size_g
-    elif unit_lower in ["piece", "pieza", "pieces", "piezas", "unidad", "unidades"]:
-        return quantity * serving_size_g
-    elif unit_lower in ["serving", "porción", "porciones", "servings"]:
+    if unit_lower in _SERVING_UNITS:
         return quantity * serving_size_g
 
-    # Spoon measurements
-    elif unit_lower in ["tbsp", "tablespoon", "cucharada", "cucharadas"]:
-        return quantity * 15
-    elif unit_lower in ["tsp", "teaspoon", "cucharadita", "cucharaditas"]:
-        return quantity * 5
+    # Free-text unit ("cucharadas de aceite"): use the first known unit in it
+    _, parsed_unit = parse_quantity_unit(unit_lower)
+    if parsed_unit is not None:
+        return convert_to_grams(quantity, parsed_unit, serving_size_g)
+
+    # Default: assume grams
+    logger.warning(f"Unknown unit '{unit}', assuming grams")
+    return quantity
+
+
+# Any known unit alias not embedded in a longer word (digits may touch it,
+# as in "150g"), longest first so e.g. "cups" wins over "cup"; compiled once
+# and matched in a single scan of the text
+_UNIT_PATTERN = re.compile(
+    r"(?<![^\W\d])("
+    + "|".join(
+        re.escape(alias)
+        for alias in sorted(
+            [*_UNIT_TO_GRAMS, *_SERVING_UNITS], key=len, reverse=True
+        )
+    )
+    + r")(?![^\W\d])",
+    re.IGNORECASE,
+)
+_QUANTITY_PATTERN = re.compile(r"^\s*(\d+(?:[.,]\d+)?)")
 
-    else:
-        # Default: assume grams
-        logger.warning(f"Unknown unit '{unit}', assuming grams")
-        return quantity
+
+def parse_quantity_unit(text: str) -> Tuple[Optional[float], Optional[str]]:
+    """
+    Extract a leading quantity and the first known unit from free text.
+
+    Example: "2 cucharadas de aceite" -> (2.0, "cucharadas")
+
+    Args:
+        text: Free-text amount, e.g. "150 g de pollo" or "1,5 tazas"
+
+    Returns:
+        Tuple of (quantity or None, lowercase unit alias or None); the unit
+        can be passed straight to convert_to_grams
+    """
+    quantity_match = _QUANTITY_PATTERN.match(text)
+    quantity = (
+        float(quantity_match.group(1).replace(",", "."))
+        if quantity_match
+        else None
+    )
+
+    unit_match = _UNIT_PATTERN.search(text)
+    unit = unit_match.group(1).lower() if unit_match else None
+
+    return (quantity, unit)
 
 
 def scale_nutrition(
@@ -202,16 +298,12 @@ def scale_nutrition(
     Returns:
         Scaled nutrition values
     """
-    scale_factor = actual_quantity_g / base_quantity_g
+    scale_factor = float(actual_quantity_g) / float(base_quantity_g)
+    get = base_nutrition.get
 
     return {
-        "calories": round(base_nutrition.get("calories", 0) * scale_factor, 2),
-        "protein_g": round(base_nutrition.get("protein_g", 0) * scale_factor, 2),
-        "carbs_g": round(base_nutrition.get("carbs_g", 0) * scale_factor, 2),
-        "fat_g": round(base_nutrition.get("fat_g", 0) * scale_factor, 2),
-        "fiber_g": round(base_nutrition.get("fiber_g", 0) * scale_factor, 2),
-        "sugar_g": round(base_nutrition.get("sugar_g", 0) * scale_factor, 2),
-        "sodium_mg": round(base_nutrition.get("sodium_mg", 0) * scale_factor, 2),
+        field: round(float(get(field, 0)) * scale_factor, 2)
+        for field in NUTRITION_FIELDS
     }
 
 
@@ -220,6 +312,22 @@ def scale_nutrition(
 # =====================================================
 
 
+def _items_to_columns(meal_items: List[Dict[str, Any]]) -> List[Tuple[float, ...]]:
+    """
+    Transpose meal items into one column of floats per nutrition field.
+
+    Columns follow NUTRITION_FIELDS order; missing fields count as 0.
+    """
+    if not meal_items:
+        return [() for _ in NUTRITION_FIELDS]
+
+    rows = [
+        tuple(float(item.get(field, 0)) for field in NUTRITION_FIELDS)
+        for item in meal_items
+    ]
+    return list(zip(*rows))
+
+
 def aggregate_meal_nutrition(meal_items: List[Dict[str, Any]]) -> Dict[str, float]:
     """
     Aggregate nutrition from multiple food items in a meal.
@@ -231,27 +339,13 @@ def aggregate_meal_nutrition(meal_items: List[Dict[str, Any]]) -> Dict[str, floa
     Returns:
         Aggregated nutrition totals
     """
-    totals = {
-        "calories": 0.0,
-        "protein_g": 0.0,
-        "carbs_g": 0.0,
-        "fat_g": 0.0,
-        "fiber_g": 0.0,
-        "sugar_g": 0.0,
-        "sodium_mg": 0.0,
-    }
-
-    for item in meal_items:
-        totals["calories"] += float(item.get("calories", 0))
-        totals["protein_g"] += float(item.get("protein_g", 0))
-        totals["carbs_g"] += float(item.get("carbs_g", 0))
-        totals["fat_g"] += float(item.get("fat_g", 0))
-        totals["fiber_g"] += float(item.get("fiber_g", 0))
-        totals["sugar_g"] += float(item.get("sugar_g", 0))
-        totals["sodium_mg"] += float(item.get("sodium_mg", 0))
+    columns = _items_to_columns(meal_items)
 
-    # Round all values
-    return {key: round(value, 2) for key, value in totals.items()}
+    # Sum each column and round all values
+    return {
+        field: round(sum(column, 0.0), 2)
+        for field, column in zip(NUTRITION_FIELDS, columns)
+    }
 
 
 def validate_meal_totals(totals: Dict[str, float]) -> Tuple[bool, List[str]]:
@@ -371,10 +465,13 @@ def calculate_weekly_average(
     daily_summaries: List[Dict[str, Any]]
 ) -> Dict[str, float]:
     """
-    Calculate weekly average nutrition from daily summaries.
+    Calculate average daily nutrition from daily summaries.
+
+    Works for any window (7, 30, 90 days...); days without totals count
+    towards the number of days but contribute nothing.
 
     Args:
-        daily_summaries: List of daily summaries (up to 7 days)
+        daily_summaries: List of daily summaries (usually 7 days)
 
     Returns:
         Weekly averages
@@ -389,18 +486,16 @@ def calculate_weekly_average(
 
     num_days = len(daily_summaries)
 
-    total_calories = sum(
-        day["totals"]["calories"] for day in daily_summaries if "totals" in day
-    )
-    total_protein = sum(
-        day["totals"]["protein_g"] for day in daily_summaries if "totals" in day
-    )
-    total_carbs = sum(
-        day["totals"]["carbs_g"] for day in daily_summaries if "totals" in day
-    )
-    total_fat = sum(
-        day["totals"]["fat_g"] for day in daily_summaries if "totals" in day
-    )
+    # Accumulate all four totals in a single pass
+    total_calories = total_protein = total_carbs = total_fat = 0.0
+    for day in daily_summaries:
+        if "totals" not in day:
+            continue
+        totals = day["totals"]
+        total_calories += totals["calories"]
+        total_protein += totals["protein_g"]
+        total_carbs += totals["carbs_g"]
+        total_fat += totals["fat_g"]
 
     return {
         "avg_calories": round(total_calories / num_days, 2),
@@ -531,6 +626,37 @@ class MacroCalculationService:
             actual_quantity_g=quantity_g,
         )
 
+    @staticmethod
+    def calculate_food_nutrition_for_quantity_batch(
+        foods: List[Dict[str, Any]], quantities_g: List[float]
+    ) -> List[Dict[str, float]]:
+        """
+        Calculate nutrition for many foods, each with its quantity in grams.
+
+        Same results as calling calculate_food_nutrition_for_quantity with
+        unit "g" for every pair, without the per-food unit conversion and
+        intermediate dicts.
+
+        Args:
+            foods: Foods with nutrition per 100g
+            quantities_g: Grams consumed, one per food
+
+        Returns:
+            Scaled nutrition values, in the order of foods
+        """
+        if len(foods) != len(quantities_g):
+            raise ValueError("foods and quantities_g must have the same length")
+
+        results = []
+        for food, quantity_g in zip(foods, quantities_g):
+            scale_factor = float(quantity_g) / 100.0  # Nutrition data is per 100g
+            get = food.get
+            results.append({
+                field: round(float(get(field, 0)) * scale_factor, 2)
+                for field in NUTRITION_FIELDS
+            })
+        return results
+
     @staticmethod
     def get_daily_summary(
         meal_entries: List[Dict[str, Any]], goals: Dict[str, float]
@@ -9,25 +9,98 @@ This service handles:
 - Integration with food database and macro service
 """
 
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
 from datetime import date, datetime, timedelta
 from datetime import time as time_type
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple, Any
+from math import fsum
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
 from uuid import UUID
 
-from supabase import Client
-
+from app.services.daily_summary_service import invalidate_daily_summary
+from app.services.food_service import FoodSearchService
 from app.services.macro_service import (
     calculate_calories_from_macros,
     validate_calorie_calculation,
     MacroCalculationService
 )
 
+if TYPE_CHECKING:
+    # Only needed for the constructor annotation
+    from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+# MacroCalculationService only has static methods; use the class directly
+# instead of instantiating it per service
+_MACRO = MacroCalculationService
+
+# PostgREST error code for an unknown RPC (migration 012 not applied)
+_RPC_NOT_FOUND_CODE = "PGRST202"
+
+# Message raised by the validate_meal_entry_calories trigger (migration 001)
+_CALORIE_MISMATCH_ERROR = "Calorie calculation mismatch"
+
+# Whether the get_daily_meals RPC can be used (flipped off once if missing)
+_daily_meals_rpc_available = True
+
+# Entry fields covered by the calorie validation
+_NUTRITION_KEYS = frozenset({"calories", "protein_g", "carbs_g", "fat_g"})
+
+# Fields summed by _calculate_summary, fetched per entry in one C-level call
+_summary_fields = itemgetter("calories", "protein_g", "carbs_g", "fat_g")
+
+# Process-local cache of list_meal_entries totals, keyed by
+# (user_id, start_date, end_date, meal_type). Page 1 always counts; later
+# pages reuse the cached total so paging doesn't re-run COUNT(*).
+ENTRY_COUNT_CACHE_TTL_SECONDS = 60
+ENTRY_COUNT_CACHE_MAX_SIZE = 10_000
+
+_entry_count_cache: Dict[
+    Tuple[str, Optional[date], Optional[date], Optional[str]], Tuple[float, int]
+] = {}
+
+
+def invalidate_entry_counts(user_id: UUID) -> None:
+    """Drop cached meal entry totals for a user (call after meal entry writes)."""
+    user_key = str(user_id)
+    stale = [key for key in _entry_count_cache if key[0] == user_key]
+    for key in stale:
+        del _entry_count_cache[key]
+
+
+def _meal_entries_changed(user_id: UUID, meal_date: Optional[date] = None) -> None:
+    """Invalidate the caches that depend on a user's meal entries."""
+    invalidate_daily_summary(user_id, meal_date)
+    invalidate_entry_counts(user_id)
+
 
 # =====================================================
 # MEAL TYPE CLASSIFICATION
 # =====================================================
 
+# (meal_type, confidence, reason label) for each hour of the day, 0-23.
+# Core times get high confidence, the hours around them medium confidence,
+# and everything else is a snack.
+_OUTSIDE_MEALS = ("snack", 0.90, "Outside main meal times")
+_HOUR_TABLE: Tuple[Tuple[str, float, str], ...] = (
+    *[_OUTSIDE_MEALS] * 5,                                 # 00-04
+    *[("breakfast", 0.75, "Early breakfast")] * 2,         # 05-06
+    *[("breakfast", 0.95, "Typical breakfast time")] * 4,  # 07-10
+    ("lunch", 0.75, "Early lunch"),                        # 11
+    *[("lunch", 0.95, "Typical lunch time")] * 3,          # 12-14
+    ("lunch", 0.70, "Late lunch"),                         # 15
+    *[("dinner", 0.70, "Early dinner")] * 2,               # 16-17
+    *[("dinner", 0.95, "Typical dinner time")] * 3,        # 18-20
+    ("dinner", 0.70, "Late dinner"),                       # 21
+    *[_OUTSIDE_MEALS] * 2,                                 # 22-23
+)
+
+
 def classify_meal_type_by_time(meal_time: time_type) -> Tuple[str, float, str]:
     """
     Automatically classify meal type based on time of day.
@@ -44,44 +117,41 @@ def classify_meal_type_by_time(meal_time: time_type) -> Tuple[str, float, str]:
     Returns:
         Tuple of (meal_type, confidence, reason)
     """
-    hour = meal_time.hour
-
-    # Core time ranges with high confidence
-    if 7 <= hour <= 10:
-        return ("breakfast", 0.95, f"Typical breakfast time ({meal_time.strftime('%H:%M')})")
-    elif 12 <= hour <= 14:
-        return ("lunch", 0.95, f"Typical lunch time ({meal_time.strftime('%H:%M')})")
-    elif 18 <= hour <= 20:
-        return ("dinner", 0.95, f"Typical dinner time ({meal_time.strftime('%H:%M')})")
-
-    # Extended ranges with medium confidence
-    elif 5 <= hour < 7:
-        return ("breakfast", 0.75, f"Early breakfast ({meal_time.strftime('%H:%M')})")
-    elif 11 <= hour < 12:
-        return ("lunch", 0.75, f"Early lunch ({meal_time.strftime('%H:%M')})")
-    elif 15 <= hour < 16:
-        return ("lunch", 0.70, f"Late lunch ({meal_time.strftime('%H:%M')})")
-    elif 16 <= hour < 18:
-        return ("dinner", 0.70, f"Early dinner ({meal_time.strftime('%H:%M')})")
-    elif 21 <= hour < 22:
-        return ("dinner", 0.70, f"Late dinner ({meal_time.strftime('%H:%M')})")
-
-    # Everything else is a snack
-    else:
-        return ("snack", 0.90, f"Outside main meal times ({meal_time.strftime('%H:%M')})")
-
-
-def validate_meal_date(meal_date: date) -> Tuple[bool, str]:
+    meal_type, confidence, label = _HOUR_TABLE[meal_time.hour]
+    return (meal_type, confidence, f"{label} ({meal_time.strftime('%H:%M')})")
+
+
+def classify_meal_type_fast(meal_time: time_type) -> str:
+    """
+    Classify meal type by time of day, returning only the meal type.
+
+    Same ranges as classify_meal_type_by_time, without building the
+    confidence/reason tuple. Used when creating entries, which only store
+    the meal type.
+
+    Args:
+        meal_time: Time of the meal
+
+    Returns:
+        Meal type
+    """
+    return _HOUR_TABLE[meal_time.hour][0]
+
+
+def validate_meal_date(meal_date: date, today: date = None) -> Tuple[bool, str]:
     """
     Validate that meal date is not in the future.
 
     Args:
         meal_date: Date to validate
+        today: Current date (defaults to date.today(); pass it in when
+            validating many entries at once)
 
     Returns:
         Tuple of (is_valid, message)
     """
-    today = date.today()
+    if today is None:
+        today = date.today()
 
     if meal_date > today:
         return (False, f"Cannot log meals in the future. Date provided: {meal_date}, Today: {today}")
@@ -94,6 +164,49 @@ def validate_meal_date(meal_date: date) -> Tuple[bool, str]:
     return (True, "Date is valid")
 
 
+@dataclass(slots=True)
+class MealEntryInsert:
+    """A meal_entries row as sent to the database on insert."""
+
+    user_id: str
+    food_name: str
+    date: str
+    time: str
+    meal_type: str
+    quantity_g: float
+    calories: int
+    protein_g: float
+    carbs_g: float
+    fat_g: float
+    logged_via: str
+    original_input: Optional[str]
+    food_id: Optional[str] = None
+    user_food_id: Optional[str] = None
+
+    def to_row(self) -> Dict[str, Any]:
+        """Serialize for the insert payload."""
+        return asdict(self)
+
+
+def _food_ref(food_id: Any, user_food_id: Any) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Validate a food reference and return it as (food_id, user_food_id) strings.
+
+    Exactly one of the ids must be given; the other comes back as None.
+
+    Raises:
+        ValueError: If neither or both ids are given
+    """
+    if not food_id and not user_food_id:
+        raise ValueError("Either food_id or user_food_id must be provided")
+    if food_id and user_food_id:
+        raise ValueError("Cannot provide both food_id and user_food_id")
+    return (
+        str(food_id) if food_id else None,
+        str(user_food_id) if user_food_id else None
+    )
+
+
 # =====================================================
 # MEAL ENTRY SERVICE
 # =====================================================
@@ -101,7 +214,7 @@ def validate_meal_date(meal_date: date) -> Tuple[bool, str]:
 class MealEntryService:
     """Service for managing meal entries."""
 
-    def __init__(self, supabase_client: Client):
+    def __init__(self, supabase_client: "Client"):
         """
         Initialize meal entry service.
 
@@ -109,7 +222,7 @@ class MealEntryService:
             supabase_client: Supabase client instance
         """
         self.supabase = supabase_client
-        self.macro_service = MacroCalculationService()
+        self.food_service = FoodSearchService(supabase_client)
 
     # =====================================================
     # CREATE MEAL ENTRIES
@@ -128,7 +241,8 @@ class MealEntryService:
         meal_time: time_type = None,
         meal_type: str = None,
         logged_via: str = "manual",
-        original_input: str = None
+        original_input: str = None,
+        today: date = None
     ) -> Dict[str, Any]:
         """
         Create meal entry manually with all nutrition data.
@@ -146,6 +260,7 @@ class MealEntryService:
             meal_type: Type (auto-classified if not provided)
             logged_via: How it was logged
             original_input: Original user input
+            today: Current date (defaults to date.today())
 
         Returns:
             Created meal entry
@@ -154,44 +269,55 @@ class MealEntryService:
             ValueError: If validation fails
         """
         # Default values
+        if today is None:
+            today = date.today()
         if meal_date is None:
-            meal_date = date.today()
+            meal_date = today
         if meal_time is None:
             meal_time = datetime.now().time()
 
         # Validate date
-        is_valid, message = validate_meal_date(meal_date)
+        is_valid, message = validate_meal_date(meal_date, today)
         if not is_valid:
             raise ValueError(message)
 
         # Auto-classify meal type if not provided
         if meal_type is None:
-            meal_type, confidence, reason = classify_meal_type_by_time(meal_time)
+            meal_type = classify_meal_type_fast(meal_time)
 
-        # Validate nutrition
+        # Request values arrive as Decimal; convert once and use the floats
+        # for both validation and the insert
+        protein_g = float(protein_g)
+        carbs_g = float(carbs_g)
+        fat_g = float(fat_g)
+
+        # Validate nutrition. The validate_meal_entry_calories trigger enforces
+        # the same tolerance on insert; checking here first only turns a bad
+        # entry into a clear validation error without a database round-trip.
         is_valid, discrepancy, msg = validate_calorie_calculation(
-            float(calories), float(protein_g), float(carbs_g), float(fat_g)
+            float(calories), protein_g, carbs_g, fat_g
         )
         if not is_valid:
             raise ValueError(f"Calorie validation failed: {msg}")
 
         # Insert into database
-        entry_data = {
-            "user_id": str(user_id),
-            "food_name": food_name,
-            "date": str(meal_date),
-            "time": meal_time.strftime("%H:%M:%S"),
-            "meal_type": meal_type,
-            "quantity_g": float(quantity_g),
-            "calories": calories,
-            "protein_g": float(protein_g),
-            "carbs_g": float(carbs_g),
-            "fat_g": float(fat_g),
-            "logged_via": logged_via,
-            "original_input": original_input
-        }
+        entry = MealEntryInsert(
+            user_id=str(user_id),
+            food_name=food_name,
+            date=str(meal_date),
+            time=meal_time.isoformat(timespec="seconds"),
+            meal_type=meal_type,
+            quantity_g=float(quantity_g),
+            calories=calories,
+            protein_g=protein_g,
+            carbs_g=carbs_g,
+            fat_g=fat_g,
+            logged_via=logged_via,
+            original_input=original_input
+        )
 
-        response = self.supabase.table("meal_entries").insert(entry_data).execute()
+        response = self.supabase.table("meal_entries").insert(entry.to_row()).execute()
+        _meal_entries_changed(user_id, meal_date)
 
         return response.data[0] if response.data else None
 
@@ -205,7 +331,8 @@ class MealEntryService:
         meal_time: time_type = None,
         meal_type: str = None,
         logged_via: str = "manual",
-        original_input: str = None
+        original_input: str = None,
+        today: date = None
     ) -> Dict[str, Any]:
         """
         Create meal entry from existing food in database.
@@ -221,6 +348,7 @@ class MealEntryService:
             meal_type: Type (auto-classified if not provided)
             logged_via: How it was logged
             original_input: Original user input
+            today: Current date (defaults to date.today())
 
         Returns:
             Created meal entry
@@ -229,36 +357,26 @@ class MealEntryService:
             ValueError: If validation fails or food not found
         """
         # Validate food reference
-        if not food_id and not user_food_id:
-            raise ValueError("Either food_id or user_food_id must be provided")
-        if food_id and user_food_id:
-            raise ValueError("Cannot provide both food_id and user_food_id")
+        ref = _food_ref(food_id, user_food_id)
 
         # Default values
+        if today is None:
+            today = date.today()
         if meal_date is None:
-            meal_date = date.today()
+            meal_date = today
         if meal_time is None:
             meal_time = datetime.now().time()
 
         # Validate date
-        is_valid, message = validate_meal_date(meal_date)
+        is_valid, message = validate_meal_date(meal_date, today)
         if not is_valid:
             raise ValueError(message)
 
         # Fetch food data from database
-        if food_id:
-            response = self.supabase.table("foods").select("*").eq("id", str(food_id)).execute()
-            if not response.data:
-                raise ValueError(f"Food not found: {food_id}")
-            food = response.data[0]
-        else:
-            response = self.supabase.table("user_foods").select("*").eq("id", str(user_food_id)).execute()
-            if not response.data:
-                raise ValueError(f"User food not found: {user_food_id}")
-            food = response.data[0]
+        [food] = await self._get_foods_for_refs(str(user_id), [ref])
 
         # Calculate nutrition for quantity
-        nutrition = self.macro_service.calculate_food_nutrition_for_quantity(
+        nutrition = _MACRO.calculate_food_nutrition_for_quantity(
             food=food,
             quantity=float(quantity_g),
             unit="g"
@@ -266,30 +384,157 @@ class MealEntryService:
 
         # Auto-classify meal type if not provided
         if meal_type is None:
-            meal_type, confidence, reason = classify_meal_type_by_time(meal_time)
+            meal_type = classify_meal_type_fast(meal_time)
 
         # Insert into database
-        entry_data = {
-            "user_id": str(user_id),
-            "food_id": str(food_id) if food_id else None,
-            "user_food_id": str(user_food_id) if user_food_id else None,
-            "food_name": food["name"],
-            "date": str(meal_date),
-            "time": meal_time.strftime("%H:%M:%S"),
-            "meal_type": meal_type,
-            "quantity_g": float(quantity_g),
-            "calories": int(nutrition["calories"]),
-            "protein_g": nutrition["protein_g"],
-            "carbs_g": nutrition["carbs_g"],
-            "fat_g": nutrition["fat_g"],
-            "logged_via": logged_via,
-            "original_input": original_input
-        }
+        entry = MealEntryInsert(
+            user_id=str(user_id),
+            food_id=ref[0],
+            user_food_id=ref[1],
+            food_name=food["name"],
+            date=str(meal_date),
+            time=meal_time.isoformat(timespec="seconds"),
+            meal_type=meal_type,
+            quantity_g=float(quantity_g),
+            calories=int(nutrition["calories"]),
+            protein_g=nutrition["protein_g"],
+            carbs_g=nutrition["carbs_g"],
+            fat_g=nutrition["fat_g"],
+            logged_via=logged_via,
+            original_input=original_input
+        )
 
-        response = self.supabase.table("meal_entries").insert(entry_data).execute()
+        response = self.supabase.table("meal_entries").insert(entry.to_row()).execute()
+        _meal_entries_changed(user_id, meal_date)
 
         return response.data[0] if response.data else None
 
+    async def create_meal_entries_bulk(
+        self,
+        user_id: UUID,
+        items: List[Dict[str, Any]],
+        meal_date: date = None,
+        meal_time: time_type = None,
+        meal_type: str = None,
+        original_input: str = None,
+        today: date = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several meal entries from foods in the database at once.
+
+        Batch counterpart of create_meal_entry_from_food: all foods are
+        fetched with one query per table and all entries are inserted in a
+        single request, so either every entry is created or none is.
+
+        Args:
+            user_id: User ID
+            items: Dicts with food_id or user_food_id, quantity_g and
+                optionally logged_via
+            meal_date: Date shared by all entries (defaults to today)
+            meal_time: Time shared by all entries (defaults to now)
+            meal_type: Type (auto-classified if not provided)
+            original_input: Original user input
+            today: Current date (defaults to date.today())
+
+        Returns:
+            Created meal entries, in the order of items
+
+        Raises:
+            ValueError: If validation fails or a food is not found
+        """
+        # Validate food references, converting each id to str only once;
+        # the strings serve both the lookups and the inserted rows
+        refs = [_food_ref(item.get("food_id"), item.get("user_food_id")) for item in items]
+
+        # Default values
+        if today is None:
+            today = date.today()
+        if meal_date is None:
+            meal_date = today
+        if meal_time is None:
+            meal_time = datetime.now().time()
+
+        # Validate date
+        is_valid, message = validate_meal_date(meal_date, today)
+        if not is_valid:
+            raise ValueError(message)
+
+        # Auto-classify meal type if not provided
+        if meal_type is None:
+            meal_type = classify_meal_type_fast(meal_time)
+
+        # Fetch all referenced foods, then scale their nutrition in one batch
+        user_id_str = str(user_id)
+        resolved = await self._get_foods_for_refs(user_id_str, refs)
+        quantities = [float(item.get("quantity_g", 100)) for item in items]
+
+        nutritions = _MACRO.calculate_food_nutrition_for_quantity_batch(
+            resolved, quantities
+        )
+
+        # Build every row before inserting
+        date_str = str(meal_date)
+        time_str = meal_time.isoformat(timespec="seconds")
+        rows = []
+        for item, (food_id, user_food_id), food, quantity_g, nutrition in zip(
+            items, refs, resolved, quantities, nutritions
+        ):
+            rows.append(MealEntryInsert(
+                user_id=user_id_str,
+                food_id=food_id,
+                user_food_id=user_food_id,
+                food_name=food["name"],
+                date=date_str,
+                time=time_str,
+                meal_type=meal_type,
+                quantity_g=quantity_g,
+                calories=int(nutrition["calories"]),
+                protein_g=nutrition["protein_g"],
+                carbs_g=nutrition["carbs_g"],
+                fat_g=nutrition["fat_g"],
+                logged_via=item.get("logged_via") or "manual",
+                original_input=original_input
+            ).to_row())
+
+        if not rows:
+            return []
+
+        response = self.supabase.table("meal_entries").insert(rows).execute()
+        _meal_entries_changed(user_id, meal_date)
+
+        return response.data or []
+
+    async def _get_foods_for_refs(
+        self,
+        user_id: str,
+        refs: List[Tuple[Optional[str], Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the foods referenced by (food_id, user_food_id) pairs, in order.
+
+        Uses at most one query per table however many refs there are.
+
+        Raises:
+            ValueError: If a referenced food is not found
+        """
+        foods, user_foods = await asyncio.gather(
+            self.food_service.get_foods_by_ids([f for f, _ in refs if f]),
+            self.food_service.get_user_foods_by_ids([u for _, u in refs if u], user_id)
+        )
+
+        resolved = []
+        for food_id, user_food_id in refs:
+            if food_id:
+                food = foods.get(food_id)
+                if food is None:
+                    raise ValueError(f"Food not found: {food_id}")
+            else:
+                food = user_foods.get(user_food_id)
+                if food is None:
+                    raise ValueError(f"User food not found: {user_food_id}")
+            resolved.append(food)
+        return resolved
+
     # =====================================================
     # READ MEAL ENTRIES
     # =====================================================
@@ -332,7 +577,25 @@ class MealEntryService:
         Returns:
             Daily summary with meals grouped by type
         """
-        # Fetch all entries for the day
+        daily = self._get_daily_meals_rpc(user_id, target_date)
+        if daily is not None:
+            summary = daily["summary"]
+            return {
+                "date": target_date,
+                "breakfast": daily["breakfast"],
+                "lunch": daily["lunch"],
+                "dinner": daily["dinner"],
+                "snacks": daily["snacks"],
+                "summary": self._summary_from_totals(
+                    summary["total_entries"],
+                    summary["total_calories"],
+                    float(summary["total_protein_g"]),
+                    float(summary["total_carbs_g"]),
+                    float(summary["total_fat_g"])
+                )
+            }
+
+        # Fallback: fetch all entries for the day
         response = self.supabase.table("meal_entries")\
             .select("*")\
             .eq("user_id", str(user_id))\
@@ -342,11 +605,18 @@ class MealEntryService:
 
         entries = response.data or []
 
-        # Group by meal type
-        breakfast = [e for e in entries if e.get("meal_type") == "breakfast"]
-        lunch = [e for e in entries if e.get("meal_type") == "lunch"]
-        dinner = [e for e in entries if e.get("meal_type") == "dinner"]
-        snacks = [e for e in entries if e.get("meal_type") == "snack"]
+        # Group by meal type in one pass (unknown types are left out)
+        breakfast, lunch, dinner, snacks = [], [], [], []
+        buckets = {
+            "breakfast": breakfast,
+            "lunch": lunch,
+            "dinner": dinner,
+            "snack": snacks
+        }
+        for e in entries:
+            bucket = buckets.get(e.get("meal_type"))
+            if bucket is not None:
+                bucket.append(e)
 
         # Calculate summary
         summary = self._calculate_summary(entries)
@@ -360,6 +630,36 @@ class MealEntryService:
             "summary": summary
         }
 
+    def _get_daily_meals_rpc(
+        self,
+        user_id: UUID,
+        target_date: date
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the day's grouped meals and totals via the get_daily_meals RPC.
+
+        Returns None when the RPC can't be used so the caller falls back to
+        grouping and summing in Python.
+        """
+        global _daily_meals_rpc_available
+        if not _daily_meals_rpc_available:
+            return None
+
+        try:
+            response = self.supabase.rpc(
+                "get_daily_meals",
+                {"p_user_id": str(user_id), "p_date": str(target_date)}
+            ).execute()
+        except Exception as e:
+            if _RPC_NOT_FOUND_CODE in str(e):
+                _daily_meals_rpc_available = False
+                logger.warning("get_daily_meals RPC not found, grouping meals in Python")
+            else:
+                logger.error("Daily meals RPC error: %s", e)
+            return None
+
+        return response.data or None
+
     async def list_meal_entries(
         self,
         user_id: UUID,
@@ -383,7 +683,22 @@ class MealEntryService:
         Returns:
             Tuple of (entries, total_count)
         """
-        query = self.supabase.table("meal_entries").select("*", count="exact").eq("user_id", str(user_id))
+        cache_key = (str(user_id), start_date, end_date, meal_type)
+
+        # Only count on page 1 or when the total for these filters isn't cached
+        total_count = None
+        if page > 1:
+            cached = _entry_count_cache.get(cache_key)
+            if cached is not None:
+                expires_at, count = cached
+                if expires_at > time.monotonic():
+                    total_count = count
+                else:
+                    del _entry_count_cache[cache_key]
+
+        query = self.supabase.table("meal_entries")\
+            .select("*", count="exact" if total_count is None else None)\
+            .eq("user_id", str(user_id))
 
         # Apply filters
         if start_date:
@@ -399,7 +714,16 @@ class MealEntryService:
 
         response = query.execute()
 
-        return (response.data or [], response.count or 0)
+        if total_count is None:
+            total_count = response.count or 0
+            if len(_entry_count_cache) >= ENTRY_COUNT_CACHE_MAX_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _entry_count_cache[next(iter(_entry_count_cache))]
+            _entry_count_cache[cache_key] = (
+                time.monotonic() + ENTRY_COUNT_CACHE_TTL_SECONDS, total_count
+            )
+
+        return (response.data or [], total_count)
 
     # =====================================================
     # UPDATE/DELETE MEAL ENTRIES
@@ -425,32 +749,39 @@ class MealEntryService:
         Raises:
             ValueError: If entry not found or validation fails
         """
-        # Check entry exists and belongs to user
-        existing = await self.get_meal_entry(user_id, entry_id)
-        if not existing:
-            raise ValueError(f"Meal entry not found: {entry_id}")
-
-        # If nutrition is being updated, validate
-        if any(k in updates for k in ["calories", "protein_g", "carbs_g", "fat_g"]):
-            calories = updates.get("calories", existing["calories"])
-            protein = updates.get("protein_g", existing["protein_g"])
-            carbs = updates.get("carbs_g", existing["carbs_g"])
-            fat = updates.get("fat_g", existing["fat_g"])
-
+        # If the full set of nutrition values is being updated, validate it
+        # here. Partial nutrition updates are checked against the stored
+        # values by the validate_meal_entry_calories trigger, which avoids
+        # fetching the entry first.
+        if _NUTRITION_KEYS <= updates.keys():
             is_valid, discrepancy, msg = validate_calorie_calculation(
-                float(calories), float(protein), float(carbs), float(fat)
+                float(updates["calories"]),
+                float(updates["protein_g"]),
+                float(updates["carbs_g"]),
+                float(updates["fat_g"])
             )
             if not is_valid:
                 raise ValueError(f"Calorie validation failed: {msg}")
 
-        # Update in database
-        response = self.supabase.table("meal_entries")\
-            .update(updates)\
-            .eq("id", str(entry_id))\
-            .eq("user_id", str(user_id))\
-            .execute()
+        # Update in database (only matches the user's own entry)
+        try:
+            response = self.supabase.table("meal_entries")\
+                .update(updates)\
+                .eq("id", str(entry_id))\
+                .eq("user_id", str(user_id))\
+                .execute()
+        except Exception as e:
+            if _CALORIE_MISMATCH_ERROR in str(e):
+                raise ValueError(f"Calorie validation failed: {str(e)}")
+            raise
+
+        if not response.data:
+            raise ValueError(f"Meal entry not found: {entry_id}")
 
-        return response.data[0] if response.data else None
+        # The entry may have moved to another date, so drop every cached day
+        _meal_entries_changed(user_id)
+
+        return response.data[0]
 
     async def delete_meal_entry(
         self,
@@ -472,6 +803,7 @@ class MealEntryService:
             .eq("id", str(entry_id))\
             .eq("user_id", str(user_id))\
             .execute()
+        _meal_entries_changed(user_id)
 
         return len(response.data) > 0
 
@@ -483,6 +815,10 @@ class MealEntryService:
         """
         Calculate nutrition summary for a list of meal entries.
 
+        Works in floats throughout: stored grams have 2 decimals, so the
+        rounded float sums equal the exact decimal totals and Decimal is
+        not needed here.
+
         Args:
             entries: List of meal entries
 
@@ -490,6 +826,44 @@ class MealEntryService:
             Summary with totals and percentages
         """
         if not entries:
+            return self._summary_from_totals(0, 0, 0.0, 0.0, 0.0)
+
+        # Transpose once into columns and reduce each with C-level sums,
+        # rounding the gram sums back to 2 decimals
+        calories, protein, carbs, fat = zip(*map(_summary_fields, entries))
+
+        return self._summary_from_totals(
+            len(entries),
+            sum(calories),
+            round(fsum(map(float, protein)), 2),
+            round(fsum(map(float, carbs)), 2),
+            round(fsum(map(float, fat)), 2)
+        )
+
+    @staticmethod
+    def _summary_from_totals(
+        total_entries: int,
+        total_calories: int,
+        total_protein: float,
+        total_carbs: float,
+        total_fat: float
+    ) -> Dict[str, Any]:
+        """
+        Build the nutrition summary from already summed totals.
+
+        Shared by the in-Python summary and the get_daily_meals RPC totals.
+
+        Args:
+            total_entries: Number of meal entries
+            total_calories: Sum of calories
+            total_protein: Sum of protein in grams
+            total_carbs: Sum of carbs in grams
+            total_fat: Sum of fat in grams
+
+        Returns:
+            Summary with totals and percentages
+        """
+        if not total_entries:
             return {
                 "total_entries": 0,
                 "total_calories": 0,
@@ -501,16 +875,12 @@ class MealEntryService:
                 "fat_percent": 0
             }
 
-        total_calories = sum(e["calories"] for e in entries)
-        total_protein = sum(Decimal(str(e["protein_g"])) for e in entries)
-        total_carbs = sum(Decimal(str(e["carbs_g"])) for e in entries)
-        total_fat = sum(Decimal(str(e["fat_g"])) for e in entries)
-
-        # Calculate percentages
+        # Calculate percentages from the totals (4/4/9 kcal per gram), so the
+        # entries are only traversed once, in _calculate_summary
         if total_calories > 0:
-            protein_cal = float(total_protein) * 4
-            carbs_cal = float(total_carbs) * 4
-            fat_cal = float(total_fat) * 9
+            protein_cal = total_protein * 4
+            carbs_cal = total_carbs * 4
+            fat_cal = total_fat * 9
 
             protein_percent = round((protein_cal / total_calories) * 100, 1)
             carbs_percent = round((carbs_cal / total_calories) * 100, 1)
@@ -519,11 +889,11 @@ class MealEntryService:
             protein_percent = carbs_percent = fat_percent = 0
 
         return {
-            "total_entries": len(entries),
+            "total_entries": total_entries,
             "total_calories": total_calories,
-            "total_protein_g": float(total_protein),
-            "total_carbs_g": float(total_carbs),
-            "total_fat_g": float(total_fat),
+            "total_protein_g": total_protein,
+            "total_carbs_g": total_carbs,
+            "total_fat_g": total_fat,
             "protein_percent": protein_percent,
             "carbs_percent": carbs_percent,
             "fat_percent": fat_percent
@@ -12,6 +12,7 @@ from app.validators.nutrition_validator import (
     NutritionValidator,
     ValidationResult,
     FoodValidationError,
+    ValidatedFood,
     get_nutrition_validator,
     CALORIES_PER_GRAM_PROTEIN,
     CALORIES_PER_GRAM_CARBS,
@@ -26,6 +27,7 @@ __all__ = [
     "NutritionValidator",
     "ValidationResult",
     "FoodValidationError",
+    "ValidatedFood",
     "get_nutrition_validator",
     "CALORIES_PER_GRAM_PROTEIN",
     "CALORIES_PER_GRAM_CARBS",
@@ -17,6 +17,8 @@ CRITICAL VALIDATIONS (US-036):
 """
 
 import logging
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
@@ -34,8 +36,97 @@ MAX_PORTION_GRAMS = 2000
 MAX_WATER_ML = 10000  # 10 liters
 MIN_QUANTITY = 0.01  # Minimum non-zero quantity
 
+# Distinct (food values, auto_correct) results kept by the validation cache
+VALIDATION_CACHE_SIZE = 4096
+
+# Fields every food item must provide (tuple keeps error messages ordered)
+_REQUIRED_FIELDS = ("name", "quantity", "calories", "protein_g", "carbs_g", "fat_g")
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+_FIELDS_GETTER = itemgetter(*_REQUIRED_FIELDS)
+
+# Validated fields summed into the meal totals
+_TOTAL_FIELDS_GETTER = itemgetter("calories", "protein_g", "carbs_g", "fat_g")
+
+# Unit spellings checked against the portion limits
+_GRAM_UNITS = frozenset({"g", "grams", "gram"})
+_ML_UNITS = frozenset({"ml", "milliliters", "milliliter"})
+
+# Canonical unit ("g" / "ml") for each spelling, including common
+# capitalizations so most inputs resolve without lowercasing
+_UNIT_CANONICAL: Dict[str, str] = {
+    variant: canonical
+    for canonical, spellings in (("g", _GRAM_UNITS), ("ml", _ML_UNITS))
+    for spelling in spellings
+    for variant in (spelling, spelling.upper(), spelling.capitalize())
+}
+
+
+def _canonical_unit(unit: Any) -> Optional[str]:
+    """Map a unit to "g" or "ml", or None for any other unit."""
+    if type(unit) is str:
+        canonical = _UNIT_CANONICAL.get(unit)
+        if canonical is not None:
+            return canonical
+    return _UNIT_CANONICAL.get(str(unit).lower())
+
+
+# Input types the clean-food fast path accepts without conversion
+_NUMBER_TYPES = (float, int)
+
+# Flags returned by _check_macros
+_NEGATIVE_PROTEIN = 1
+_NEGATIVE_CARBS = 2
+_NEGATIVE_FAT = 4
+_CALORIE_MISMATCH = 8
+_NEGATIVE_MACROS = _NEGATIVE_PROTEIN | _NEGATIVE_CARBS | _NEGATIVE_FAT
+
+
+def _check_macros(
+    calories: float,
+    protein_g: float,
+    carbs_g: float,
+    fat_g: float,
+    auto_correct: bool
+) -> Tuple[int, float, float, float, float]:
+    """
+    Numeric core of the macro validation, free of error bookkeeping.
+
+    Flags negative macros and a calorie/macro mismatch beyond tolerance.
+    With auto_correct, negative macros are clamped to 0 before calories are
+    calculated; without it, negative macros stop the check early.
 
-@dataclass
+    Returns:
+        Tuple of (flags, protein_g, carbs_g, fat_g, calculated_calories)
+    """
+    flags = 0
+    if protein_g < 0:
+        flags |= _NEGATIVE_PROTEIN
+    if carbs_g < 0:
+        flags |= _NEGATIVE_CARBS
+    if fat_g < 0:
+        flags |= _NEGATIVE_FAT
+
+    if flags:
+        if not auto_correct:
+            return flags, protein_g, carbs_g, fat_g, 0.0
+        protein_g = max(0, protein_g)
+        carbs_g = max(0, carbs_g)
+        fat_g = max(0, fat_g)
+
+    calculated_calories = (
+        protein_g * CALORIES_PER_GRAM_PROTEIN +
+        carbs_g * CALORIES_PER_GRAM_CARBS +
+        fat_g * CALORIES_PER_GRAM_FAT
+    )
+
+    tolerance = max(calculated_calories * CALORIE_TOLERANCE_PERCENT, 5)  # Minimum 5 calorie tolerance
+    if abs(calories - calculated_calories) > tolerance:
+        flags |= _CALORIE_MISMATCH
+
+    return flags, protein_g, carbs_g, fat_g, calculated_calories
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of nutrition validation"""
     is_valid: bool
@@ -44,7 +135,7 @@ class ValidationResult:
     corrected_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FoodValidationError:
     """Error found in food data validation"""
     field: str
@@ -54,6 +145,39 @@ class FoodValidationError:
     corrected_value: Optional[Any] = None
 
 
+@dataclass(slots=True, frozen=True)
+class ValidatedFood:
+    """Validated food item, serialized to a dict only at the API boundary"""
+    name: str
+    quantity: float
+    unit: str
+    calories: float
+    protein_g: float
+    carbs_g: float
+    fat_g: float
+
+
+def _strip_str(value: Any) -> str:
+    """str(value).strip(), skipping the str() call for values that are already strings."""
+    return value.strip() if type(value) is str else str(value).strip()
+
+
+def _round2(value: Any) -> float:
+    """round(float(value), 2) for int/float input; ints need no rounding."""
+    return float(value) if type(value) is int else round(value, 2)
+
+
+def _add_issue(
+    issues: Optional[List[FoodValidationError]],
+    issue: FoodValidationError
+) -> List[FoodValidationError]:
+    """Append an issue, creating the list on the first one."""
+    if issues is None:
+        return [issue]
+    issues.append(issue)
+    return issues
+
+
 class NutritionValidator:
     """
     Comprehensive validator for nutrition data.
@@ -75,6 +199,9 @@ class NutritionValidator:
         """
         Validate a single food item.
 
+        Errors and warnings of this call are kept in self.errors and
+        self.warnings for get_validation_summary().
+
         Args:
             food: Food item dictionary with nutrition data
             auto_correct: Whether to auto-correct fixable issues
@@ -90,36 +217,87 @@ class NutritionValidator:
             5. Calories <= 5000 per item
             6. Portion <= 2000g
         """
-        self.errors.clear()
-        self.warnings.clear()
+        is_valid, validated_food, errors, warnings = self._validate_food(food, auto_correct)
+        self.errors = errors or []
+        self.warnings = warnings or []
+        return is_valid, validated_food
 
-        # Deep copy to avoid modifying original
-        validated_food = food.copy()
+    @staticmethod
+    def _validate_food(
+        food: Dict[str, Any],
+        auto_correct: bool
+    ) -> Tuple[
+        bool,
+        Dict[str, Any],
+        Optional[List[FoodValidationError]],
+        Optional[List[FoodValidationError]]
+    ]:
+        """
+        Stateless core of validate_food_item.
 
-        # Check required fields
-        required_fields = ["name", "quantity", "calories", "protein_g", "carbs_g", "fat_g"]
-        missing_fields = [f for f in required_fields if f not in food]
+        Returns the issues instead of storing them on the validator, so a
+        shared instance is safe to use from concurrent requests. Error and
+        warning lists are only allocated once there is something to report.
 
-        if missing_fields:
-            self.errors.append(FoodValidationError(
+        Returns:
+            Tuple of (is_valid, corrected_food_data, errors, warnings), where
+            errors/warnings are None when empty
+        """
+        key = _validation_cache_key(food, auto_correct)
+        if key is None:
+            return NutritionValidator._validate_food_uncached(food, auto_correct)
+
+        # Validation only reads the required fields and unit, so results for
+        # the same values are reused; other fields pass through from food.
+        # The result is built in one step instead of copying food and then
+        # overwriting the validated keys.
+        is_valid, validated_fields, errors, warnings = _validate_food_cached(key)
+        return (
+            is_valid,
+            {**food, **validated_fields},
+            list(errors) if errors else None,
+            list(warnings) if warnings else None
+        )
+
+    @staticmethod
+    def _validate_food_uncached(
+        food: Dict[str, Any],
+        auto_correct: bool
+    ) -> Tuple[
+        bool,
+        Dict[str, Any],
+        Optional[List[FoodValidationError]],
+        Optional[List[FoodValidationError]]
+    ]:
+        """Validate a food from scratch (see _validate_food)."""
+        warnings: Optional[List[FoodValidationError]] = None
+
+        # Shallow copy to avoid modifying original
+        validated_food = food.copy()
+
+        # Check required fields (one C-level subset test on the happy path)
+        if not _REQUIRED_FIELD_SET <= food.keys():
+            missing_fields = [f for f in _REQUIRED_FIELDS if f not in food]
+            errors = [FoodValidationError(
                 field="structure",
                 message=f"Missing required fields: {', '.join(missing_fields)}",
                 severity="error",
                 original_value=food
-            ))
-            return False, validated_food
+            )]
+            return False, validated_food, errors, warnings
 
-        # Validate name
-        if not food["name"] or not str(food["name"]).strip():
-            self.errors.append(FoodValidationError(
+        # Validate name (stripped once, reused for the check and the result)
+        name = _strip_str(food["name"]) if food["name"] else ""
+        if not name:
+            errors = [FoodValidationError(
                 field="name",
                 message="Food name cannot be empty",
                 severity="error",
                 original_value=food["name"]
-            ))
-            return False, validated_food
+            )]
+            return False, validated_food, errors, warnings
 
-        validated_food["name"] = str(food["name"]).strip()
+        validated_food["name"] = name
 
         # Validate quantity
         try:
@@ -127,7 +305,7 @@ class NutritionValidator:
             if quantity < 0:
                 if auto_correct:
                     quantity = 0
-                    self.warnings.append(FoodValidationError(
+                    warnings = _add_issue(warnings, FoodValidationError(
                         field="quantity",
                         message="Negative quantity corrected to 0",
                         severity="warning",
@@ -135,36 +313,36 @@ class NutritionValidator:
                         corrected_value=0
                     ))
                 else:
-                    self.errors.append(FoodValidationError(
+                    errors = [FoodValidationError(
                         field="quantity",
                         message="Quantity cannot be negative",
                         severity="error",
                         original_value=food["quantity"]
-                    ))
-                    return False, validated_food
+                    )]
+                    return False, validated_food, errors, warnings
 
             if quantity == 0 or quantity < MIN_QUANTITY:
-                self.errors.append(FoodValidationError(
+                errors = [FoodValidationError(
                     field="quantity",
                     message=f"Quantity must be > {MIN_QUANTITY}",
                     severity="error",
                     original_value=quantity
-                ))
-                return False, validated_food
+                )]
+                return False, validated_food, errors, warnings
 
             # Check maximum portion size (if unit is in grams/ml)
-            unit = str(food.get("unit", "g")).lower()
-            if unit in ["g", "grams", "gram"]:
+            unit = _canonical_unit(food.get("unit", "g"))
+            if unit == "g":
                 if quantity > MAX_PORTION_GRAMS:
-                    self.warnings.append(FoodValidationError(
+                    warnings = _add_issue(warnings, FoodValidationError(
                         field="quantity",
                         message=f"Portion size {quantity}g exceeds realistic maximum of {MAX_PORTION_GRAMS}g",
                         severity="warning",
                         original_value=quantity
                     ))
-            elif unit in ["ml", "milliliters", "milliliter"]:
+            elif unit == "ml":
                 if quantity > MAX_WATER_ML:
-                    self.warnings.append(FoodValidationError(
+                    warnings = _add_issue(warnings, FoodValidationError(
                         field="quantity",
                         message=f"Liquid volume {quantity}ml exceeds maximum of {MAX_WATER_ML}ml",
                         severity="warning",
@@ -174,13 +352,13 @@ class NutritionValidator:
             validated_food["quantity"] = round(quantity, 2)
 
         except (ValueError, TypeError) as e:
-            self.errors.append(FoodValidationError(
+            errors = [FoodValidationError(
                 field="quantity",
                 message=f"Invalid quantity value: {e}",
                 severity="error",
                 original_value=food["quantity"]
-            ))
-            return False, validated_food
+            )]
+            return False, validated_food, errors, warnings
 
         # Validate calories
         try:
@@ -188,7 +366,7 @@ class NutritionValidator:
             if calories < 0:
                 if auto_correct:
                     calories = 0
-                    self.warnings.append(FoodValidationError(
+                    warnings = _add_issue(warnings, FoodValidationError(
                         field="calories",
                         message="Negative calories corrected to 0",
                         severity="warning",
@@ -196,16 +374,16 @@ class NutritionValidator:
                         corrected_value=0
                     ))
                 else:
-                    self.errors.append(FoodValidationError(
+                    errors = [FoodValidationError(
                         field="calories",
                         message="Calories cannot be negative",
                         severity="error",
                         original_value=food["calories"]
-                    ))
-                    return False, validated_food
+                    )]
+                    return False, validated_food, errors, warnings
 
             if calories > MAX_CALORIES_PER_FOOD:
-                self.warnings.append(FoodValidationError(
+                warnings = _add_issue(warnings, FoodValidationError(
                     field="calories",
                     message=f"Calories {calories} exceeds realistic maximum of {MAX_CALORIES_PER_FOOD}",
                     severity="warning",
@@ -215,13 +393,13 @@ class NutritionValidator:
             validated_food["calories"] = round(calories, 2)
 
         except (ValueError, TypeError) as e:
-            self.errors.append(FoodValidationError(
+            errors = [FoodValidationError(
                 field="calories",
                 message=f"Invalid calories value: {e}",
                 severity="error",
                 original_value=food["calories"]
-            ))
-            return False, validated_food
+            )]
+            return False, validated_food, errors, warnings
 
         # Validate macros
         try:
@@ -229,50 +407,41 @@ class NutritionValidator:
             carbs_g = float(food["carbs_g"])
             fat_g = float(food["fat_g"])
 
-            # Check for negatives
-            negative_macros = []
-            if protein_g < 0:
-                negative_macros.append(("protein_g", protein_g))
-            if carbs_g < 0:
-                negative_macros.append(("carbs_g", carbs_g))
-            if fat_g < 0:
-                negative_macros.append(("fat_g", fat_g))
+            original_macros = (protein_g, carbs_g, fat_g)
+            flags, protein_g, carbs_g, fat_g, calculated_calories = _check_macros(
+                validated_food["calories"], protein_g, carbs_g, fat_g, auto_correct
+            )
 
-            if negative_macros and not auto_correct:
+            # Report negatives in field order
+            if flags & _NEGATIVE_MACROS:
+                negative_macros = [
+                    (field, value)
+                    for field, value in zip(("protein_g", "carbs_g", "fat_g"), original_macros)
+                    if value < 0
+                ]
+                if not auto_correct:
+                    errors = [
+                        FoodValidationError(
+                            field=field,
+                            message=f"{field} cannot be negative",
+                            severity="error",
+                            original_value=value
+                        )
+                        for field, value in negative_macros
+                    ]
+                    return False, validated_food, errors, warnings
                 for field, value in negative_macros:
-                    self.errors.append(FoodValidationError(
-                        field=field,
-                        message=f"{field} cannot be negative",
-                        severity="error",
-                        original_value=value
-                    ))
-                return False, validated_food
-            elif negative_macros and auto_correct:
-                for field, value in negative_macros:
-                    self.warnings.append(FoodValidationError(
+                    warnings = _add_issue(warnings, FoodValidationError(
                         field=field,
                         message=f"Negative {field} corrected to 0",
                         severity="warning",
                         original_value=value,
                         corrected_value=0
                     ))
-                protein_g = max(0, protein_g)
-                carbs_g = max(0, carbs_g)
-                fat_g = max(0, fat_g)
-
-            # Validate macro-to-calorie calculation
-            calculated_calories = (
-                protein_g * CALORIES_PER_GRAM_PROTEIN +
-                carbs_g * CALORIES_PER_GRAM_CARBS +
-                fat_g * CALORIES_PER_GRAM_FAT
-            )
-
-            tolerance = max(calculated_calories * CALORIE_TOLERANCE_PERCENT, 5)  # Minimum 5 calorie tolerance
-            calorie_diff = abs(validated_food["calories"] - calculated_calories)
 
-            if calorie_diff > tolerance:
+            if flags & _CALORIE_MISMATCH:
                 if auto_correct:
-                    self.warnings.append(FoodValidationError(
+                    warnings = _add_issue(warnings, FoodValidationError(
                         field="calories",
                         message=f"Calorie mismatch: stated={validated_food['calories']}, "
                                 f"calculated={calculated_calories:.1f}. Using calculated value.",
@@ -282,38 +451,104 @@ class NutritionValidator:
                     ))
                     validated_food["calories"] = round(calculated_calories, 2)
                 else:
-                    self.errors.append(FoodValidationError(
+                    errors = [FoodValidationError(
                         field="calories",
                         message=f"Calories ({validated_food['calories']}) don't match macro calculation "
                                 f"({calculated_calories:.1f}) within {CALORIE_TOLERANCE_PERCENT*100}% tolerance",
                         severity="error",
                         original_value=validated_food["calories"]
-                    ))
-                    return False, validated_food
+                    )]
+                    return False, validated_food, errors, warnings
 
             validated_food["protein_g"] = round(protein_g, 2)
             validated_food["carbs_g"] = round(carbs_g, 2)
             validated_food["fat_g"] = round(fat_g, 2)
 
         except (ValueError, TypeError) as e:
-            self.errors.append(FoodValidationError(
+            errors = [FoodValidationError(
                 field="macros",
                 message=f"Invalid macro values: {e}",
                 severity="error",
                 original_value={"protein_g": food.get("protein_g"),
                                  "carbs_g": food.get("carbs_g"),
                                  "fat_g": food.get("fat_g")}
-            ))
-            return False, validated_food
+            )]
+            return False, validated_food, errors, warnings
 
         # Validate unit (optional field)
         if "unit" in food:
-            validated_food["unit"] = str(food["unit"]).strip()
+            validated_food["unit"] = _strip_str(food["unit"])
         else:
             validated_food["unit"] = "g"  # Default unit
 
         # All validations passed
-        return len(self.errors) == 0, validated_food
+        return True, validated_food, None, warnings
+
+    @staticmethod
+    def _prevalidate_foods(foods: List[Any]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Validate the clean foods of a meal in one pass over the list.
+
+        A food is clean when every required field is present, the name is a
+        non-empty string and all numbers are already int/float values that
+        trigger no error, warning or correction (non-negative, realistic
+        portion and calories, calories within tolerance of the macros).
+        For those the validated dict is built directly, exactly as
+        validate_food_item would build it.
+
+        Returns:
+            One entry per food: the validated dict, or None if the food
+            needs the full validate_food_item path
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        for food in foods:
+            try:
+                name = food["name"]
+                quantity = food["quantity"]
+                calories = food["calories"]
+                protein_g = food["protein_g"]
+                carbs_g = food["carbs_g"]
+                fat_g = food["fat_g"]
+            except (KeyError, TypeError):
+                results.append(None)
+                continue
+
+            if (
+                type(name) is not str
+                or type(quantity) not in _NUMBER_TYPES
+                or type(calories) not in _NUMBER_TYPES
+                or type(protein_g) not in _NUMBER_TYPES
+                or type(carbs_g) not in _NUMBER_TYPES
+                or type(fat_g) not in _NUMBER_TYPES
+            ):
+                results.append(None)
+                continue
+
+            stripped_name = name.strip()
+            calories = _round2(calories)
+
+            # Portions up to MAX_PORTION_GRAMS can't trigger either the grams
+            # or the (larger) millilitres warning, whatever the unit
+            if (
+                not stripped_name
+                or not MIN_QUANTITY <= quantity <= MAX_PORTION_GRAMS
+                or not 0 <= calories <= MAX_CALORIES_PER_FOOD
+                or _check_macros(calories, protein_g, carbs_g, fat_g, False)[0]
+            ):
+                results.append(None)
+                continue
+
+            validated_food = food.copy()
+            validated_food["name"] = stripped_name
+            validated_food["quantity"] = _round2(quantity)
+            validated_food["calories"] = calories
+            validated_food["protein_g"] = _round2(protein_g)
+            validated_food["carbs_g"] = _round2(carbs_g)
+            validated_food["fat_g"] = _round2(fat_g)
+            validated_food["unit"] = _strip_str(food["unit"]) if "unit" in food else "g"
+            results.append(validated_food)
+
+        return results
 
     def validate_meal_data(
         self,
@@ -342,32 +577,52 @@ class NutritionValidator:
                 corrected_data=None
             )
 
-        validated_foods: List[Dict[str, Any]] = []
-        total_calories = 0.0
-        total_protein = 0.0
-        total_carbs = 0.0
-        total_fat = 0.0
+        # Clean foods are validated in one pre-pass; the rest take the full
+        # per-item path with its errors, warnings and corrections
+        prevalidated = self._prevalidate_foods(data["foods"])
+        errors = warnings = None
 
-        # Validate each food item
-        for idx, food in enumerate(data["foods"]):
-            is_valid, validated_food = self.validate_food_item(food, auto_correct)
-
-            if not is_valid:
-                all_errors.extend([f"Food {idx} ({food.get('name', 'unknown')}): {e.message}"
-                                   for e in self.errors])
-                continue  # Skip invalid foods
-
-            if self.warnings:
-                all_warnings.extend([f"Food {idx} ({food.get('name', 'unknown')}): {w.message}"
-                                     for w in self.warnings])
-
-            validated_foods.append(validated_food)
-
-            # Update totals
-            total_calories += validated_food["calories"]
-            total_protein += validated_food["protein_g"]
-            total_carbs += validated_food["carbs_g"]
-            total_fat += validated_food["fat_g"]
+        if None not in prevalidated:
+            # Every food is clean: nothing to report
+            validated_foods = prevalidated
+        else:
+            validated_foods = []
+
+            # Validate each food item
+            for idx, food in enumerate(data["foods"]):
+                validated_food = prevalidated[idx]
+                if validated_food is not None:
+                    errors = warnings = None
+                    validated_foods.append(validated_food)
+                    continue
+
+                is_valid, validated_food, errors, warnings = self._validate_food(food, auto_correct)
+
+                if not is_valid:
+                    label = f"Food {idx} ({food.get('name', 'unknown')})"
+                    all_errors.extend([f"{label}: {e.message}" for e in errors])
+                    continue  # Skip invalid foods
+
+                if warnings:
+                    label = f"Food {idx} ({food.get('name', 'unknown')})"
+                    all_warnings.extend([f"{label}: {w.message}" for w in warnings])
+
+                validated_foods.append(validated_food)
+
+        # Totals: transpose the validated foods into columns once and sum
+        # each column in C
+        total_calories = total_protein = total_carbs = total_fat = 0.0
+        if validated_foods:
+            calories, protein, carbs, fat = zip(*map(_TOTAL_FIELDS_GETTER, validated_foods))
+            total_calories = sum(calories, 0.0)
+            total_protein = sum(protein, 0.0)
+            total_carbs = sum(carbs, 0.0)
+            total_fat = sum(fat, 0.0)
+
+        # Keep get_validation_summary() reporting the last food
+        if data["foods"]:
+            self.errors = errors or []
+            self.warnings = warnings or []
 
         # Build corrected data
         corrected_data = {
@@ -414,6 +669,60 @@ class NutritionValidator:
         }
 
 
+def _validation_cache_key(food: Dict[str, Any], auto_correct: bool) -> Optional[Tuple]:
+    """
+    Build the _validate_food_cached key for a food, or None if it can't be cached.
+
+    Values are paired with their type so that e.g. 1, 1.0 and True (equal
+    and hashing alike) don't share results. Foods missing a required field
+    aren't cached since their error reports the whole food dict.
+    """
+    try:
+        field_values = _FIELDS_GETTER(food)
+    except KeyError:
+        return None
+
+    values = tuple(zip(field_values, map(type, field_values)))
+    unit = (food["unit"], type(food["unit"])) if "unit" in food else None
+    key = (auto_correct, values, unit)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_food_cached(key: Tuple) -> Tuple[
+    bool,
+    Dict[str, Any],
+    Optional[Tuple[FoodValidationError, ...]],
+    Optional[Tuple[FoodValidationError, ...]]
+]:
+    """
+    Validate the food described by a _validation_cache_key key.
+
+    Validation is pure, so results are memoized; LRU eviction is the only
+    invalidation needed. Issues are returned as immutable tuples; the
+    validated fields dict is only ever merged into a new dict, so cached
+    results can't be modified by callers.
+    """
+    auto_correct, values, unit = key
+    food = {f: value for f, (value, _) in zip(_REQUIRED_FIELDS, values)}
+    if unit is not None:
+        food["unit"] = unit[0]
+
+    is_valid, validated_food, errors, warnings = NutritionValidator._validate_food_uncached(
+        food, auto_correct
+    )
+    return (
+        is_valid,
+        validated_food,
+        tuple(errors) if errors else None,
+        tuple(warnings) if warnings else None
+    )
+
+
 # Singleton instance
 _validator: Optional[NutritionValidator] = None
 
@@ -0,0 +1,27 @@
+-- Migration: 005_personality_types_active_code_index.sql
+-- Description: Partial unique index for active personality lookups by code
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- Replace plain code index with a partial index on active personalities
+-- ============================================================================
+
+-- ClaudeService looks personalities up with code = ? AND is_active = true.
+-- The partial index serves that predicate directly, so the planner never
+-- falls back to a sequential scan filtering on is_active.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_personality_types_code_active
+  ON personality_types(code)
+  WHERE is_active;
+
+-- code is already UNIQUE (backed by its own index); the non-unique index
+-- from 003 is redundant.
+DROP INDEX IF EXISTS idx_personality_types_code;
+
+-- ============================================================================
+-- ROLLBACK (if needed)
+-- ============================================================================
+
+/*
+DROP INDEX IF EXISTS idx_personality_types_code_active;
+CREATE INDEX idx_personality_types_code ON personality_types(code);
+*/
@@ -0,0 +1,40 @@
+-- Migration: 006_daily_meal_totals_view.sql
+-- Description: Per-day, per-meal-type nutrition totals aggregated in Postgres
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- daily_meal_totals view
+-- ============================================================================
+
+-- The daily summary endpoint only needs sums per meal type, so aggregate
+-- close to the data instead of shipping every meal entry to the API.
+-- Column names mirror meal_entries so rows can be consumed like entries
+-- (with meal_count > 1).
+CREATE OR REPLACE VIEW public.daily_meal_totals AS
+SELECT
+    user_id,
+    date,
+    meal_type,
+    SUM(calories) AS calories,
+    SUM(protein_g) AS protein_g,
+    SUM(carbs_g) AS carbs_g,
+    SUM(fat_g) AS fat_g,
+    COUNT(*) AS meal_count
+FROM public.meal_entries
+GROUP BY user_id, date, meal_type;
+
+-- Grant access to view
+GRANT SELECT ON public.daily_meal_totals TO authenticated;
+
+-- RLS policy for view (evaluate meal_entries policies as the caller)
+ALTER VIEW public.daily_meal_totals SET (security_invoker = true);
+
+COMMENT ON VIEW public.daily_meal_totals IS 'Nutrition totals per user, date and meal type (used by daily summary)';
+
+-- ============================================================================
+-- ROLLBACK (if needed)
+-- ============================================================================
+
+/*
+DROP VIEW IF EXISTS public.daily_meal_totals;
+*/
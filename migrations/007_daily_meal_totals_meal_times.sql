@@ -0,0 +1,43 @@
+-- Migration: 007_daily_meal_totals_meal_times.sql
+-- Description: Add first/last meal time to daily_meal_totals for the eating window
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- daily_meal_totals view (first_meal / last_meal)
+-- ============================================================================
+
+-- The eating window only needs the earliest and latest meal time of the day,
+-- so compute them alongside the sums instead of fetching every entry.
+-- New columns are appended so CREATE OR REPLACE keeps the existing ones.
+CREATE OR REPLACE VIEW public.daily_meal_totals AS
+SELECT
+    user_id,
+    date,
+    meal_type,
+    SUM(calories) AS calories,
+    SUM(protein_g) AS protein_g,
+    SUM(carbs_g) AS carbs_g,
+    SUM(fat_g) AS fat_g,
+    COUNT(*) AS meal_count,
+    MIN(time) AS first_meal,
+    MAX(time) AS last_meal
+FROM public.meal_entries
+GROUP BY user_id, date, meal_type;
+
+-- Grant access to view
+GRANT SELECT ON public.daily_meal_totals TO authenticated;
+
+-- RLS policy for view (evaluate meal_entries policies as the caller)
+ALTER VIEW public.daily_meal_totals SET (security_invoker = true);
+
+COMMENT ON VIEW public.daily_meal_totals IS 'Nutrition totals and meal time bounds per user, date and meal type (used by daily summary)';
+
+-- ============================================================================
+-- ROLLBACK (if needed)
+-- ============================================================================
+
+/*
+-- Columns cannot be removed with CREATE OR REPLACE; recreate the 006 view
+DROP VIEW IF EXISTS public.daily_meal_totals;
+-- then re-run 006_daily_meal_totals_view.sql
+*/
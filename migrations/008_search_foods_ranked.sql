@@ -0,0 +1,173 @@
+-- Migration: 008_search_foods_ranked.sql
+-- Description: Ranked, deduplicated and paginated food search in a single RPC
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- search_foods_ranked function
+-- ============================================================================
+
+-- Food search used to fetch every matching user food, system food and
+-- favorite in three round-trips, then score, dedupe, sort and paginate in
+-- Python. This function does all of it server-side and returns one page.
+--
+-- Relevance mirrors the Python scoring:
+--   base score: 0.8 user foods, 0.6 system foods
+--   +0.3 if the food is one of the user's favorites
+--   +0.4 exact name match / +0.3 name starts with query / +0.2 name contains query
+--   capped at 1.0
+-- (a word-prefix match always implies "contains", so it needs no extra case)
+--
+-- Duplicates (same lowercase name) keep the user food over the system food.
+-- total_count is the number of ranked rows before pagination.
+--
+-- p_filters keys (all optional): category, brand_id, min_calories,
+-- max_calories, is_vegetarian, is_vegan, is_gluten_free, only_user_foods.
+-- User foods have no diet flags, so diet filters only match system foods.
+CREATE OR REPLACE FUNCTION public.search_foods_ranked(
+    p_user_id UUID,
+    p_query TEXT,
+    p_offset INT DEFAULT 0,
+    p_limit INT DEFAULT 20,
+    p_filters JSONB DEFAULT '{}'::jsonb
+)
+RETURNS TABLE (
+    id UUID,
+    source TEXT,
+    name TEXT,
+    name_en TEXT,
+    category TEXT,
+    brand_name TEXT,
+    calories DECIMAL,
+    protein_g DECIMAL,
+    carbs_g DECIMAL,
+    fat_g DECIMAL,
+    serving_size_g DECIMAL,
+    serving_size_description TEXT,
+    is_favorite BOOLEAN,
+    use_count INTEGER,
+    relevance_score NUMERIC,
+    total_count BIGINT
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+AS $$
+    WITH candidates AS (
+        -- User's custom foods
+        SELECT
+            uf.id,
+            'user'::TEXT AS source,
+            uf.name,
+            NULL::TEXT AS name_en,
+            uf.category,
+            NULL::TEXT AS brand_name,
+            uf.calories,
+            uf.protein_g,
+            uf.carbs_g,
+            uf.fat_g,
+            uf.serving_size_g,
+            uf.serving_size_description,
+            0.8::NUMERIC AS base_score
+        FROM public.user_foods uf
+        WHERE uf.user_id = p_user_id
+          AND uf.name ILIKE '%' || p_query || '%'
+          AND (p_filters->>'category' IS NULL OR uf.category = p_filters->>'category')
+          AND (p_filters->>'brand_id' IS NULL OR uf.brand_id = (p_filters->>'brand_id')::UUID)
+          AND (p_filters->>'min_calories' IS NULL OR uf.calories >= (p_filters->>'min_calories')::DECIMAL)
+          AND (p_filters->>'max_calories' IS NULL OR uf.calories <= (p_filters->>'max_calories')::DECIMAL)
+          AND p_filters->>'is_vegetarian' IS NULL
+          AND p_filters->>'is_vegan' IS NULL
+          AND p_filters->>'is_gluten_free' IS NULL
+
+        UNION ALL
+
+        -- Verified system foods
+        SELECT
+            f.id,
+            'system'::TEXT AS source,
+            f.name,
+            f.name_en,
+            f.category,
+            fb.name AS brand_name,
+            f.calories,
+            f.protein_g,
+            f.carbs_g,
+            f.fat_g,
+            f.serving_size_g,
+            f.serving_size_description,
+            0.6::NUMERIC AS base_score
+        FROM public.foods f
+        LEFT JOIN public.food_brands fb ON fb.id = f.brand_id
+        WHERE f.verified = true
+          AND NOT COALESCE((p_filters->>'only_user_foods')::BOOLEAN, false)
+          AND (f.name ILIKE '%' || p_query || '%' OR f.name_en ILIKE '%' || p_query || '%')
+          AND (p_filters->>'category' IS NULL OR f.category = p_filters->>'category')
+          AND (p_filters->>'brand_id' IS NULL OR f.brand_id = (p_filters->>'brand_id')::UUID)
+          AND (p_filters->>'min_calories' IS NULL OR f.calories >= (p_filters->>'min_calories')::DECIMAL)
+          AND (p_filters->>'max_calories' IS NULL OR f.calories <= (p_filters->>'max_calories')::DECIMAL)
+          AND (p_filters->>'is_vegetarian' IS NULL OR f.is_vegetarian = (p_filters->>'is_vegetarian')::BOOLEAN)
+          AND (p_filters->>'is_vegan' IS NULL OR f.is_vegan = (p_filters->>'is_vegan')::BOOLEAN)
+          AND (p_filters->>'is_gluten_free' IS NULL OR f.is_gluten_free = (p_filters->>'is_gluten_free')::BOOLEAN)
+    ),
+    deduped AS (
+        -- One row per lowercase name, preferring the user's own food
+        SELECT DISTINCT ON (lower(c.name))
+            c.*,
+            fav.food_id IS NOT NULL OR fav.user_food_id IS NOT NULL AS is_favorite,
+            fav.use_count
+        FROM candidates c
+        LEFT JOIN public.food_favorites fav
+            ON fav.user_id = p_user_id
+           AND (fav.food_id = c.id OR fav.user_food_id = c.id)
+        ORDER BY lower(c.name), c.source = 'user' DESC
+    ),
+    ranked AS (
+        SELECT
+            d.*,
+            LEAST(
+                1.0,
+                d.base_score
+                + CASE WHEN d.is_favorite THEN 0.3 ELSE 0 END
+                + CASE
+                    WHEN lower(d.name) = lower(p_query) THEN 0.4
+                    WHEN starts_with(lower(d.name), lower(p_query)) THEN 0.3
+                    WHEN position(lower(p_query) IN lower(d.name)) > 0 THEN 0.2
+                    ELSE 0
+                  END
+            ) AS relevance_score
+        FROM deduped d
+    )
+    SELECT
+        r.id,
+        r.source,
+        r.name,
+        r.name_en,
+        r.category,
+        r.brand_name,
+        r.calories,
+        r.protein_g,
+        r.carbs_g,
+        r.fat_g,
+        r.serving_size_g,
+        r.serving_size_description,
+        r.is_favorite,
+        r.use_count,
+        r.relevance_score,
+        COUNT(*) OVER () AS total_count
+    FROM ranked r
+    ORDER BY r.relevance_score DESC, lower(r.name)
+    LIMIT p_limit
+    OFFSET p_offset;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.search_foods_ranked(UUID, TEXT, INT, INT, JSONB) TO authenticated;
+
+COMMENT ON FUNCTION public.search_foods_ranked IS 'Food search with favorites, relevance ranking, dedupe and pagination (used by food search endpoint)';
+
+-- ============================================================================
+-- ROLLBACK (if needed)
+-- ============================================================================
+
+/*
+DROP FUNCTION IF EXISTS public.search_foods_ranked(UUID, TEXT, INT, INT, JSONB);
+*/
@@ -0,0 +1,38 @@
+-- Migration: 009_foods_trigram_indexes.sql
+-- Description: Trigram GIN indexes so substring food search doesn't seq scan
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- pg_trgm extension
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ============================================================================
+-- Trigram indexes
+-- ============================================================================
+
+-- Food search filters with ILIKE '%query%' (search_foods_ranked and the
+-- PostgREST fallback queries). The existing to_tsvector indexes can't serve
+-- a leading-wildcard pattern, so every keystroke scanned the whole table.
+-- gin_trgm_ops indexes serve ILIKE directly, case-insensitively, so they are
+-- built on the plain columns the queries filter on.
+CREATE INDEX IF NOT EXISTS idx_foods_name_trgm
+    ON public.foods USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_foods_name_en_trgm
+    ON public.foods USING gin (name_en gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_user_foods_name_trgm
+    ON public.user_foods USING gin (name gin_trgm_ops);
+
+-- ============================================================================
+-- ROLLBACK (if needed)
+-- ============================================================================
+
+/*
+DROP INDEX IF EXISTS idx_foods_name_trgm;
+DROP INDEX IF EXISTS idx_foods_name_en_trgm;
+DROP INDEX IF EXISTS idx_user_foods_name_trgm;
+-- DROP EXTENSION IF EXISTS pg_trgm;
+*/
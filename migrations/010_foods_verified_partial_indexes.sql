@@ -0,0 +1,40 @@
+-- Migration: 010_foods_verified_partial_indexes.sql
+-- Description: Partial indexes over verified foods for system food search
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- Partial indexes (verified = true)
+-- ============================================================================
+
+-- System food search always filters on verified = true (and RLS only exposes
+-- verified foods). Indexing just that subset keeps the indexes smaller and
+-- spares the planner from re-checking unverified rows after the match.
+-- The planner picks these automatically; no query changes are needed.
+CREATE INDEX IF NOT EXISTS idx_foods_verified_name_trgm
+    ON public.foods USING gin (name gin_trgm_ops)
+    WHERE verified = true;
+
+CREATE INDEX IF NOT EXISTS idx_foods_verified_category
+    ON public.foods(category)
+    WHERE verified = true;
+
+-- ============================================================================
+-- Drop the full indexes the partial ones replace
+-- ============================================================================
+
+-- Keeping both would leave two trigram and two btree indexes on the same
+-- columns, paying the write and disk cost twice.
+DROP INDEX IF EXISTS idx_foods_name_trgm;
+DROP INDEX IF EXISTS idx_foods_category;
+
+-- ============================================================================
+-- ROLLBACK (if needed)
+-- ============================================================================
+
+/*
+DROP INDEX IF EXISTS idx_foods_verified_name_trgm;
+DROP INDEX IF EXISTS idx_foods_verified_category;
+CREATE INDEX IF NOT EXISTS idx_foods_name_trgm
+    ON public.foods USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_foods_category ON public.foods(category);
+*/
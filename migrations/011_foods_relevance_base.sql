@@ -0,0 +1,174 @@
+-- Migration: 011_foods_relevance_base.sql
+-- Description: Store the base search relevance per food row
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- relevance_base columns
+-- ============================================================================
+
+-- Base relevance used to be attached to every search result in Python
+-- (0.8 for user foods, 0.6 for system foods). Storing it on the rows lets
+-- search_foods_ranked read it directly and allows tuning individual foods
+-- later (e.g. boosting curated staples). A plain column with a default is
+-- used rather than a constant generated column so it stays updatable.
+ALTER TABLE public.foods
+    ADD COLUMN IF NOT EXISTS relevance_base NUMERIC(3, 2) NOT NULL DEFAULT 0.6
+    CHECK (relevance_base >= 0 AND relevance_base <= 1);
+
+ALTER TABLE public.user_foods
+    ADD COLUMN IF NOT EXISTS relevance_base NUMERIC(3, 2) NOT NULL DEFAULT 0.8
+    CHECK (relevance_base >= 0 AND relevance_base <= 1);
+
+COMMENT ON COLUMN public.foods.relevance_base IS 'Base search relevance score (0-1) before match/favorite bonuses';
+COMMENT ON COLUMN public.user_foods.relevance_base IS 'Base search relevance score (0-1) before match/favorite bonuses';
+
+-- ============================================================================
+-- search_foods_ranked: read relevance_base instead of constants
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.search_foods_ranked(
+    p_user_id UUID,
+    p_query TEXT,
+    p_offset INT DEFAULT 0,
+    p_limit INT DEFAULT 20,
+    p_filters JSONB DEFAULT '{}'::jsonb
+)
+RETURNS TABLE (
+    id UUID,
+    source TEXT,
+    name TEXT,
+    name_en TEXT,
+    category TEXT,
+    brand_name TEXT,
+    calories DECIMAL,
+    protein_g DECIMAL,
+    carbs_g DECIMAL,
+    fat_g DECIMAL,
+    serving_size_g DECIMAL,
+    serving_size_description TEXT,
+    is_favorite BOOLEAN,
+    use_count INTEGER,
+    relevance_score NUMERIC,
+    total_count BIGINT
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+AS $$
+    WITH candidates AS (
+        -- User's custom foods
+        SELECT
+            uf.id,
+            'user'::TEXT AS source,
+            uf.name,
+            NULL::TEXT AS name_en,
+            uf.category,
+            NULL::TEXT AS brand_name,
+            uf.calories,
+            uf.protein_g,
+            uf.carbs_g,
+            uf.fat_g,
+            uf.serving_size_g,
+            uf.serving_size_description,
+            uf.relevance_base AS base_score
+        FROM public.user_foods uf
+        WHERE uf.user_id = p_user_id
+          AND uf.name ILIKE '%' || p_query || '%'
+          AND (p_filters->>'category' IS NULL OR uf.category = p_filters->>'category')
+          AND (p_filters->>'brand_id' IS NULL OR uf.brand_id = (p_filters->>'brand_id')::UUID)
+          AND (p_filters->>'min_calories' IS NULL OR uf.calories >= (p_filters->>'min_calories')::DECIMAL)
+          AND (p_filters->>'max_calories' IS NULL OR uf.calories <= (p_filters->>'max_calories')::DECIMAL)
+          AND p_filters->>'is_vegetarian' IS NULL
+          AND p_filters->>'is_vegan' IS NULL
+          AND p_filters->>'is_gluten_free' IS NULL
+
+        UNION ALL
+
+        -- Verified system foods
+        SELECT
+            f.id,
+            'system'::TEXT AS source,
+            f.name,
+            f.name_en,
+            f.category,
+            fb.name AS brand_name,
+            f.calories,
+            f.protein_g,
+            f.carbs_g,
+            f.fat_g,
+            f.serving_size_g,
+            f.serving_size_description,
+            f.relevance_base AS base_score
+        FROM public.foods f
+        LEFT JOIN public.food_brands fb ON fb.id = f.brand_id
+        WHERE f.verified = true
+          AND NOT COALESCE((p_filters->>'only_user_foods')::BOOLEAN, false)
+          AND (f.name ILIKE '%' || p_query || '%' OR f.name_en ILIKE '%' || p_query || '%')
+          AND (p_filters->>'category' IS NULL OR f.category = p_filters->>'category')
+          AND (p_filters->>'brand_id' IS NULL OR f.brand_id = (p_filters->>'brand_id')::UUID)
+          AND (p_filters->>'min_calories' IS NULL OR f.calories >= (p_filters->>'min_calories')::DECIMAL)
+          AND (p_filters->>'max_calories' IS NULL OR f.calories <= (p_filters->>'max_calories')::DECIMAL)
+          AND (p_filters->>'is_vegetarian' IS NULL OR f.is_vegetarian = (p_filters->>'is_vegetarian')::BOOLEAN)
+          AND (p_filters->>'is_vegan' IS NULL OR f.is_vegan = (p_filters->>'is_vegan')::BOOLEAN)
+          AND (p_filters->>'is_gluten_free' IS NULL OR f.is_gluten_free = (p_filters->>'is_gluten_free')::BOOLEAN)
+    ),
+    deduped AS (
+        -- One row per lowercase name, preferring the user's own food
+        SELECT DISTINCT ON (lower(c.name))
+            c.*,
+            fav.food_id IS NOT NULL OR fav.user_food_id IS NOT NULL AS is_favorite,
+            fav.use_count
+        FROM candidates c
+        LEFT JOIN public.food_favorites fav
+            ON fav.user_id = p_user_id
+           AND (fav.food_id = c.id OR fav.user_food_id = c.id)
+        ORDER BY lower(c.name), c.source = 'user' DESC
+    ),
+    ranked AS (
+        SELECT
+            d.*,
+            LEAST(
+                1.0,
+                d.base_score
+                + CASE WHEN d.is_favorite THEN 0.3 ELSE 0 END
+                + CASE
+                    WHEN lower(d.name) = lower(p_query) THEN 0.4
+                    WHEN starts_with(lower(d.name), lower(p_query)) THEN 0.3
+                    WHEN position(lower(p_query) IN lower(d.name)) > 0 THEN 0.2
+                    ELSE 0
+                  END
+            ) AS relevance_score
+        FROM deduped d
+    )
+    SELECT
+        r.id,
+        r.source,
+        r.name,
+        r.name_en,
+        r.category,
+        r.brand_name,
+        r.calories,
+        r.protein_g,
+        r.carbs_g,
+        r.fat_g,
+        r.serving_size_g,
+        r.serving_size_description,
+        r.is_favorite,
+        r.use_count,
+        r.relevance_score,
+        COUNT(*) OVER () AS total_count
+    FROM ranked r
+    ORDER BY r.relevance_score DESC, lower(r.name)
+    LIMIT p_limit
+    OFFSET p_offset;
+$$;
+
+-- ============================================================================
+-- ROLLBACK (if needed)
+-- ============================================================================
+
+/*
+-- Re-run 008_search_foods_ranked.sql first, then:
+ALTER TABLE public.foods DROP COLUMN IF EXISTS relevance_base;
+ALTER TABLE public.user_foods DROP COLUMN IF EXISTS relevance_base;
+*/
@@ -0,0 +1,78 @@
+-- Migration: 012_get_daily_meals.sql
+-- Description: Day's meals grouped by type plus nutrition totals in a single RPC
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- get_daily_meals function
+-- ============================================================================
+
+-- The daily meals endpoint fetched every entry of the day and grouped and
+-- summed them in Python. This function groups the entries by meal type and
+-- computes the totals next to the data, returning one JSON document:
+--
+--   {
+--     "breakfast": [...], "lunch": [...], "dinner": [...], "snacks": [...],
+--     "summary": {
+--       "total_entries", "total_calories",
+--       "total_protein_g", "total_carbs_g", "total_fat_g"
+--     }
+--   }
+--
+-- Entries within each group are ordered by time. Macro percentages are left
+-- to the caller so they are rounded the same way as the in-Python summary.
+CREATE OR REPLACE FUNCTION public.get_daily_meals(
+    p_user_id UUID,
+    p_date DATE
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+AS $$
+    WITH day AS (
+        SELECT me.*
+        FROM public.meal_entries me
+        WHERE me.user_id = p_user_id
+          AND me.date = p_date
+    )
+    SELECT jsonb_build_object(
+        'breakfast', COALESCE(
+            (SELECT jsonb_agg(to_jsonb(d) ORDER BY d.time) FROM day d WHERE d.meal_type = 'breakfast'),
+            '[]'::jsonb
+        ),
+        'lunch', COALESCE(
+            (SELECT jsonb_agg(to_jsonb(d) ORDER BY d.time) FROM day d WHERE d.meal_type = 'lunch'),
+            '[]'::jsonb
+        ),
+        'dinner', COALESCE(
+            (SELECT jsonb_agg(to_jsonb(d) ORDER BY d.time) FROM day d WHERE d.meal_type = 'dinner'),
+            '[]'::jsonb
+        ),
+        'snacks', COALESCE(
+            (SELECT jsonb_agg(to_jsonb(d) ORDER BY d.time) FROM day d WHERE d.meal_type = 'snack'),
+            '[]'::jsonb
+        ),
+        'summary', (
+            SELECT jsonb_build_object(
+                'total_entries', COUNT(*),
+                'total_calories', COALESCE(SUM(d.calories), 0),
+                'total_protein_g', COALESCE(SUM(d.protein_g), 0),
+                'total_carbs_g', COALESCE(SUM(d.carbs_g), 0),
+                'total_fat_g', COALESCE(SUM(d.fat_g), 0)
+            )
+            FROM day d
+        )
+    );
+$$;
+
+GRANT EXECUTE ON FUNCTION public.get_daily_meals(UUID, DATE) TO authenticated;
+
+COMMENT ON FUNCTION public.get_daily_meals IS 'Meals of a day grouped by meal type with nutrition totals (used by daily meals endpoint)';
+
+-- ============================================================================
+-- ROLLBACK (if needed)
+-- ============================================================================
+
+/*
+DROP FUNCTION IF EXISTS public.get_daily_meals(UUID, DATE);
+*/
@@ -9,7 +9,11 @@ Tests all validation rules:
 """
 
 import sys
-sys.path.insert(0, 'C:\\dev\\12j\\apps\\backend')
+from pathlib import Path
+
+if __name__ == "__main__":
+    # Make the backend package importable when run as a script from anywhere
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from app.validators.nutrition_validator import get_nutrition_validator, MAX_CALORIES_PER_FOOD
 
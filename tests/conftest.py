@@ -0,0 +1,207 @@
+"""
+Shared fixtures for service tests.
+
+Services are exercised against FakeSupabase, an in-memory stand-in for the
+supabase-py query builder that records every executed query.
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+# Make the backend package importable and satisfy required settings
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+for _name in (
+    "SUPABASE_URL",
+    "SUPABASE_SERVICE_KEY",
+    "SUPABASE_ANON_KEY",
+    "DATABASE_URL",
+    "ANTHROPIC_API_KEY",
+    "SECRET_KEY",
+):
+    os.environ.setdefault(_name, "test")
+
+
+class FakeResponse:
+    """Result of an executed fake query."""
+
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """Chainable query over one in-memory table."""
+
+    def __init__(self, db: "FakeSupabase", table: str):
+        self.db = db
+        self.table = table
+        self.op = "select"
+        self.payload: Any = None
+        self.filters: List[Callable[[Dict[str, Any]], bool]] = []
+        self.bounds: Optional[tuple] = None
+        self.count_mode: Optional[str] = None
+        self.single = False
+
+    # Query building
+
+    def select(self, *columns, count: Optional[str] = None):
+        self.count_mode = count
+        return self
+
+    def insert(self, payload):
+        self.op = "insert"
+        self.payload = payload
+        return self
+
+    def update(self, payload):
+        self.op = "update"
+        self.payload = payload
+        return self
+
+    def delete(self):
+        self.op = "delete"
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) == str(value))
+        return self
+
+    def in_(self, column, values):
+        values = {str(v) for v in values}
+        self.filters.append(lambda row: str(row.get(column)) in values)
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) >= str(value))
+        return self
+
+    def lte(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) <= str(value))
+        return self
+
+    def ilike(self, column, pattern):
+        needle = pattern.strip("%").lower()
+        self.filters.append(lambda row: needle in (row.get(column) or "").lower())
+        return self
+
+    def or_(self, conditions):
+        # Only "column.ilike.%value%" conditions are supported
+        parsed = []
+        for condition in conditions.split(","):
+            column, _, pattern = condition.split(".", 2)
+            parsed.append((column, pattern.strip("%").lower()))
+        self.filters.append(
+            lambda row: any(needle in (row.get(column) or "").lower() for column, needle in parsed)
+        )
+        return self
+
+    def order(self, *args, **kwargs):
+        return self
+
+    def limit(self, *args, **kwargs):
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def maybe_single(self):
+        self.single = True
+        return self
+
+    # Execution
+
+    def execute(self) -> FakeResponse:
+        self.db.executed.append((self.table, self.op))
+        rows = self.db.tables.setdefault(self.table, [])
+
+        if self.op == "insert":
+            payload = self.payload if isinstance(self.payload, list) else [self.payload]
+            inserted = [dict(row, id=f"{self.table}-{len(rows) + i}") for i, row in enumerate(payload)]
+            rows.extend(inserted)
+            return FakeResponse(inserted)
+
+        matched = [row for row in rows if all(f(row) for f in self.filters)]
+
+        if self.op == "update":
+            for row in matched:
+                row.update(self.payload)
+            return FakeResponse(matched)
+
+        if self.op == "delete":
+            self.db.tables[self.table] = [row for row in rows if row not in matched]
+            return FakeResponse(matched)
+
+        if self.single:
+            return FakeResponse(matched[0] if matched else None)
+
+        total = len(matched)
+        if self.bounds is not None:
+            matched = matched[self.bounds[0]:self.bounds[1] + 1]
+        return FakeResponse(matched, total if self.count_mode else None)
+
+
+class FakeRpc:
+    """A pending RPC call; runs the registered handler on execute()."""
+
+    def __init__(self, db: "FakeSupabase", name: str, params: Dict[str, Any]):
+        self.db = db
+        self.name = name
+        self.params = params
+
+    def execute(self) -> FakeResponse:
+        self.db.executed.append((self.name, "rpc"))
+        handler = self.db.rpcs.get(self.name)
+        if handler is None:
+            # What PostgREST reports for a function that doesn't exist
+            raise Exception(f"{{'code': 'PGRST202', 'message': 'Could not find the function public.{self.name}'}}")
+        return FakeResponse(handler(self.params))
+
+
+class FakeSupabase:
+    """In-memory stand-in for the supabase Client."""
+
+    def __init__(self, tables: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        self.tables = tables or {}
+        self.rpcs: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self.executed: List[tuple] = []
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: Dict[str, Any]) -> FakeRpc:
+        return FakeRpc(self, name, params)
+
+    def count(self, table: str, op: str = "select") -> int:
+        """How many queries of a kind were executed."""
+        return self.executed.count((table, op))
+
+
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    """Start every test with empty process-local caches and RPCs enabled."""
+    from app.services import daily_summary_service, food_service, meal_entry_service
+    from app.validators.nutrition_validator import _validate_food_cached
+
+    def reset():
+        daily_summary_service._goals_cache.clear()
+        daily_summary_service._summary_cache.clear()
+        food_service._favorites_cache.clear()
+        food_service._system_food_cache.clear()
+        food_service._ranked_search_available = True
+        meal_entry_service._entry_count_cache.clear()
+        meal_entry_service._daily_meals_rpc_available = True
+        _validate_food_cached.cache_clear()
+
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture
+def fake_db() -> FakeSupabase:
+    return FakeSupabase()
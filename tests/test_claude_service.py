@@ -0,0 +1,156 @@
+"""
+Tests for ClaudeService: legacy nutrition validation and single-flight
+coalescing of identical food extractions.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import claude_service
+from app.services.claude_service import ClaudeService
+
+
+@pytest.fixture
+def service(monkeypatch, fake_db):
+    monkeypatch.setattr(claude_service, "get_supabase_client", lambda: fake_db)
+    service = ClaudeService()
+    service.extractions = 0
+
+    async def fake_extract(text, personality, max_retries):
+        service.extractions += 1
+        await asyncio.sleep(0.05)
+        return {"foods": [{"name": text}], "total_calories": 0}
+
+    service._extract_food = fake_extract
+    return service
+
+
+# =====================================================
+# LEGACY VALIDATION
+# =====================================================
+
+def test_validated_foods_are_plain_dicts(service):
+    result = service._validate_nutrition_data({
+        "foods": [
+            {"name": " Rice ", "quantity": "150", "unit": "g", "calories": 195,
+             "protein_g": 4.05, "carbs_g": 42.0, "fat_g": 0.45},
+            {"name": "Toast", "quantity": 1, "calories": 120,
+             "protein_g": 3, "carbs_g": 15, "fat_g": 1},
+        ],
+        "message": "Logged!"
+    })
+
+    # Toast's stated calories are off by more than 5% and get recomputed
+    assert result["foods"] == [
+        {"name": "Rice", "quantity": 150.0, "unit": "g", "calories": 195.0,
+         "protein_g": 4.05, "carbs_g": 42.0, "fat_g": 0.45},
+        {"name": "Toast", "quantity": 1.0, "unit": "g", "calories": 81.0,
+         "protein_g": 3.0, "carbs_g": 15.0, "fat_g": 1.0},
+    ]
+    assert all(type(food) is dict for food in result["foods"])
+    assert result["total_calories"] == 276.0
+    assert result["total_macros"] == {"protein": 7.05, "carbs": 57.0, "fat": 1.45}
+    assert result["message"] == "Logged!"
+
+
+def test_invalid_foods_are_clamped_or_skipped(service):
+    result = service._validate_nutrition_data({
+        "foods": [
+            {"name": "Oil", "quantity": 10, "calories": 90,
+             "protein_g": -1, "carbs_g": 0, "fat_g": 10},
+            {"name": "Nothing", "quantity": 0, "calories": 100,
+             "protein_g": 5, "carbs_g": 10, "fat_g": 2},
+            {"name": "Partial", "quantity": 100, "calories": 100},
+        ]
+    })
+
+    assert [food["name"] for food in result["foods"]] == ["Oil"]
+    assert result["foods"][0]["protein_g"] == 0.0
+    assert result["message"] == "Food logged successfully!"
+
+
+def test_missing_foods_array_is_rejected(service):
+    with pytest.raises(ValueError, match="'foods' array required"):
+        service._validate_nutrition_data({"foods": None})
+
+
+# =====================================================
+# SINGLE-FLIGHT EXTRACTION
+# =====================================================
+
+async def _started(coro):
+    """Schedule a coroutine and let it reach its first await."""
+    task = asyncio.create_task(coro)
+    await asyncio.sleep(0.01)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_extraction(service):
+    results = await asyncio.gather(
+        *(service.extract_food_from_text("2 eggs") for _ in range(3))
+    )
+
+    assert service.extractions == 1
+    assert all(result == results[0] for result in results)
+    # Every caller gets its own copy
+    assert len({id(result["foods"]) for result in results}) == 3
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_different_requests_are_not_coalesced(service):
+    await asyncio.gather(
+        service.extract_food_from_text("2 eggs"),
+        service.extract_food_from_text("2 eggs", personality="strict"),
+        service.extract_food_from_text("toast"),
+    )
+
+    assert service.extractions == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_waiters(service):
+    leader = await _started(service.extract_food_from_text("2 eggs"))
+    waiters = [await _started(service.extract_food_from_text("2 eggs")) for _ in range(2)]
+
+    leader.cancel()
+    results = await asyncio.gather(*waiters)
+
+    assert leader.cancelled()
+    assert [result["foods"] for result in results] == [[{"name": "2 eggs"}]] * 2
+    # One waiter re-ran the extraction, the other waited on it
+    assert service.extractions == 2
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_leader(service):
+    leader = await _started(service.extract_food_from_text("2 eggs"))
+    waiter = await _started(service.extract_food_from_text("2 eggs"))
+
+    waiter.cancel()
+    result = await leader
+
+    assert result["foods"] == [{"name": "2 eggs"}]
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+@pytest.mark.asyncio
+async def test_leader_errors_reach_waiters(service):
+    async def failing_extract(text, personality, max_retries):
+        await asyncio.sleep(0.05)
+        raise TimeoutError("Claude API timeout")
+
+    service._extract_food = failing_extract
+
+    results = await asyncio.gather(
+        service.extract_food_from_text("2 eggs"),
+        service.extract_food_from_text("2 eggs"),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, TimeoutError) for result in results)
+    assert service._inflight == {}
@@ -0,0 +1,646 @@
+"""
+Tests for DailySummaryService: summaries built from the daily_meal_totals
+view and batched entry fetches must match the original per-entry Decimal
+calculations on the same rows.
+"""
+
+import statistics
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.schemas.daily_summary import (
+    CalorieBalance,
+    CalorieProgress,
+    ComparisonDay,
+    ComparisonDifference,
+    DailyData,
+    DailyTotals,
+    EatingWindow,
+    MacroProgress,
+    MealTypeBreakdown,
+    WeeklyAverages,
+    WeeklyTrends,
+)
+from app.services import daily_summary_service
+from app.services.daily_summary_service import (
+    DailySummaryService,
+    _grams_to_decimal,
+    _should_project_cached,
+    invalidate_goals,
+)
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+OTHER_USER_ID = "00000000-0000-0000-0000-000000000002"
+WEEK_START = date(2026, 1, 5)
+WEEK_END = date(2026, 1, 11)
+GOALS = {"daily_calories": 2000, "protein_g": 150, "carbs_g": 200.5, "fat_g": 65}
+
+
+def _entry(day, at, meal_type, calories, protein, carbs, fat, user_id=USER_ID):
+    return {
+        "user_id": user_id,
+        "date": day,
+        "time": at,
+        "meal_type": meal_type,
+        "calories": calories,
+        "protein_g": protein,
+        "carbs_g": carbs,
+        "fat_g": fat,
+    }
+
+
+ENTRIES = [
+    # Outside the week
+    _entry("2026-01-04", "08:00:00", "breakfast", 500, 20.0, 60.0, 15.0),
+    _entry("2026-01-12", "08:00:00", "breakfast", 450, 18.0, 55.0, 14.0),
+    # Full day
+    _entry("2026-01-05", "08:00:00", "breakfast", 420, 30.25, 45.5, 12.1),
+    _entry("2026-01-05", "13:30:00", "lunch", 650, 40.1, 70.35, 20.05),
+    _entry("2026-01-05", "19:45:00", "dinner", 700, 35.05, 60.2, 30.15),
+    # Sub-gram sums that are inexact as floats
+    _entry("2026-01-07", "07:15:00", "breakfast", 300, 0.1, 50.0, 5.0),
+    _entry("2026-01-07", "10:00:00", "snack", 150, 0.2, 20.0, 6.05),
+    _entry("2026-01-07", "16:30:00", "snack", 200, 1.15, 25.1, 8.0),
+    _entry("2026-01-07", "20:00:00", "dinner", 900, 0.1, 90.0, 40.25),
+    # Totals on a half-way point (0.25 -> 0.2, 0.35 -> 0.4)
+    _entry("2026-01-08", "12:00:00", "lunch", 510, 0.1, 0.3, 55.0),
+    _entry("2026-01-08", "15:00:00", "snack", 90, 0.15, 0.05, 10.0),
+    # Another user's meals on a day with data
+    _entry("2026-01-09", "09:00:00", "breakfast", 2100, 120.45, 210.3, 70.2),
+    _entry("2026-01-09", "10:00:00", "breakfast", 999, 9.0, 9.0, 9.0, user_id=OTHER_USER_ID),
+    # Single late meal (intermittent fasting)
+    _entry("2026-01-11", "18:00:00", "dinner", 1200, 80.5, 110.0, 45.3),
+    _entry("2026-01-11", "21:59:00", "snack", 250, 5.0, 30.0, 12.0),
+]
+
+
+def _daily_meal_totals(entries):
+    """daily_meal_totals rows as the view (migrations 006/007) returns them."""
+    groups = {}
+    for e in entries:
+        groups.setdefault((e["user_id"], e["date"], e["meal_type"]), []).append(e)
+
+    rows = []
+    for (user_id, day, meal_type), group in groups.items():
+        rows.append({
+            "user_id": user_id,
+            "date": day,
+            "meal_type": meal_type,
+            "calories": sum(e["calories"] for e in group),
+            # numeric sums are exact in Postgres and arrive as JSON numbers
+            "protein_g": float(sum(Decimal(str(e["protein_g"])) for e in group)),
+            "carbs_g": float(sum(Decimal(str(e["carbs_g"])) for e in group)),
+            "fat_g": float(sum(Decimal(str(e["fat_g"])) for e in group)),
+            "meal_count": len(group),
+            "first_meal": min(e["time"] for e in group),
+            "last_meal": max(e["time"] for e in group),
+        })
+    return rows
+
+
+def _entries_for(day, user_id=USER_ID):
+    return sorted(
+        (e for e in ENTRIES if e["date"] == str(day) and e["user_id"] == user_id),
+        key=lambda e: e["time"]
+    )
+
+
+# =====================================================
+# REFERENCE: the per-entry Decimal calculations the service replaced
+# =====================================================
+
+def _reference_totals(target_date, entries):
+    if not entries:
+        return DailyTotals(
+            date=target_date, total_calories=0, total_protein=Decimal("0"),
+            total_carbs=Decimal("0"), total_fat=Decimal("0"), protein_percent=0.0,
+            carbs_percent=0.0, fat_percent=0.0, meal_count=0
+        )
+
+    total_calories = sum(e["calories"] for e in entries)
+    total_protein = sum(Decimal(str(e["protein_g"])) for e in entries)
+    total_carbs = sum(Decimal(str(e["carbs_g"])) for e in entries)
+    total_fat = sum(Decimal(str(e["fat_g"])) for e in entries)
+
+    return DailyTotals(
+        date=target_date,
+        total_calories=total_calories,
+        total_protein=round(total_protein, 1),
+        total_carbs=round(total_carbs, 1),
+        total_fat=round(total_fat, 1),
+        protein_percent=round((float(total_protein) * 4 / total_calories) * 100, 1),
+        carbs_percent=round((float(total_carbs) * 4 / total_calories) * 100, 1),
+        fat_percent=round((float(total_fat) * 9 / total_calories) * 100, 1),
+        meal_count=len(entries)
+    )
+
+
+def _reference_breakdown(entries, total_calories):
+    by_type = {}
+    for e in entries:
+        by_type.setdefault(e["meal_type"], []).append(e)
+
+    breakdowns = [
+        MealTypeBreakdown(
+            meal_type=meal_type,
+            calories=sum(e["calories"] for e in group),
+            protein_g=round(sum(Decimal(str(e["protein_g"])) for e in group), 1),
+            carbs_g=round(sum(Decimal(str(e["carbs_g"])) for e in group), 1),
+            fat_g=round(sum(Decimal(str(e["fat_g"])) for e in group), 1),
+            percent_of_daily=round(sum(e["calories"] for e in group) / total_calories * 100, 1),
+            meal_count=len(group)
+        )
+        for meal_type, group in by_type.items()
+    ]
+    meal_order = {"breakfast": 0, "lunch": 1, "dinner": 2, "snack": 3}
+    breakdowns.sort(key=lambda x: meal_order.get(x.meal_type, 99))
+    return breakdowns
+
+
+def _reference_eating_window(entries):
+    if not entries:
+        return EatingWindow(
+            first_meal_time=None, last_meal_time=None, eating_window_hours=None,
+            fasting_window_hours=None, is_intermittent_fasting=False
+        )
+
+    times = [datetime.strptime(e["time"], "%H:%M:%S").time() for e in entries]
+    first, last = min(times), max(times)
+    hours = ((last.hour * 60 + last.minute) - (first.hour * 60 + first.minute)) / 60
+    return EatingWindow(
+        first_meal_time=first,
+        last_meal_time=last,
+        eating_window_hours=round(hours, 1),
+        fasting_window_hours=round(24 - hours, 1),
+        is_intermittent_fasting=24 - hours >= 16
+    )
+
+
+def _reference_status(percent):
+    if percent < 80:
+        return "under"
+    if percent > 115:
+        return "over"
+    return "on_track"
+
+
+def _reference_macro_progress(consumed, goal):
+    goal = Decimal(str(goal))
+    percent = float(consumed) / float(goal) * 100
+    return MacroProgress(
+        consumed=round(consumed, 1),
+        goal=round(goal, 1),
+        remaining=round(goal - consumed, 1),
+        percent=round(percent, 1),
+        status=_reference_status(percent)
+    )
+
+
+def _reference_daily_data(start_date, end_date, user_id=USER_ID):
+    daily_data = []
+    current = start_date
+    while current <= end_date:
+        entries = _entries_for(current, user_id)
+        if entries:
+            totals = _reference_totals(current, entries)
+            daily_data.append(DailyData(
+                date=current,
+                calories=totals.total_calories,
+                protein=totals.total_protein,
+                carbs=totals.total_carbs,
+                fat=totals.total_fat,
+                meal_count=totals.meal_count
+            ))
+        current += timedelta(days=1)
+    return daily_data
+
+
+def _reference_weekly_trends(start_date, end_date):
+    daily_data = _reference_daily_data(start_date, end_date)
+    n = len(daily_data)
+
+    if n:
+        averages = WeeklyAverages(
+            calories=round(sum(d.calories for d in daily_data) / n, 1),
+            protein=round(float(sum(d.protein for d in daily_data) / n), 1),
+            carbs=round(float(sum(d.carbs for d in daily_data) / n), 1),
+            fat=round(float(sum(d.fat for d in daily_data) / n), 1),
+            meal_count=round(sum(d.meal_count for d in daily_data) / n, 1)
+        )
+    else:
+        averages = WeeklyAverages(calories=0, protein=0, carbs=0, fat=0, meal_count=0)
+
+    trend = "stable"
+    variance = 0.0
+    if n >= 2:
+        calories = [d.calories for d in daily_data]
+        first = sum(calories[:n // 2]) / (n // 2)
+        second = sum(calories[n // 2:]) / (n - n // 2)
+        change = (second - first) / first if first > 0 else 0
+        if change > 0.05:
+            trend = "increasing"
+        elif change < -0.05:
+            trend = "decreasing"
+        mean = statistics.mean(calories)
+        variance = statistics.stdev(calories) / mean * 100 if mean > 0 else 0
+
+    consistency = 1.0 if variance <= 0 else 0.0 if variance >= 40 else 1.0 - variance / 40
+
+    return WeeklyTrends(
+        date_range=[start_date, end_date],
+        days_with_data=n,
+        daily_averages=averages,
+        daily_data=daily_data,
+        trend=trend,
+        variance=round(variance, 2),
+        consistency_score=round(consistency, 2)
+    )
+
+
+def _reference_comparison_days(dates):
+    days = []
+    for target_date in dates:
+        totals = _reference_totals(target_date, _entries_for(target_date))
+        days.append(ComparisonDay(
+            date=target_date,
+            calories=totals.total_calories,
+            protein=totals.total_protein,
+            carbs=totals.total_carbs,
+            fat=totals.total_fat,
+            meal_count=totals.meal_count
+        ))
+    return days
+
+
+def _dump(model):
+    # JSON mode keeps Decimal scale ("0.2" vs "0.20") significant
+    return model.model_dump(mode="json")
+
+
+@pytest.fixture
+def summary_db(fake_db):
+    fake_db.tables["meal_entries"] = [dict(e) for e in ENTRIES]
+    fake_db.tables["daily_meal_totals"] = _daily_meal_totals(ENTRIES)
+    fake_db.tables["profiles"] = [{"user_id": USER_ID, **GOALS}]
+    return fake_db
+
+
+@pytest.fixture
+def service(summary_db):
+    return DailySummaryService(summary_db)
+
+
+# =====================================================
+# DAILY SUMMARY FROM THE daily_meal_totals VIEW
+# =====================================================
+
+SUMMARY_DATES = [
+    date(2026, 1, 5), date(2026, 1, 6), date(2026, 1, 7),
+    date(2026, 1, 8), date(2026, 1, 9), date(2026, 1, 11),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("target_date", SUMMARY_DATES)
+async def test_daily_summary_matches_per_entry_totals(service, summary_db, target_date):
+    entries = _entries_for(target_date)
+    expected_totals = _reference_totals(target_date, entries)
+
+    summary = await service.get_daily_summary(USER_ID, target_date, include_projection=False)
+
+    assert _dump(summary.totals) == _dump(expected_totals)
+    assert [_dump(b) for b in summary.by_meal_type] == [
+        _dump(b) for b in _reference_breakdown(entries, expected_totals.total_calories)
+    ]
+    assert _dump(summary.eating_window) == _dump(_reference_eating_window(entries))
+    assert summary.has_goals is True
+    assert summary.projection is None
+    assert summary_db.count("meal_entries") == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("target_date", SUMMARY_DATES)
+async def test_daily_summary_progress_matches_per_entry_totals(service, target_date):
+    totals = _reference_totals(target_date, _entries_for(target_date))
+    consumed = totals.total_calories
+    percent = consumed / GOALS["daily_calories"] * 100
+    deficit = GOALS["daily_calories"] - consumed
+
+    summary = await service.get_daily_summary(USER_ID, target_date, include_projection=False)
+
+    assert _dump(summary.calorie_progress) == _dump(CalorieProgress(
+        consumed=consumed,
+        goal=GOALS["daily_calories"],
+        remaining=deficit,
+        percent=round(percent, 1),
+        status=_reference_status(percent)
+    ))
+    for progress, consumed_g, goal_g in (
+        (summary.protein_progress, totals.total_protein, GOALS["protein_g"]),
+        (summary.carbs_progress, totals.total_carbs, GOALS["carbs_g"]),
+        (summary.fat_progress, totals.total_fat, GOALS["fat_g"]),
+    ):
+        assert _dump(progress) == _dump(_reference_macro_progress(consumed_g, goal_g))
+    assert _dump(summary.calorie_balance) == _dump(CalorieBalance(
+        consumed=consumed,
+        goal=GOALS["daily_calories"],
+        deficit=deficit,
+        deficit_percent=round(deficit / GOALS["daily_calories"] * 100, 1),
+        weekly_impact=deficit * 7,
+        weekly_weight_change=round(deficit * 7 / 7700, 2)
+    ))
+
+
+@pytest.mark.asyncio
+async def test_daily_summary_rounds_totals_half_even(service):
+    summary = await service.get_daily_summary(USER_ID, date(2026, 1, 8), include_projection=False)
+
+    assert str(summary.totals.total_protein) == "0.2"  # 0.1 + 0.15
+    assert str(summary.totals.total_carbs) == "0.4"    # 0.3 + 0.05
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.25, "0.2"),
+    (0.35, "0.4"),
+    (2.45, "2.4"),
+    (0.1 + 0.2, "0.3"),
+    (1.15 + 0.1, "1.2"),
+    (0.1 + 0.15, "0.2"),
+    (120.45 + 0.1, "120.6"),
+    (0.0, "0.0"),
+])
+def test_grams_to_decimal_matches_decimal_rounding(value, expected):
+    assert str(_grams_to_decimal(value)) == expected
+
+
+def test_grams_to_decimal_matches_decimal_sums():
+    grams = [0.05, 0.1, 0.15, 0.2, 0.25, 1.15, 2.45, 12.35, 40.05]
+    for a in grams:
+        for b in grams:
+            for c in grams:
+                exact = Decimal(str(a)) + Decimal(str(b)) + Decimal(str(c))
+                assert _grams_to_decimal(a + b + c) == round(exact, 1), (a, b, c)
+
+
+@pytest.mark.parametrize("first, last", [
+    ("08:00:00", "19:45:00"),
+    ("18:00:00", "21:59:00"),
+    ("12:00:00", "12:00:00"),
+    ("00:05:59", "23:59:59"),
+    (time(7, 15), time(20, 0)),
+])
+def test_eating_window_from_bounds_matches_entry_times(first, last):
+    service = DailySummaryService(None)
+    entries = [
+        {"time": t if isinstance(t, str) else t.strftime("%H:%M:%S")}
+        for t in (last, first)
+    ]
+
+    window = service._calculate_eating_window_from_bounds(first, last)
+
+    assert _dump(window) == _dump(_reference_eating_window(entries))
+
+
+@pytest.mark.parametrize("first, last", [(None, None), ("08:00:00", None), (None, "08:00:00")])
+def test_eating_window_without_bounds_is_empty(first, last):
+    service = DailySummaryService(None)
+
+    window = service._calculate_eating_window_from_bounds(first, last)
+
+    assert _dump(window) == _dump(_reference_eating_window([]))
+
+
+# =====================================================
+# GOALS CACHE
+# =====================================================
+
+@pytest.mark.asyncio
+async def test_goals_are_fetched_once_per_user(service, summary_db):
+    await service.get_daily_summary(USER_ID, date(2026, 1, 5), include_projection=False)
+    await service.get_daily_summary(USER_ID, date(2026, 1, 7), include_projection=False)
+
+    assert summary_db.count("profiles") == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_goals_are_not_cached(service, summary_db):
+    summary_db.tables["profiles"] = []
+    first = await service.get_daily_summary(USER_ID, date(2026, 1, 5), include_projection=False)
+
+    summary_db.tables["profiles"] = [{"user_id": USER_ID, **GOALS}]
+    second = await service.get_daily_summary(USER_ID, date(2026, 1, 7), include_projection=False)
+
+    assert first.has_goals is False
+    assert second.has_goals is True
+    assert summary_db.count("profiles") == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_goals_are_refetched(service, summary_db):
+    await service._get_user_goals(USER_ID)
+    _, goals = daily_summary_service._goals_cache[USER_ID]
+    daily_summary_service._goals_cache[USER_ID] = (0.0, goals)
+
+    await service._get_user_goals(USER_ID)
+
+    assert summary_db.count("profiles") == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_goals_refreshes_goal_progress(service, summary_db):
+    await service.get_daily_summary(USER_ID, date(2026, 1, 5), include_projection=False)
+    summary_db.tables["profiles"][0]["daily_calories"] = 2500
+
+    invalidate_goals(USER_ID)
+    summary = await service.get_daily_summary(USER_ID, date(2026, 1, 5), include_projection=False)
+
+    assert summary.calorie_progress.goal == 2500
+    assert summary_db.count("profiles") == 2
+
+
+# =====================================================
+# WEEKLY TRENDS AND DAY COMPARISONS
+# =====================================================
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("start_date, end_date", [
+    (WEEK_START, WEEK_END),
+    (date(2026, 1, 4), date(2026, 1, 12)),
+    (date(2026, 1, 6), date(2026, 1, 6)),
+    # Carbs average to exactly 105.35 (reported as 105.3)
+    (date(2026, 1, 8), date(2026, 1, 9)),
+])
+async def test_weekly_trends_match_per_day_calculation(service, summary_db, start_date, end_date):
+    trends = await service.get_weekly_trends(USER_ID, start_date, end_date)
+
+    assert _dump(trends) == _dump(_reference_weekly_trends(start_date, end_date))
+    # The whole range comes from one query
+    assert summary_db.count("meal_entries") == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dates", [
+    [date(2026, 1, 5), date(2026, 1, 7)],
+    [date(2026, 1, 7), date(2026, 1, 6)],
+    [date(2026, 1, 11), date(2026, 1, 4), date(2026, 1, 8)],
+    [date(2026, 1, 9)],
+])
+async def test_compare_days_matches_per_day_calculation(service, summary_db, dates):
+    result = await service.compare_days(USER_ID, dates)
+    expected_days = _reference_comparison_days(dates)
+
+    assert [_dump(d) for d in result.days] == [_dump(d) for d in expected_days]
+    if len(dates) == 2:
+        day1, day2 = expected_days
+        cal_diff = day2.calories - day1.calories
+        assert _dump(result.difference) == _dump(ComparisonDifference(
+            calories=cal_diff,
+            protein=day2.protein - day1.protein,
+            carbs=day2.carbs - day1.carbs,
+            fat=day2.fat - day1.fat,
+            calories_percent=round(cal_diff / day1.calories * 100, 1) if day1.calories > 0 else 0
+        ))
+    else:
+        assert result.difference is None
+    assert summary_db.count("meal_entries") == 1
+
+
+@pytest.mark.asyncio
+async def test_compare_days_without_dates_skips_the_query(service, summary_db):
+    result = await service.compare_days(USER_ID, [])
+
+    assert result.days == []
+    assert summary_db.count("meal_entries") == 0
+
+
+@pytest.mark.asyncio
+async def test_dates_fetch_returns_only_the_requested_days(service):
+    dates = [date(2026, 1, 11), date(2026, 1, 5), date(2026, 1, 9)]
+
+    entries = await service._get_meal_entries_for_dates(USER_ID, dates)
+
+    expected = [e for d in dates for e in _entries_for(d)]
+    assert sorted((e["date"], e["time"]) for e in entries) == sorted(
+        (e["date"], e["time"]) for e in expected
+    )
+
+
+@pytest.mark.asyncio
+async def test_compare_days_handles_repeated_dates(service, summary_db):
+    result = await service.compare_days(USER_ID, [date(2026, 1, 7), date(2026, 1, 7)])
+
+    assert [d.calories for d in result.days] == [1550, 1550]
+    assert result.difference.calories == 0
+    assert result.difference.calories_percent == 0.0
+    assert summary_db.count("meal_entries") == 1
+
+
+# =====================================================
+# TREND AND VARIANCE
+# =====================================================
+
+@pytest.mark.parametrize("calories, trend", [
+    ([], "stable"),
+    ([1800], "stable"),
+    ([2000, 2000], "stable"),
+    ([1800, 2200], "increasing"),
+    ([2400, 2100, 1800, 1500, 1200], "decreasing"),
+    ([2000, 2010, 1990, 2005], "stable"),
+    ([0, 0, 0], "stable"),
+    ([0, 1500], "stable"),
+    ([1, 1_000_000, 3], "increasing"),
+])
+def test_variance_and_trend_match_two_pass_statistics(calories, trend):
+    service = DailySummaryService(None)
+    if len(calories) >= 2 and statistics.mean(calories) > 0:
+        expected = statistics.stdev(calories) / statistics.mean(calories) * 100
+    else:
+        expected = 0.0
+
+    assert service._calculate_variance(calories) == pytest.approx(expected, rel=1e-12)
+    assert service._analyze_trend(calories) == trend
+
+
+# =====================================================
+# END-OF-DAY PROJECTION
+# =====================================================
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Pin daily_summary_service's datetime.now() to a given moment."""
+    def set_clock(moment):
+        class FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return moment
+
+        monkeypatch.setattr(daily_summary_service, "datetime", FixedDatetime)
+
+    return set_clock
+
+
+def _logged(*meal_types):
+    return [
+        MealTypeBreakdown(
+            meal_type=meal_type, calories=100, protein_g=Decimal("1"), carbs_g=Decimal("1"),
+            fat_g=Decimal("1"), percent_of_daily=10.0, meal_count=1
+        )
+        for meal_type in meal_types
+    ]
+
+
+@pytest.mark.parametrize(
+    "logged, hour, current, goal, remaining, confidence, recommendation, projected",
+    [
+        ((), 9, 0, 2000, ["breakfast", "lunch", "dinner", "snack"], 0.5, "need_more", 2000),
+        (("breakfast",), 13, 500, 2000, ["lunch", "dinner", "snack"], 0.6, "need_more", 2000),
+        (("snack", "dinner"), 12, 1500, 2000, ["breakfast", "lunch"], 0.6, "on_track", 2000),
+        (("breakfast", "lunch", "dinner"), 17, 1500, 2000, ["snack"], 0.85, "on_track", 2000),
+        (("dinner", "lunch", "breakfast", "snack"), 21, 2300, 2000, [], 1.0, "slow_down", 2300),
+        # Unknown meal types set no bit; repeated types count once
+        (("brunch", "lunch", "lunch"), 10, 800, 1000, ["breakfast", "dinner", "snack"], 0.5,
+         "on_track", 1000),
+    ]
+)
+def test_projection_branches(clock, logged, hour, current, goal, remaining, confidence,
+                             recommendation, projected):
+    clock(datetime(2026, 1, 11, hour, 30))
+    service = DailySummaryService(None)
+
+    projection = service._calculate_projection(date(2026, 1, 11), current, goal, _logged(*logged))
+
+    # Meals remaining come back in display order
+    assert projection.meals_remaining == remaining
+    assert projection.confidence == confidence
+    assert projection.recommendation == recommendation
+    assert projection.projected_total == projected
+    assert projection.remaining_budget == goal - current
+    assert projection.suggested_calories == max(0, goal - current)
+    assert projection.current_time == time(hour, 30)
+
+
+@pytest.mark.parametrize("target_date, hour, expected", [
+    (date(2026, 1, 11), 0, True),
+    (date(2026, 1, 11), 22, True),
+    (date(2026, 1, 11), 23, False),
+    (date(2026, 1, 10), 12, False),
+    (date(2026, 1, 12), 12, False),
+])
+def test_should_project_only_today_before_eleven_pm(target_date, hour, expected):
+    assert _should_project_cached(target_date, date(2026, 1, 11), hour) is expected
+
+
+@pytest.mark.asyncio
+async def test_todays_summary_is_projected_and_not_cached(service, summary_db, clock):
+    clock(datetime(2026, 1, 11, 17, 0))
+
+    first = await service.get_daily_summary(USER_ID, date(2026, 1, 11))
+    second = await service.get_daily_summary(USER_ID, date(2026, 1, 11))
+
+    assert first.projection.meals_remaining == ["breakfast", "lunch"]
+    assert first.projection.current_calories == 1450
+    assert first.projection.recommendation == "on_track"
+    assert _dump(second) == _dump(first)
+    assert summary_db.count("daily_meal_totals") == 2
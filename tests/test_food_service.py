@@ -0,0 +1,192 @@
+"""
+Tests for FoodSearchService: ranked search through the search_foods_ranked
+RPC (migration 008), the fallback when it is missing, and batched lookups
+that must match the single-food ones.
+"""
+
+import pytest
+
+from app.services import food_service
+from app.services.food_service import FoodSearchService
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _food(food_id, name, **extra):
+    food = {
+        "id": food_id,
+        "name": name,
+        "category": "test",
+        "calories": 100,
+        "protein_g": 5,
+        "carbs_g": 10,
+        "fat_g": 2,
+        "serving_size_g": 100,
+    }
+    food.update(extra)
+    return food
+
+
+def _rpc_relevance(row, query, favorite_ids):
+    """Relevance exactly as computed by search_foods_ranked."""
+    name = row["name"].lower()
+    query = query.lower()
+    if name == query:
+        match = 0.4
+    elif name.startswith(query):
+        match = 0.3
+    elif query in name:
+        match = 0.2
+    else:
+        match = 0.0
+    base = 0.8 if row["source"] == "user" else 0.6
+    favorite = 0.3 if row["id"] in favorite_ids else 0.0
+    return min(1.0, base + favorite + match)
+
+
+@pytest.fixture
+def search_db(fake_db):
+    fake_db.tables["user_foods"] = [
+        _food("u-rice", "Rice Bowl", user_id=USER_ID),
+        _food("u-egg", "Egg", user_id=USER_ID),
+    ]
+    fake_db.tables["foods"] = [
+        _food("s-rice", "Rice", verified=True),
+        _food("s-brown", "Brown rice", verified=True),
+        _food("s-egg", "egg", verified=True),  # Duplicate of the user's Egg
+        _food("s-apple", "Apple", verified=True),
+    ]
+    fake_db.tables["food_favorites"] = [
+        {"user_id": USER_ID, "food_id": "s-apple", "user_food_id": None, "use_count": 3},
+    ]
+    return fake_db
+
+
+# =====================================================
+# RANKED SEARCH RPC
+# =====================================================
+
+@pytest.mark.asyncio
+async def test_ranked_rpc_result_is_used_when_available(search_db):
+    search_db.rpcs["search_foods_ranked"] = lambda params: [
+        {
+            **_food("s-rice", "Rice"),
+            "source": "system",
+            "relevance_score": 1.0,
+            "is_favorite": False,
+            "total_count": 7,
+        }
+    ]
+    service = FoodSearchService(search_db)
+
+    results, total = await service.search_foods(USER_ID, "rice")
+
+    assert [row["id"] for row in results] == ["s-rice"]
+    assert total == 7
+    assert search_db.count("foods") == 0
+
+
+@pytest.mark.asyncio
+async def test_missing_rpc_is_not_retried(search_db):
+    service = FoodSearchService(search_db)
+
+    await service.search_foods(USER_ID, "rice")
+    results, _ = await service.search_foods(USER_ID, "rice")
+
+    assert {row["id"] for row in results} == {"u-rice", "s-rice", "s-brown"}
+    assert search_db.count("search_foods_ranked", "rpc") == 1
+
+
+# =====================================================
+# FALLBACK RANKING
+# =====================================================
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["rice", "Rice", "egg", "apple", "ice", ""])
+async def test_fallback_relevance_matches_rpc(search_db, query):
+    service = FoodSearchService(search_db)
+
+    results, total = await service.search_foods(USER_ID, query, page_size=50)
+
+    assert food_service._ranked_search_available is False
+    assert total == len(results)
+    for row in results:
+        assert row["relevance_score"] == pytest.approx(
+            _rpc_relevance(row, query, {"s-apple"})
+        ), row["name"]
+
+
+@pytest.mark.asyncio
+async def test_browse_gives_every_result_the_starts_with_bonus(search_db):
+    service = FoodSearchService(search_db)
+
+    results, _ = await service.search_foods(USER_ID, "", page_size=50)
+    scores = {row["id"]: row["relevance_score"] for row in results}
+
+    # User foods and favorites cap at 1.0; other system foods get 0.6 + 0.3
+    assert scores["u-rice"] == pytest.approx(1.0)
+    assert scores["s-apple"] == pytest.approx(1.0)
+    assert scores["s-rice"] == pytest.approx(0.9)
+
+
+@pytest.mark.asyncio
+async def test_fallback_prefers_user_foods_over_system_duplicates(search_db):
+    service = FoodSearchService(search_db)
+
+    results, _ = await service.search_foods(USER_ID, "egg", page_size=50)
+
+    assert [row["id"] for row in results] == ["u-egg"]
+
+
+# =====================================================
+# BATCHED LOOKUPS
+# =====================================================
+
+@pytest.mark.asyncio
+async def test_batched_lookup_matches_single_lookups(search_db):
+    food_ids = ["s-rice", "s-egg", "s-apple"]
+    service = FoodSearchService(search_db)
+    single = {food_id: await service.get_food_by_id(food_id) for food_id in food_ids}
+    food_service._system_food_cache.clear()
+
+    batch = await service.get_foods_by_ids(food_ids)
+
+    assert batch == single
+
+
+@pytest.mark.asyncio
+async def test_batched_lookup_fetches_missing_foods_in_one_query(search_db):
+    search_db.tables["foods"].append(_food("s-draft", "Draft", verified=False))
+    service = FoodSearchService(search_db)
+
+    foods = await service.get_foods_by_ids(["s-rice", "s-egg", "s-rice", "s-draft", "nope"])
+
+    # Unverified and unknown ids are omitted
+    assert list(foods) == ["s-rice", "s-egg"]
+    assert search_db.count("foods") == 1
+
+
+@pytest.mark.asyncio
+async def test_batched_lookup_serves_cached_foods_as_copies(search_db):
+    service = FoodSearchService(search_db)
+    await service.get_food_by_id("s-rice")
+
+    foods = await service.get_foods_by_ids(["s-rice"])
+    foods["s-rice"]["name"] = "Changed"
+    again = await service.get_foods_by_ids(["s-rice"])
+
+    assert again["s-rice"]["name"] == "Rice"
+    assert search_db.count("foods") == 1
+
+
+@pytest.mark.asyncio
+async def test_batched_user_food_lookup_is_scoped_to_the_user(search_db):
+    search_db.tables["user_foods"].append(_food("u-other", "Other", user_id="someone-else"))
+    service = FoodSearchService(search_db)
+
+    foods = await service.get_user_foods_by_ids(["u-rice", "u-other", "u-rice"], USER_ID)
+
+    assert list(foods) == ["u-rice"]
+    assert foods["u-rice"]["name"] == "Rice Bowl"
+    assert await service.get_user_foods_by_ids([], USER_ID) == {}
+    assert search_db.count("user_foods") == 1
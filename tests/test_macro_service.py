@@ -0,0 +1,233 @@
+"""
+Tests for macro_service: the columnar and single-pass helpers must give the
+same numbers as the straightforward per-item calculations, and free-text
+amounts must resolve to known units.
+"""
+
+import logging
+from decimal import Decimal
+
+import pytest
+
+from app.services.macro_service import (
+    NUTRITION_FIELDS,
+    MacroCalculationService,
+    _macro_calories,
+    aggregate_meal_nutrition,
+    calculate_calories_from_macros,
+    calculate_macro_percentages,
+    calculate_weekly_average,
+    convert_to_grams,
+    parse_quantity_unit,
+)
+
+RICE = {
+    "calories": 130, "protein_g": 2.7, "carbs_g": 28, "fat_g": 0.3,
+    "fiber_g": 0.4, "sugar_g": 0.1, "sodium_mg": 1, "serving_size_g": 150,
+}
+CHICKEN = {
+    "calories": 165.5, "protein_g": 31.05, "carbs_g": 0, "fat_g": 3.6,
+    "sodium_mg": 74,
+}
+OIL = {"calories": "884", "protein_g": "0", "carbs_g": "0", "fat_g": "100"}
+SALMON = {
+    "calories": Decimal("208"), "protein_g": Decimal("20.42"), "carbs_g": Decimal("0"),
+    "fat_g": Decimal("13.42"), "sodium_mg": Decimal("59.5"),
+}
+
+MEALS = [
+    [],
+    [RICE],
+    [RICE, CHICKEN, OIL],
+    [SALMON, {"name": "Water"}, CHICKEN],
+    [{"calories": 0.1, "protein_g": 0.2}] * 3,
+]
+
+
+# =====================================================
+# MEAL AGGREGATION
+# =====================================================
+
+def _summed_per_item(meal_items):
+    """Per-item running totals, as aggregate_meal_nutrition used to do."""
+    totals = {field: 0.0 for field in NUTRITION_FIELDS}
+    for item in meal_items:
+        for field in NUTRITION_FIELDS:
+            totals[field] += float(item.get(field, 0))
+    return {field: round(value, 2) for field, value in totals.items()}
+
+
+@pytest.mark.parametrize("meal_items", MEALS)
+def test_aggregate_matches_per_item_sums(meal_items):
+    totals = aggregate_meal_nutrition(meal_items)
+
+    assert totals == _summed_per_item(meal_items)
+    assert list(totals) == list(NUTRITION_FIELDS)
+    assert all(type(value) is float for value in totals.values())
+
+
+def test_aggregate_matches_hand_summed_meal():
+    assert aggregate_meal_nutrition([RICE, CHICKEN, OIL]) == {
+        "calories": 1179.5,   # 130 + 165.5 + 884
+        "protein_g": 33.75,   # 2.7 + 31.05
+        "carbs_g": 28.0,
+        "fat_g": 103.9,       # 0.3 + 3.6 + 100
+        "fiber_g": 0.4,
+        "sugar_g": 0.1,
+        "sodium_mg": 75.0,    # 1 + 74
+    }
+
+
+def test_aggregate_of_empty_meal_is_all_zeros():
+    assert aggregate_meal_nutrition([]) == {field: 0.0 for field in NUTRITION_FIELDS}
+
+
+# =====================================================
+# MACRO CALORIES
+# =====================================================
+
+@pytest.mark.parametrize("protein, carbs, fat", [
+    (0, 0, 0),
+    (25, 40, 10),
+    (2.7, 28, 0.3),
+    (31.05, 0, 3.6),
+    (0.1, 0.2, 0.3),
+    (Decimal("20.42"), Decimal("0"), Decimal("13.42")),
+])
+def test_macro_calories_match_atwater_factors(protein, carbs, fat):
+    expected = (float(protein) * 4, float(carbs) * 4, float(fat) * 9)
+
+    assert _macro_calories(protein, carbs, fat) == expected
+    assert calculate_calories_from_macros(protein, carbs, fat) == round(sum(expected), 2)
+
+    total = round(sum(expected), 2)
+    percentages = calculate_macro_percentages(protein, carbs, fat)
+    if total == 0:
+        assert percentages == {"protein_pct": 0.0, "carbs_pct": 0.0, "fat_pct": 0.0}
+    else:
+        assert percentages == {
+            "protein_pct": round(expected[0] / total * 100, 1),
+            "carbs_pct": round(expected[1] / total * 100, 1),
+            "fat_pct": round(expected[2] / total * 100, 1),
+        }
+
+
+def test_macro_calories_reject_negative_values():
+    with pytest.raises(ValueError, match="cannot be negative"):
+        _macro_calories(10, -0.1, 5)
+    with pytest.raises(ValueError, match="cannot be negative"):
+        calculate_macro_percentages(Decimal("-1"), 0, 0)
+
+
+# =====================================================
+# WEEKLY AVERAGE
+# =====================================================
+
+def _day(calories, protein, carbs, fat):
+    return {"totals": {"calories": calories, "protein_g": protein, "carbs_g": carbs, "fat_g": fat}}
+
+
+@pytest.mark.parametrize("days", [
+    [],
+    [_day(2000, 150, 200, 65)],
+    [_day(1800.5, 120.25, 210, 60.1), _day(2200, 160, 180.75, 70), _day(1950, 140.5, 205, 66.6)],
+    # Days without totals count towards the average but add nothing
+    [_day(2100, 150, 200, 65), {"date": "2026-01-06"}, _day(1500, 100, 150, 50), {}],
+    [{}, {}],
+])
+def test_weekly_average_matches_per_field_sums(days):
+    with_totals = [day["totals"] for day in days if "totals" in day]
+    num_days = len(days) or 1
+
+    assert calculate_weekly_average(days) == {
+        "avg_calories": round(sum(t["calories"] for t in with_totals) / num_days, 2),
+        "avg_protein_g": round(sum(t["protein_g"] for t in with_totals) / num_days, 2),
+        "avg_carbs_g": round(sum(t["carbs_g"] for t in with_totals) / num_days, 2),
+        "avg_fat_g": round(sum(t["fat_g"] for t in with_totals) / num_days, 2),
+    }
+
+
+def test_weekly_average_over_days_without_totals():
+    days = [_day(2100, 150, 200, 65), {"date": "2026-01-06"}, _day(1500, 100, 150, 50)]
+
+    assert calculate_weekly_average(days) == {
+        "avg_calories": 1200.0,
+        "avg_protein_g": 83.33,
+        "avg_carbs_g": 116.67,
+        "avg_fat_g": 38.33,
+    }
+
+
+# =====================================================
+# FREE-TEXT UNITS
+# =====================================================
+
+@pytest.mark.parametrize("text, expected", [
+    ("2 cucharadas de aceite", (2.0, "cucharadas")),
+    ("150g de pollo", (150.0, "g")),
+    ("150 g de pollo", (150.0, "g")),
+    ("1,5 tazas", (1.5, "tazas")),
+    ("1.5 KG", (1.5, "kg")),
+    # Longest alias wins
+    ("5 lbs", (5.0, "lbs")),
+    ("2 cups", (2.0, "cups")),
+    # Aliases inside longer words don't count
+    ("3 tablespoons", (3.0, None)),
+    ("1 huevo grande", (1.0, None)),
+    ("2 Porción", (2.0, "porción")),
+    ("una taza de café", (None, "taza")),
+    ("", (None, None)),
+])
+def test_parse_quantity_unit(text, expected):
+    assert parse_quantity_unit(text) == expected
+
+
+@pytest.mark.parametrize("quantity, unit, serving_size_g, grams", [
+    (2, "cucharadas de aceite", 100, 30),
+    (2, "tazas de arroz", 80, 160),
+    (1, "bolsa de 5 lbs", 100, 453.592),
+    (3, "Porción grande", 120, 360),
+    # Known aliases skip the text scan
+    (2, "TBSP", 100, 30),
+    (2, "pieces", 50, 100),
+])
+def test_convert_to_grams_falls_back_to_units_in_free_text(quantity, unit, serving_size_g, grams):
+    assert convert_to_grams(quantity, unit, serving_size_g) == pytest.approx(grams)
+
+
+def test_convert_to_grams_assumes_grams_without_a_known_unit(caplog):
+    with caplog.at_level(logging.WARNING, logger="app.services.macro_service"):
+        assert convert_to_grams(3, "tablespoons") == 3
+
+    assert "Unknown unit 'tablespoons'" in caplog.text
+
+
+# =====================================================
+# BATCH SCALING
+# =====================================================
+
+@pytest.mark.parametrize("quantities_g", [
+    [150, 200, 10, 125],
+    [0, 0.5, 33.333, 1000],
+    [Decimal("150"), Decimal("12.5"), Decimal("0.1"), Decimal("99.99")],
+])
+def test_batch_matches_per_food_scaling(quantities_g):
+    foods = [RICE, CHICKEN, OIL, SALMON]
+
+    batch = MacroCalculationService.calculate_food_nutrition_for_quantity_batch(
+        foods, quantities_g
+    )
+
+    assert batch == [
+        MacroCalculationService.calculate_food_nutrition_for_quantity(food, quantity, "g")
+        for food, quantity in zip(foods, quantities_g)
+    ]
+
+
+def test_batch_of_no_foods_is_empty():
+    assert MacroCalculationService.calculate_food_nutrition_for_quantity_batch([], []) == []
+
+
+def test_batch_rejects_mismatched_lengths():
+    with pytest.raises(ValueError, match="same length"):
+        MacroCalculationService.calculate_food_nutrition_for_quantity_batch([RICE, OIL], [100])
@@ -0,0 +1,210 @@
+"""
+Tests for MealEntryService caching, RPC fallback and bulk creation.
+"""
+
+from datetime import date, time
+
+import pytest
+
+from app.services import meal_entry_service
+from app.services.daily_summary_service import DailySummaryService
+from app.services.meal_entry_service import MealEntryService
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+TODAY = date(2026, 1, 11)
+MEAL_DATE = date(2026, 1, 10)
+
+
+def _rice(**overrides):
+    food = {
+        "id": "food-rice",
+        "name": "Rice",
+        "category": "grains",
+        "calories": 130,
+        "protein_g": 2.7,
+        "carbs_g": 28,
+        "fat_g": 0.3,
+        "serving_size_g": 100,
+        "verified": True,
+    }
+    food.update(overrides)
+    return food
+
+
+async def _log_manual_entry(service: MealEntryService, meal_date: date = MEAL_DATE):
+    return await service.create_meal_entry_manual(
+        user_id=USER_ID,
+        food_name="Eggs",
+        quantity_g=100,
+        calories=155,
+        protein_g=13,
+        carbs_g=1.1,
+        fat_g=11,
+        meal_date=meal_date,
+        meal_time=time(8, 0),
+        today=TODAY
+    )
+
+
+# =====================================================
+# CACHE INVALIDATION
+# =====================================================
+
+@pytest.mark.asyncio
+async def test_entry_count_cache_is_invalidated_by_meal_write(fake_db):
+    service = MealEntryService(fake_db)
+    await _log_manual_entry(service)
+
+    _, total = await service.list_meal_entries(USER_ID, page=1, page_size=1)
+    assert total == 1
+
+    # Later pages reuse the cached total
+    await service.list_meal_entries(USER_ID, page=2, page_size=1)
+    assert fake_db.count("meal_entries") == 2
+    assert len(meal_entry_service._entry_count_cache) == 1
+
+    await _log_manual_entry(service)
+    assert meal_entry_service._entry_count_cache == {}
+
+    _, total = await service.list_meal_entries(USER_ID, page=2, page_size=1)
+    assert total == 2
+
+
+@pytest.mark.asyncio
+async def test_daily_summary_cache_is_invalidated_by_meal_write(fake_db):
+    summaries = DailySummaryService(fake_db)
+    service = MealEntryService(fake_db)
+
+    await summaries.get_daily_summary(USER_ID, MEAL_DATE)
+    await summaries.get_daily_summary(USER_ID, MEAL_DATE)
+    assert fake_db.count("daily_meal_totals") == 1
+
+    # A write on another day keeps this day's summary
+    await _log_manual_entry(service, meal_date=date(2026, 1, 9))
+    await summaries.get_daily_summary(USER_ID, MEAL_DATE)
+    assert fake_db.count("daily_meal_totals") == 1
+
+    await _log_manual_entry(service)
+    await summaries.get_daily_summary(USER_ID, MEAL_DATE)
+    assert fake_db.count("daily_meal_totals") == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_daily_summary_is_a_copy(fake_db):
+    summaries = DailySummaryService(fake_db)
+
+    first = await summaries.get_daily_summary(USER_ID, MEAL_DATE)
+    first.has_goals = True
+    second = await summaries.get_daily_summary(USER_ID, MEAL_DATE)
+
+    assert second.has_goals is False
+    assert second is not first
+
+
+# =====================================================
+# DAILY MEALS RPC FALLBACK
+# =====================================================
+
+@pytest.mark.asyncio
+async def test_daily_meals_falls_back_when_rpc_is_missing(fake_db):
+    service = MealEntryService(fake_db)
+    await _log_manual_entry(service)
+
+    result = await service.get_daily_meals(USER_ID, MEAL_DATE)
+
+    assert [e["food_name"] for e in result["breakfast"]] == ["Eggs"]
+    assert result["summary"]["total_entries"] == 1
+    assert result["summary"]["total_calories"] == 155
+    assert meal_entry_service._daily_meals_rpc_available is False
+
+    # Once the RPC is known to be missing it isn't tried again
+    await service.get_daily_meals(USER_ID, MEAL_DATE)
+    assert fake_db.count("get_daily_meals", "rpc") == 1
+
+
+@pytest.mark.asyncio
+async def test_daily_meals_rpc_matches_fallback(fake_db):
+    service = MealEntryService(fake_db)
+    await _log_manual_entry(service)
+    fallback = await service.get_daily_meals(USER_ID, MEAL_DATE)
+
+    meal_entry_service._daily_meals_rpc_available = True
+    fake_db.rpcs["get_daily_meals"] = lambda params: {
+        "breakfast": fallback["breakfast"],
+        "lunch": [],
+        "dinner": [],
+        "snacks": [],
+        "summary": {
+            "total_entries": 1,
+            "total_calories": 155,
+            "total_protein_g": 13,
+            "total_carbs_g": 1.1,
+            "total_fat_g": 11,
+        },
+    }
+
+    assert await service.get_daily_meals(USER_ID, MEAL_DATE) == fallback
+    assert meal_entry_service._daily_meals_rpc_available is True
+
+
+# =====================================================
+# BULK CREATION
+# =====================================================
+
+@pytest.mark.asyncio
+async def test_bulk_create_inserts_all_entries_at_once(fake_db):
+    fake_db.tables["foods"] = [_rice()]
+    fake_db.tables["user_foods"] = [_rice(id="user-food", name="Mine", user_id=USER_ID)]
+    service = MealEntryService(fake_db)
+
+    entries = await service.create_meal_entries_bulk(
+        USER_ID,
+        [
+            {"food_id": "food-rice", "quantity_g": 150},
+            {"user_food_id": "user-food", "quantity_g": 50, "logged_via": "chat"},
+        ],
+        meal_date=MEAL_DATE,
+        meal_time=time(13, 0),
+        today=TODAY
+    )
+
+    assert [e["food_name"] for e in entries] == ["Rice", "Mine"]
+    assert [e["calories"] for e in entries] == [195, 65]
+    assert {e["meal_type"] for e in entries} == {"lunch"}
+    assert fake_db.count("meal_entries", "insert") == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_matches_single_create(fake_db):
+    fake_db.tables["foods"] = [_rice()]
+    service = MealEntryService(fake_db)
+
+    single = await service.create_meal_entry_from_food(
+        USER_ID, food_id="food-rice", quantity_g=150,
+        meal_date=MEAL_DATE, meal_time=time(13, 0), today=TODAY
+    )
+    [bulk] = await service.create_meal_entries_bulk(
+        USER_ID, [{"food_id": "food-rice", "quantity_g": 150}],
+        meal_date=MEAL_DATE, meal_time=time(13, 0), today=TODAY
+    )
+
+    single.pop("id")
+    bulk.pop("id")
+    assert bulk == single
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_inserts_nothing_when_a_food_is_missing(fake_db):
+    fake_db.tables["foods"] = [_rice()]
+    fake_db.tables["user_foods"] = [_rice(id="user-food", user_id="someone-else")]
+    service = MealEntryService(fake_db)
+
+    with pytest.raises(ValueError, match="User food not found: user-food"):
+        await service.create_meal_entries_bulk(
+            USER_ID,
+            [{"food_id": "food-rice"}, {"user_food_id": "user-food"}],
+            meal_date=MEAL_DATE,
+            today=TODAY
+        )
+
+    assert fake_db.count("meal_entries", "insert") == 0
@@ -0,0 +1,132 @@
+"""
+Tests for the NutritionValidator fast paths: the validation cache and the
+clean-food pre-pass must give the same results as full validation.
+"""
+
+import pytest
+
+from app.validators.nutrition_validator import (
+    NutritionValidator,
+    _validate_food_cached,
+)
+
+FOODS = [
+    # Clean
+    {"name": "Rice", "quantity": 150, "unit": "g", "calories": 195.0,
+     "protein_g": 4.05, "carbs_g": 42.0, "fat_g": 0.45},
+    {"name": " Egg ", "quantity": 2, "unit": "piece", "calories": 156,
+     "protein_g": 12, "carbs_g": 1, "fat_g": 11},
+    # Corrected or warned
+    {"name": "Cake", "quantity": 100, "calories": -10,
+     "protein_g": 5, "carbs_g": 50, "fat_g": 20},
+    {"name": "Oil", "quantity": 50, "unit": "ml", "calories": 100,
+     "protein_g": -1, "carbs_g": 0, "fat_g": 50},
+    {"name": "Pizza", "quantity": 2500, "unit": "grams", "calories": 6000,
+     "protein_g": 250, "carbs_g": 700, "fat_g": 240},
+    {"name": "Water", "quantity": 12000, "unit": "ML", "calories": 0,
+     "protein_g": 0, "carbs_g": 0, "fat_g": 0},
+    {"name": "Soup", "quantity": "300", "calories": "120",
+     "protein_g": "8", "carbs_g": "15", "fat_g": "3"},
+    # Invalid
+    {"name": "", "quantity": 100, "calories": 100,
+     "protein_g": 5, "carbs_g": 10, "fat_g": 2},
+    {"name": "Nothing", "quantity": 0, "calories": 100,
+     "protein_g": 5, "carbs_g": 10, "fat_g": 2},
+    {"name": "Bad", "quantity": "abc", "calories": 100,
+     "protein_g": 5, "carbs_g": 10, "fat_g": 2},
+    {"name": "Partial", "quantity": 100, "calories": 100},
+]
+
+
+def _issues(issues):
+    return [
+        (i.field, i.message, i.severity, repr(i.original_value), repr(i.corrected_value))
+        for i in issues
+    ]
+
+
+@pytest.mark.parametrize("auto_correct", [True, False])
+@pytest.mark.parametrize("food", FOODS)
+def test_cached_validation_matches_uncached(food, auto_correct):
+    validator = NutritionValidator()
+    expected_valid, expected_food, expected_errors, expected_warnings = (
+        NutritionValidator._validate_food_uncached(dict(food), auto_correct)
+    )
+
+    # First call fills the cache, the second one is served from it
+    for _ in range(2):
+        is_valid, validated = validator.validate_food_item(dict(food), auto_correct)
+
+        assert is_valid == expected_valid
+        if is_valid:
+            assert repr(validated) == repr(expected_food)
+        assert _issues(validator.errors) == _issues(expected_errors or [])
+        assert _issues(validator.warnings) == _issues(expected_warnings or [])
+
+
+def test_cache_hit_is_reused_and_isolated():
+    validator = NutritionValidator()
+    food = FOODS[4]
+
+    _, first = validator.validate_food_item(dict(food))
+    first["calories"] = -1
+    validator.warnings.clear()
+
+    _, second = validator.validate_food_item(dict(food))
+
+    assert _validate_food_cached.cache_info().hits == 1
+    assert second["calories"] != -1
+    assert validator.warnings
+
+
+def test_equal_values_of_different_types_are_cached_separately():
+    validator = NutritionValidator()
+    base = {"name": "Egg", "calories": 0, "protein_g": 0, "carbs_g": 0, "fat_g": 0}
+
+    _, from_int = validator.validate_food_item(dict(base, quantity=1))
+    _, from_bool = validator.validate_food_item(dict(base, quantity=True))
+
+    assert repr(from_int["quantity"]) == repr(from_bool["quantity"]) == "1.0"
+    assert _validate_food_cached.cache_info().misses == 2
+
+
+def test_extra_fields_pass_through_in_order():
+    validator = NutritionValidator()
+    food = {"image_url": "x.png", **FOODS[0], "source": "ai"}
+
+    for _ in range(2):
+        _, validated = validator.validate_food_item(dict(food))
+        assert list(validated) == list(food)
+        assert validated["image_url"] == "x.png"
+        assert validated["source"] == "ai"
+
+
+@pytest.mark.parametrize("auto_correct", [True, False])
+def test_meal_prepass_matches_per_food_validation(auto_correct):
+    foods = [dict(food) for food in FOODS]
+    expected_foods = []
+    expected_total = 0.0
+    for food in foods:
+        is_valid, validated, _, _ = NutritionValidator._validate_food_uncached(
+            dict(food), auto_correct
+        )
+        if is_valid:
+            expected_foods.append(validated)
+            expected_total += validated["calories"]
+
+    result = NutritionValidator().validate_meal_data({"foods": foods}, auto_correct)
+
+    assert repr(result.corrected_data["foods"]) == repr(expected_foods)
+    assert result.corrected_data["total_calories"] == round(expected_total, 2)
+    assert result.is_valid is False
+    assert foods == FOODS  # Input foods are not modified
+
+
+def test_clean_meal_reports_nothing():
+    validator = NutritionValidator()
+
+    result = validator.validate_meal_data({"foods": [dict(f) for f in FOODS[:2]]})
+
+    assert result.is_valid
+    assert result.errors == [] and result.warnings == []
+    assert validator.get_validation_summary()["warning_count"] == 0